@@ -0,0 +1,64 @@
+"""Benchmark of make_letters on buffers against decoded strings.
+
+Run the benchmark with:
+python benchmarks/bytes_benchmark.py
+"""
+
+import argparse
+import random
+import timeit
+
+from nombres_vers_lettres import make_letters
+
+
+def main():
+    """Time the conversion of digits read from a buffer."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--count", type=int, default=5_000, help="The numbers per measure"
+    )
+    parser.add_argument(
+        "--digits", type=int, default=30, help="The digits of the numbers"
+    )
+    args = parser.parse_args()
+
+    generator = random.Random(0)
+    # The numbers of a file, one per line, read as a single buffer
+    lines = [
+        f"{generator.randrange(10 ** args.digits)},"
+        f"{generator.randrange(1000):03d}"
+        for _ in range(args.count)
+    ]
+    data = memoryview("\n".join(lines).encode())
+    fields = []
+    position = 0
+
+    for line in lines:
+        fields.append(data[position:position + len(line)])
+        position += len(line) + 1
+
+    def run_decode():
+        for field in fields:
+            make_letters(field.tobytes().decode())
+
+    def run_buffers():
+        for field in fields:
+            make_letters(field)
+
+    timings = {
+        name: min(timeit.repeat(function, number=1, repeat=3))
+        for name, function in (
+            ("decode", run_decode),
+            ("buffers", run_buffers),
+        )
+    }
+
+    for name, timing in timings.items():
+        print(
+            f"{name:>12}: {timing / args.count * 1e6:6.2f} µs per number "
+            f"(x{timings['decode'] / timing:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark of the specialized converters against make_letters.
+
+Run the benchmark with:
+python benchmarks/compiled_benchmark.py
+"""
+
+import argparse
+import random
+import timeit
+
+from nombres_vers_lettres import make_letters
+from nombres_vers_lettres.compiler import compile_converter
+
+CONFIGURATIONS = [
+    {"mode": "cardinal", "language": "fr_BE"},
+    {"mode": "cardinal", "language": "fr_FR", "gender": "feminine"},
+    {"mode": "ordinal_adjectival", "language": "fr_CH"},
+    {"mode": "ordinal_nominal", "language": "fr_FR", "plural": True},
+]
+
+
+def main():
+    """Time make_letters and the compiled converters."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--count", type=int, default=20_000, help="The numbers per measure"
+    )
+    parser.add_argument(
+        "--digits", type=int, nargs="+", default=[3, 6, 12], help="The sizes"
+    )
+    args = parser.parse_args()
+
+    generator = random.Random(0)
+
+    for options in CONFIGURATIONS:
+        converter = compile_converter(**options)
+
+        for digits in args.digits:
+            numbers = [
+                generator.randrange(10**digits) for _ in range(args.count)
+            ]
+
+            def run_generic(numbers=numbers, options=options):
+                for number in numbers:
+                    make_letters(number, **options)
+
+            def run_compiled(numbers=numbers, converter=converter):
+                for number in numbers:
+                    converter(number)
+
+            generic = min(timeit.repeat(run_generic, number=1, repeat=3))
+            compiled = min(timeit.repeat(run_compiled, number=1, repeat=3))
+            print(
+                f"{options} {digits:>2} digits: "
+                f"generic {generic / args.count * 1e6:7.2f} µs, "
+                f"compiled {compiled / args.count * 1e6:7.2f} µs "
+                f"(x{generic / compiled:.1f})"
+            )
+
+
+if __name__ == "__main__":
+    main()
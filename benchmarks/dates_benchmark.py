@@ -0,0 +1,71 @@
+"""Benchmark of make_date_letters against several make_letters calls.
+
+Run the benchmark with:
+python benchmarks/dates_benchmark.py
+"""
+
+import argparse
+import datetime
+import random
+import timeit
+
+from nombres_vers_lettres import make_letters
+from nombres_vers_lettres.constants import MONTHS_FR
+from nombres_vers_lettres.dates import make_date_letters, make_time_letters
+
+
+def main():
+    """Time the dates and the times written with make_letters and tables."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--count", type=int, default=20_000, help="The dates per measure"
+    )
+    args = parser.parse_args()
+
+    generator = random.Random(0)
+    dates = [
+        datetime.datetime(
+            generator.randint(1950, 2050),
+            generator.randint(1, 12),
+            generator.randint(1, 28),
+            generator.randint(0, 23),
+            generator.randint(0, 59),
+        )
+        for _ in range(args.count)
+    ]
+
+    def run_make_letters():
+        for date in dates:
+            day = "premier" if date.day == 1 else make_letters(date.day)
+            f"le {day} {MONTHS_FR[date.month - 1]} {make_letters(date.year)}"
+            hours = make_letters(date.hour, gender="feminine")
+            minutes = make_letters(date.minute, gender="feminine")
+            f"{hours} heures {minutes}"
+
+    def run_tables():
+        for date in dates:
+            make_date_letters(date)
+            make_time_letters(date)
+
+    def run_arrays():
+        make_date_letters(dates)
+        make_time_letters(dates)
+
+    timings = {
+        name: min(timeit.repeat(function, number=1, repeat=3))
+        for name, function in (
+            ("make_letters", run_make_letters),
+            ("tables", run_tables),
+            ("arrays", run_arrays),
+        )
+    }
+
+    for name, timing in timings.items():
+        print(
+            f"{name:>12}: {timing / args.count * 1e6:6.2f} µs per date "
+            f"and time (x{timings['make_letters'] / timing:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark of iter_letters against one make_letters call per number.
+
+Run the benchmark with:
+python benchmarks/export_benchmark.py
+"""
+
+import argparse
+import timeit
+
+from nombres_vers_lettres import make_letters
+from nombres_vers_lettres.export import iter_letters
+
+MODES = ("cardinal", "ordinal_nominal")
+
+
+def main():
+    """Time make_letters and iter_letters on the same ranges."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--count", type=int, default=100_000, help="The numbers per measure"
+    )
+    parser.add_argument(
+        "--starts",
+        type=int,
+        nargs="+",
+        default=[0, 10_000_000, 10**15],
+        help="The first numbers of the ranges",
+    )
+    args = parser.parse_args()
+
+    for start in args.starts:
+        stop = start + args.count
+
+        for mode in MODES:
+
+            def run_generic(start=start, stop=stop, mode=mode):
+                for number in range(start, stop):
+                    make_letters(str(number), mode=mode)
+
+            def run_export(start=start, stop=stop, mode=mode):
+                for _ in iter_letters(start, stop, mode=mode):
+                    pass
+
+            generic = min(timeit.repeat(run_generic, number=1, repeat=3))
+            export = min(timeit.repeat(run_export, number=1, repeat=3))
+            print(
+                f"{mode:>15}, from {start:>16}: "
+                f"make_letters {generic / args.count * 1e6:6.2f} µs, "
+                f"iter_letters {export / args.count * 1e6:6.2f} µs "
+                f"(x{generic / export:.1f})"
+            )
+
+
+if __name__ == "__main__":
+    main()
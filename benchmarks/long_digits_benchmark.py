@@ -0,0 +1,59 @@
+"""Stress benchmark of make_letters with very long digit strings.
+
+The time per call should grow linearly with the number of digits (the
+ratio between two consecutive sizes should stay close to 2).
+
+Run the benchmark with:
+python benchmarks/long_digits_benchmark.py
+"""
+
+import argparse
+import timeit
+
+from nombres_vers_lettres import make_letters
+
+INPUTS = {
+    # High-precision decimal (only the first group is not empty)
+    "decimal": lambda digits: "0," + "1".ljust(digits, "0"),
+    # Integer padded with zeros
+    "leading_zeros": lambda digits: "12345".rjust(digits, "0"),
+    # Integer part and decimal part
+    "mixed": lambda digits: "42," + "05".ljust(digits, "0"),
+}
+
+
+def main():
+    """Time make_letters on inputs of growing size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[10_000, 20_000, 40_000, 80_000, 160_000],
+        help="The numbers of digits",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=20, help="The calls per measure"
+    )
+    args = parser.parse_args()
+
+    for name, make_input in INPUTS.items():
+        previous = None
+        for size in args.sizes:
+            number = make_input(size)
+            seconds = min(
+                timeit.repeat(
+                    lambda: make_letters(number), number=args.repeat, repeat=3
+                )
+            )
+            per_call = seconds / args.repeat
+            ratio = f"x{per_call / previous:.2f}" if previous else ""
+            print(
+                f"{name:>14} {size:>8} digits "
+                f"{per_call * 1e3:9.3f} ms {ratio}"
+            )
+            previous = per_call
+
+
+if __name__ == "__main__":
+    main()
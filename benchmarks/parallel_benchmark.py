@@ -0,0 +1,71 @@
+"""Benchmark of the backends of make_letters_parallel.
+
+Run the benchmark with:
+python benchmarks/parallel_benchmark.py
+"""
+
+import argparse
+import random
+import time
+
+from nombres_vers_lettres import (
+    create_executor,
+    make_letters_batch,
+    make_letters_parallel,
+)
+from nombres_vers_lettres.batch import PARALLEL_BACKENDS
+
+
+def main():
+    """Time make_letters_batch and each backend of make_letters_parallel."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--count", type=int, default=200_000, help="The numbers to convert"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="The number of workers"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=4096, help="The numbers per task"
+    )
+    args = parser.parse_args()
+
+    generator = random.Random(0)
+    numbers = [generator.randrange(10**12) for _ in range(args.count)]
+
+    start = time.perf_counter()
+    expected = make_letters_batch(numbers)
+    print(f"{'serial':>11}: {time.perf_counter() - start:6.2f} s")
+
+    for backend in PARALLEL_BACKENDS:
+        # The start of the workers is measured apart
+        start = time.perf_counter()
+
+        try:
+            executor = create_executor(backend, args.workers)
+
+        except ValueError as exception:
+            print(f"{backend:>11}: skipped ({exception})")
+            continue
+
+        with executor:
+            make_letters_parallel([0], backend=backend, executor=executor)
+            started = time.perf_counter()
+
+            results = make_letters_parallel(
+                numbers,
+                backend=backend,
+                chunk_size=args.chunk_size,
+                executor=executor,
+            )
+            end = time.perf_counter()
+
+        assert results == expected
+        print(
+            f"{backend:>11}: {end - started:6.2f} s "
+            f"(+ {started - start:.2f} s to start the workers)"
+        )
+
+
+if __name__ == "__main__":
+    main()
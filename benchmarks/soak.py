@@ -0,0 +1,122 @@
+"""Memory soak test of make_letters.
+
+Converts tens of millions of numbers (with or without a cache of the
+letters) and reports the resident memory (RSS) along the way. Exits with
+an error if the RSS grows more than allowed after the warm-up.
+
+Run the soak test with:
+python benchmarks/soak.py --conversions 20000000 [--cache]
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import time
+
+from nombres_vers_lettres import make_letters
+from nombres_vers_lettres.cache import ResultCache, enable_cache
+from nombres_vers_lettres.profiling import PROFILED_MODES, sample_numbers
+
+
+def resident_memory() -> int:
+    """Get the resident memory of the process in bytes (0 if unknown)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+    except (OSError, ValueError):
+        pass
+
+    try:
+        import resource
+
+        # Maximal RSS, in kilobytes on Linux and in bytes on macOS
+        maximum = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return maximum if sys.platform == "darwin" else maximum * 1024
+
+    except ImportError:
+        return 0
+
+
+def main():
+    """Run the soak test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--conversions",
+        type=int,
+        default=20_000_000,
+        help="The number of conversions",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Use a cache of the letters",
+    )
+    parser.add_argument(
+        "--cache-size", type=int, default=65_536, help="The cache size"
+    )
+    parser.add_argument(
+        "--distinct",
+        type=int,
+        default=100_000,
+        help="The number of distinct numbers",
+    )
+    parser.add_argument(
+        "--report", type=int, default=1_000_000, help="Conversions per report"
+    )
+    parser.add_argument(
+        "--max-growth",
+        type=float,
+        default=8.0,
+        help="The allowed RSS growth after the warm-up, in MiB",
+    )
+    args = parser.parse_args()
+
+    if args.cache:
+        enable_cache(ResultCache(maxsize=args.cache_size))
+
+    numbers = sample_numbers(args.distinct)
+    work = itertools.cycle(
+        [(number, mode) for number in numbers for mode in PROFILED_MODES]
+    )
+
+    baseline = None
+    start = time.perf_counter()
+
+    for index in range(1, args.conversions + 1):
+        number, mode = next(work)
+
+        try:
+            make_letters(number, mode=mode)
+
+        except ValueError:
+            pass
+
+        if index % args.report == 0:
+            rss = resident_memory()
+
+            # The first report is after the warm-up (caches filled)
+            if baseline is None:
+                baseline = rss
+
+            print(
+                f"{index:>12} conversions, "
+                f"{time.perf_counter() - start:8.1f} s, "
+                f"RSS {rss / 2**20:8.1f} MiB "
+                f"({(rss - baseline) / 2**20:+.1f} MiB)",
+                flush=True,
+            )
+
+    if baseline is not None:
+        growth = (resident_memory() - baseline) / 2**20
+
+        if growth > args.max_growth:
+            sys.exit(
+                f"RSS grew by {growth:.1f} MiB after the warm-up "
+                f"(allowed {args.max_growth} MiB)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark of a compiled template against str.format and make_letters.
+
+Run the benchmark with:
+python benchmarks/template_benchmark.py
+"""
+
+import argparse
+import random
+import timeit
+
+from nombres_vers_lettres import make_letters
+from nombres_vers_lettres.template import compile_template
+
+TEMPLATE = (
+    "Payez la somme de {amount:EUR} pour la {rank:ordinal_nominal:f} fois"
+)
+
+
+def main():
+    """Time the rendering of the same records."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--count", type=int, default=20_000, help="The records per measure"
+    )
+    args = parser.parse_args()
+
+    generator = random.Random(0)
+    records = [
+        {
+            "amount": f"{generator.randrange(10**8) / 100:.2f}",
+            "rank": generator.randrange(1, 20),
+        }
+        for _ in range(args.count)
+    ]
+    template = compile_template(TEMPLATE)
+
+    def run_format():
+        for record in records:
+            "Payez la somme de {} pour la {} fois".format(
+                make_letters(record["amount"], mode="EUR"),
+                make_letters(
+                    record["rank"], mode="ordinal_nominal", gender="feminine"
+                ),
+            )
+
+    def run_render():
+        for record in records:
+            template.render(record)
+
+    def run_render_many():
+        template.render_many(records)
+
+    timings = {
+        name: min(timeit.repeat(function, number=1, repeat=3))
+        for name, function in (
+            ("str.format", run_format),
+            ("render", run_render),
+            ("render_many", run_render_many),
+        )
+    }
+
+    for name, timing in timings.items():
+        print(
+            f"{name:>11}: {timing / args.count * 1e6:6.2f} µs per record "
+            f"(x{timings['str.format'] / timing:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
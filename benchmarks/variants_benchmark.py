@@ -0,0 +1,61 @@
+"""Benchmark of render_variants against one make_letters call per variant.
+
+Run the benchmark with:
+python benchmarks/variants_benchmark.py
+"""
+
+import argparse
+import random
+import timeit
+
+from nombres_vers_lettres import make_letters
+from nombres_vers_lettres.parsed import render_variants, variant_options
+
+# The variants of a bilingual contract (amount and rank of each clause)
+VARIANTS = variant_options(
+    modes=("cardinal", "ordinal_nominal", "EUR"),
+    genders=("masculin", "féminin"),
+    languages=("fr_BE", "fr_FR"),
+    post_1990_orthographes=(False, True),
+)
+
+
+def main():
+    """Time make_letters and render_variants on the same variants."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--count", type=int, default=5_000, help="The numbers per measure"
+    )
+    parser.add_argument(
+        "--digits", type=int, nargs="+", default=[3, 6, 12], help="The sizes"
+    )
+    args = parser.parse_args()
+
+    generator = random.Random(0)
+
+    for digits in args.digits:
+        numbers = [
+            str(generator.randrange(10**digits)) for _ in range(args.count)
+        ]
+
+        def run_generic(numbers=numbers):
+            for number in numbers:
+                for options in VARIANTS:
+                    make_letters(number, **options)
+
+        def run_variants(numbers=numbers):
+            for number in numbers:
+                render_variants(number, VARIANTS)
+
+        generic = min(timeit.repeat(run_generic, number=1, repeat=3))
+        variants = min(timeit.repeat(run_variants, number=1, repeat=3))
+        print(
+            f"{len(VARIANTS)} variants, {digits:>2} digits: "
+            f"make_letters {generic / args.count * 1e6:7.2f} µs, "
+            f"render_variants {variants / args.count * 1e6:7.2f} µs "
+            f"(x{generic / variants:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,9 @@
 """Package entry point."""
 
 from nombres_vers_lettres.make_letters import *  # noqa: F401, F403
+from nombres_vers_lettres.batch import (  # noqa: F401
+    LettersResult,
+    create_executor,
+    make_letters_batch,
+    make_letters_parallel,
+)
@@ -3,6 +3,7 @@
 import argparse
 import os
 import sys
+from typing import Any
 
 from nombres_vers_lettres.constants import (
     AVAILABLE_LANGUAGES,
@@ -12,10 +13,391 @@ from nombres_vers_lettres.constants import (
 from nombres_vers_lettres.make_letters import make_letters
 
 
-def main():
-    """Main entry point for the application when run with the -m switch."""
+def convert_command(argv: list[str]):
+    """Convert columns of a CSV or a JSON Lines file (convert command)."""
+    # Only needed by this command
+    from nombres_vers_lettres.convert import convert_file, parse_column_spec
+
+    parser = argparse.ArgumentParser(
+        f"{os.path.basename(sys.argv[0])} convert",
+        description=(
+            "Add columns with the numbers of other columns in letters "
+            "to a CSV or a JSON Lines file"
+        ),
+    )
+    parser.add_argument("input", type=str, help="The input file")
+    parser.add_argument("output", type=str, help="The output file")
+    parser.add_argument(
+        "--column",
+        "-C",
+        action="append",
+        required=True,
+        help=(
+            "The column to convert, as column[:mode[:language]] "
+            "(e.g., 'amount:EUR', 'rank:ordinal_nominal:fr_FR'), "
+            "can be repeated"
+        ),
+    )
+    parser.add_argument(
+        "--format",
+        choices=("csv", "jsonl"),
+        help="The file format, detected from the extension by default",
+        default=None,
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        help="The number of worker processes (default is the CPU count)",
+        default=None,
+    )
+    parser.add_argument(
+        "--delimiter",
+        "-d",
+        type=str,
+        help="The CSV delimiter",
+        default=",",
+    )
+    parser.add_argument(
+        "--suffix",
+        type=str,
+        help="The suffix of the new columns",
+        default="_lettres",
+    )
+    parser.add_argument(
+        "--language",
+        "-l",
+        type=str,
+        help="The default language code of the columns",
+        default="fr_BE",
+    )
+    parser.add_argument(
+        "--post_1990_orthographe",
+        "-t",
+        action="store_true",
+        help="Use the tiret character everywhere (e.g., 'vingt-et-un')",
+        default=False,
+    )
+
+    args = parser.parse_args(argv)
+
+    try:
+        columns = [
+            parse_column_spec(
+                spec,
+                suffix=args.suffix,
+                language=args.language,
+                post_1990_orthographe=args.post_1990_orthographe,
+            )
+            for spec in args.column
+        ]
+        convert_file(
+            args.input,
+            args.output,
+            columns,
+            file_format=args.format,
+            workers=args.workers,
+            delimiter=args.delimiter,
+        )
+
+    except (OSError, ValueError) as exception:
+        sys.exit(str(exception))
+
+
+def build_artifact_command(argv: list[str]):
+    """Build a spelling artifact (build-artifact command)."""
+    # Only needed by this command
+    from nombres_vers_lettres.artifact import (
+        DEFAULT_LIMIT,
+        DEFAULT_MODES,
+        build_artifact,
+    )
+
+    parser = argparse.ArgumentParser(
+        f"{os.path.basename(sys.argv[0])} build-artifact",
+        description=(
+            "Precompute the letters of the numbers under a limit "
+            "in a memory-mappable file"
+        ),
+    )
+    parser.add_argument("output", type=str, help="The artifact file")
+    parser.add_argument(
+        "--languages",
+        type=str,
+        help="The comma-separated language codes (default is all)",
+        default=",".join(AVAILABLE_LANGUAGES),
+    )
+    parser.add_argument(
+        "--modes",
+        type=str,
+        help="The comma-separated modes",
+        default=",".join(DEFAULT_MODES),
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        help="The numbers under this limit are precomputed",
+        default=DEFAULT_LIMIT,
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        help="The number of worker processes (default is the CPU count)",
+        default=None,
+    )
+
+    args = parser.parse_args(argv)
+
+    try:
+        build_artifact(
+            args.output,
+            languages=args.languages.split(","),
+            modes=args.modes.split(","),
+            limit=args.limit,
+            workers=args.workers,
+        )
+
+    except (OSError, ValueError) as exception:
+        sys.exit(str(exception))
+
+
+def export_command(argv: list[str]):
+    """Export aligned (number, letters) datasets (export command)."""
+    # Only needed by this command
+    from nombres_vers_lettres.export import (
+        EXPORT_FORMATS,
+        export_dataset,
+        parse_range,
+    )
+
+    parser = argparse.ArgumentParser(
+        f"{os.path.basename(sys.argv[0])} export",
+        description=(
+            "Write the letters of every number of a range in shards, "
+            "one record per number, mode and language (an interrupted "
+            "export is resumed by running it again)"
+        ),
+    )
+    parser.add_argument(
+        "output", type=str, help="The directory of the shards"
+    )
+    parser.add_argument(
+        "--range",
+        type=str,
+        required=True,
+        help="The numbers to export, as start:stop (e.g., 0:10000000)",
+    )
+    parser.add_argument(
+        "--modes",
+        type=str,
+        help="The comma-separated modes",
+        default="cardinal",
+    )
+    parser.add_argument(
+        "--languages",
+        type=str,
+        help="The comma-separated language codes",
+        default="fr_BE",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        help="The number of shards (default is the number of workers)",
+        default=None,
+    )
+    parser.add_argument(
+        "--format",
+        choices=EXPORT_FORMATS,
+        help="The file format of the shards",
+        default="jsonl",
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        help="The number of worker processes (default is the CPU count)",
+        default=None,
+    )
+    parser.add_argument(
+        "--post_1990_orthographe",
+        "-t",
+        action="store_true",
+        help="Use the tiret character everywhere (e.g., 'vingt-et-un')",
+        default=False,
+    )
+    parser.add_argument(
+        "--non_breaking_spaces",
+        action="store_true",
+        help="Use non-breaking spaces between the words",
+        default=False,
+    )
+
+    args = parser.parse_args(argv)
+
+    try:
+        start, stop = parse_range(args.range)
+        export_dataset(
+            args.output,
+            start,
+            stop,
+            modes=args.modes.split(","),
+            languages=args.languages.split(","),
+            shards=args.shards,
+            file_format=args.format,
+            workers=args.workers,
+            post_1990_orthographe=args.post_1990_orthographe,
+            use_non_breaking_spaces=args.non_breaking_spaces,
+        )
 
-    parser = argparse.ArgumentParser(os.path.basename(sys.argv[0]))
+    except (OSError, ValueError) as exception:
+        sys.exit(str(exception))
+
+
+def jsonl_command(argv: list[str]):
+    """Answer JSON Lines requests from the standard input (--jsonl mode)."""
+    # Only needed by this command
+    from nombres_vers_lettres.protocol import serve_jsonl
+
+    parser = argparse.ArgumentParser(
+        f"{os.path.basename(sys.argv[0])} --jsonl",
+        description=(
+            "Read JSON Lines requests (id, number, mode, language, gender, "
+            "plural, post_1990_orthographe) from the standard input and "
+            "write one JSON response per line to the standard output"
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        help="The number of worker processes (default is none)",
+        default=0,
+    )
+    parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help=(
+            "Write the responses as soon as they are ready instead of in "
+            "the order of the requests (match them with their id)"
+        ),
+        default=False,
+    )
+
+    args = parser.parse_args(argv)
+
+    try:
+        serve_jsonl(workers=args.workers, ordered=not args.unordered)
+
+    except KeyboardInterrupt:
+        pass
+
+    except BrokenPipeError:
+        # The parent process closed the pipe
+        sys.stderr.close()
+
+
+def replay_command(argv: list[str]):
+    """Replay a recorded workload and report its latencies (replay command)."""
+    # Only needed by this command
+    from nombres_vers_lettres.workload import read_workload, replay_workload
+
+    parser = argparse.ArgumentParser(
+        f"{os.path.basename(sys.argv[0])} replay",
+        description=(
+            "Run the calls of a workload log (see enable_recording) at full "
+            "speed and report the throughput and the latencies"
+        ),
+    )
+    parser.add_argument("log", type=str, help="The path of the workload log")
+    parser.add_argument(
+        "--repeat",
+        "-r",
+        type=int,
+        help="The times each call is run (its latency is the fastest run)",
+        default=1,
+    )
+
+    args = parser.parse_args(argv)
+
+    try:
+        report = replay_workload(read_workload(args.log), repeat=args.repeat)
+
+    except (OSError, ValueError) as exception:
+        sys.exit(str(exception))
+
+    print(
+        f"{report.calls} calls ({report.errors} errors) in "
+        f"{report.seconds:.3f} s, {report.throughput:.0f} calls/s"
+    )
+
+    for percentile, latency in report.latencies.items():
+        print(
+            f"p{percentile:<4}: {latency / 1000:10.2f} µs (recorded "
+            f"{report.recorded_latencies[percentile] / 1000:10.2f} µs)"
+        )
+
+
+def serve_command(argv: list[str]):
+    """Answer the conversions on a Unix domain socket (serve command)."""
+    # Only needed by this command
+    from nombres_vers_lettres.daemon import default_socket_path, serve_unix
+
+    parser = argparse.ArgumentParser(
+        f"{os.path.basename(sys.argv[0])} serve",
+        description=(
+            "Run a daemon answering JSON Lines requests on a Unix domain "
+            "socket (used by nvl-client)"
+        ),
+    )
+    parser.add_argument(
+        "--unix",
+        type=str,
+        help=(
+            "The path of the socket "
+            f"(default is $NVL_SOCKET or {default_socket_path()})"
+        ),
+        default=None,
+    )
+
+    args = parser.parse_args(argv)
+
+    try:
+        serve_unix(args.unix)
+
+    except OSError as exception:
+        sys.exit(str(exception))
+
+
+COMMANDS = {
+    "--jsonl": jsonl_command,
+    "build-artifact": build_artifact_command,
+    "convert": convert_command,
+    "export": export_command,
+    "replay": replay_command,
+    "serve": serve_command,
+}
+
+
+def parse_arguments(
+    argv: list[str], prog: str | None = None, client: bool = False
+) -> dict[str, Any]:
+    """Parse the arguments of the conversion of a number.
+
+    Args:
+        argv (list[str]): The command line arguments.
+        prog (str | None, optional): The name of the program.
+        Defaults to the name of the script.
+        client (bool, optional): If True, also parse the options of the
+        client of the daemon ("unix", the path of the socket).
+        Defaults to False.
+
+    Returns:
+        dict[str, Any]: The number and the options of make_letters (and
+        of the client).
+    """
+    argv = list(argv)
+    parser = argparse.ArgumentParser(prog or os.path.basename(sys.argv[0]))
 
     # Add the positional argument for the number
     parser.add_argument(
@@ -134,7 +516,16 @@ def main():
         default="fr_BE",
     )
 
-    argv = sys.argv[1:]
+    if client:
+        parser.add_argument(
+            "--unix",
+            type=str,
+            help=(
+                "The path of the socket of the daemon "
+                "(default is $NVL_SOCKET or the socket of the user)"
+            ),
+            default=None,
+        )
 
     if len(argv) > 0:
         # The last argument is the number to convert
@@ -176,16 +567,58 @@ def main():
         # Default
         selected_gender = "masculine"
 
-    print(
-        make_letters(
-            args.number,
-            gender=selected_gender,
-            plural=args.plural,
-            language=args.language,
-            mode=selected_mode,
-            post_1990_orthographe=args.post_1990_orthographe,
-        )
-    )
+    request = {
+        "number": args.number,
+        "gender": selected_gender,
+        "plural": bool(args.plural),
+        "language": args.language,
+        "mode": selected_mode,
+        "post_1990_orthographe": bool(args.post_1990_orthographe),
+    }
+
+    if client:
+        request["unix"] = args.unix
+
+    return request
+
+
+def main():
+    """Main entry point for the application when run with the -m switch."""
+    argv = sys.argv[1:]
+
+    if len(argv) > 0 and argv[0] in COMMANDS:
+        COMMANDS[argv[0]](argv[1:])
+        return
+
+    request = parse_arguments(argv)
+    print(make_letters(**request))
+
+
+def client_main():
+    """Entry point of the client of the daemon (see the serve command).
+
+    The number is converted in the current process if the daemon is not
+    running.
+    """
+    # Only needed by the client
+    from nombres_vers_lettres.daemon import request_daemon
+
+    request = parse_arguments(sys.argv[1:], client=True)
+    # Not an option of make_letters
+    path = request.pop("unix")
+    response = request_daemon(request, path)
+
+    if response is None:
+        try:
+            response = {"letters": make_letters(**request)}
+
+        except ValueError as exception:
+            response = {"message": str(exception)}
+
+    if "letters" not in response:
+        sys.exit(response["message"])
+
+    print(response["letters"])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,230 @@
+"""asyncio API to convert numbers without blocking the event loop.
+
+The short numbers are converted inline (a conversion takes a few
+microseconds). The long numbers and the batches are converted in an
+executor (the default thread pool of the loop, or any thread or process
+pool), with a bounded number of pending conversions: once the bound is
+reached, the callers wait instead of queueing more work.
+
+    letters = await amake_letters("1234.5", mode="EUR")
+    results = await amake_letters_many(amounts, language="fr_FR")
+"""
+
+import asyncio
+import functools
+import weakref
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from typing import Any
+
+from nombres_vers_lettres.batch import LettersResult, make_letters_batch
+from nombres_vers_lettres.make_letters import make_letters
+
+# Numbers with more characters (or an integer with more bits) are
+# converted in the executor
+INLINE_MAX_LENGTH = 32
+INLINE_MAX_BITS = 100
+
+# Smaller batches of short numbers are converted inline
+INLINE_MAX_BATCH = 16
+
+# Maximal number of conversions (or chunks) pending in the executor
+DEFAULT_MAX_PENDING = 64
+
+# Number of numbers converted by a task of a batch
+DEFAULT_CHUNK_SIZE = 256
+
+
+def is_cheap(number: Any) -> bool:
+    """Check if a number is short enough to be converted inline."""
+    if type(number) is int:
+        return number.bit_length() <= INLINE_MAX_BITS
+
+    if type(number) is float:
+        return True
+
+    if type(number) is str:
+        return len(number) <= INLINE_MAX_LENGTH
+
+    return False
+
+
+class AsyncConverter:
+    """Convert numbers in an asyncio event loop.
+
+    Attributes:
+        executor (Executor | None): The executor of the long conversions,
+        None for the default executor of the loop.
+        max_pending (int): The maximal number of pending tasks in the
+        executor.
+        chunk_size (int): The number of numbers converted by a task of a
+        batch.
+    """
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        if max_pending < 1 or chunk_size < 1:
+            raise ValueError(
+                f"Invalid async converter ({max_pending = }, {chunk_size = })"
+            )
+
+        self.executor = executor
+        self.max_pending = max_pending
+        self.chunk_size = chunk_size
+        self._semaphores: weakref.WeakKeyDictionary[Any, asyncio.Semaphore]
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore of the pending tasks (one per event loop)."""
+        loop = asyncio.get_running_loop()
+
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_pending)
+
+        return self._semaphores[loop]
+
+    async def _offload(self, function: Any) -> Any:
+        """Run a function in the executor (waits if too many are pending)."""
+        async with self._semaphore():
+            return await asyncio.get_running_loop().run_in_executor(
+                self.executor, function
+            )
+
+    async def make_letters(
+        self, number: float | int | str, **options: Any
+    ) -> str:
+        """Convert a number to letters (see make_letters).
+
+        Raises:
+            ConversionError: If the number cannot be converted.
+
+        Returns:
+            str: The letters.
+        """
+        if is_cheap(number):
+            return make_letters(number, **options)
+
+        return await self._offload(
+            functools.partial(make_letters, number, **options)
+        )
+
+    async def make_letters_many(
+        self, values: Iterable[float | int | str], **options: Any
+    ) -> list[LettersResult]:
+        """Convert numbers to letters (see make_letters_batch).
+
+        The values are read lazily, by chunks, and at most max_pending
+        chunks are converted at the same time.
+
+        Returns:
+            list[LettersResult]: The letters or the error code of each
+            number.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphore()
+
+        def convert(chunk: list[Any]) -> asyncio.Future:
+            future = loop.run_in_executor(
+                self.executor,
+                functools.partial(make_letters_batch, chunk, **options),
+            )
+            # Also released if the future is cancelled
+            future.add_done_callback(lambda _: semaphore.release())
+            return future
+
+        tasks: list[asyncio.Future] = []
+        chunk: list[Any] = []
+
+        try:
+            for value in values:
+                chunk.append(value)
+
+                if len(chunk) == self.chunk_size:
+                    # Backpressure: wait for a free slot before reading more
+                    await semaphore.acquire()
+                    tasks.append(convert(chunk))
+                    chunk = []
+
+            if chunk and not tasks and len(chunk) <= INLINE_MAX_BATCH and all(
+                is_cheap(value) for value in chunk
+            ):
+                return make_letters_batch(chunk, **options)
+
+            if chunk:
+                await semaphore.acquire()
+                tasks.append(convert(chunk))
+
+            results = []
+            for chunk_results in await asyncio.gather(*tasks):
+                results.extend(chunk_results)
+
+            return results
+
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+
+            raise
+
+
+_default_converter = AsyncConverter()
+
+
+def configure_async(
+    executor: Executor | None = None,
+    max_pending: int = DEFAULT_MAX_PENDING,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncConverter:
+    """Set the converter used by amake_letters and amake_letters_many.
+
+    Args:
+        executor (Executor | None, optional): A thread or process pool for
+        the long conversions. Defaults to the default executor of the loop.
+        max_pending (int, optional): The maximal number of pending tasks
+        in the executor. Defaults to DEFAULT_MAX_PENDING.
+        chunk_size (int, optional): The number of numbers converted by a
+        task of a batch. Defaults to DEFAULT_CHUNK_SIZE.
+
+    Returns:
+        AsyncConverter: The new converter.
+    """
+    global _default_converter
+    _default_converter = AsyncConverter(executor, max_pending, chunk_size)
+    return _default_converter
+
+
+async def amake_letters(number: float | int | str, **options: Any) -> str:
+    """Convert a number to letters without blocking the event loop.
+
+    Args:
+        number (float | int | str): The number to convert.
+        **options: The keyword arguments of make_letters (mode, gender,
+        plural, language, etc.).
+
+    Raises:
+        ConversionError: If the number cannot be converted.
+
+    Returns:
+        str: The letters.
+    """
+    return await _default_converter.make_letters(number, **options)
+
+
+async def amake_letters_many(
+    values: Iterable[float | int | str], **options: Any
+) -> list[LettersResult]:
+    """Convert numbers to letters without blocking the event loop.
+
+    Args:
+        values (Iterable[float | int | str]): The numbers to convert.
+        **options: The keyword arguments of make_letters (mode, gender,
+        plural, language, etc.).
+
+    Returns:
+        list[LettersResult]: The letters or the error code of each number.
+    """
+    return await _default_converter.make_letters_many(values, **options)
@@ -0,0 +1,178 @@
+"""Apache Arrow adapters to convert columns of numbers to letters.
+
+The adapters accept ``pyarrow.Array``/``pyarrow.ChunkedArray`` objects,
+``pandas.Series`` and any object exposing ``to_arrow()`` (e.g.,
+``polars.Series``). The column is dictionary-encoded first so that each
+distinct value is converted only once, the rows themselves never leave
+Arrow memory.
+
+pyarrow is an optional dependency:
+
+    python -m pip install nombres_vers_lettres[arrow]
+"""
+
+from decimal import Decimal
+from typing import Any
+
+from nombres_vers_lettres.make_letters import make_letters
+
+
+def _import_pyarrow() -> tuple[Any, Any]:
+    """Import pyarrow and pyarrow.compute.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+
+    Returns:
+        tuple[Any, Any]: The pyarrow and pyarrow.compute modules.
+    """
+    try:
+        import pyarrow  # type: ignore[import-not-found,import-untyped]
+        import pyarrow.compute  # type: ignore[import-not-found,import-untyped]
+
+    except ImportError as exception:
+        raise ImportError(
+            "The Arrow adapters require pyarrow "
+            "(python -m pip install nombres_vers_lettres[arrow])"
+        ) from exception
+
+    return pyarrow, pyarrow.compute
+
+
+def to_arrow(values: Any) -> Any:
+    """Get an Arrow array from a pyarrow, pandas or polars column.
+
+    Args:
+        values (Any): The column (pyarrow.Array, pyarrow.ChunkedArray,
+        pandas.Series, polars.Series, etc.).
+
+    Returns:
+        Any: A pyarrow.Array or a pyarrow.ChunkedArray.
+    """
+    pa, _ = _import_pyarrow()
+
+    if isinstance(values, (pa.Array, pa.ChunkedArray)):
+        return values
+
+    # polars.Series and similar Arrow-backed containers
+    if callable(getattr(values, "to_arrow", None)):
+        return values.to_arrow()
+
+    # pandas.Series (NaN and None become nulls)
+    return pa.array(values, from_pandas=True)
+
+
+def _python_number(value: Any) -> float | int | str:
+    """Get a value that make_letters accepts from an Arrow scalar value."""
+    if isinstance(value, Decimal):
+        # Keep the exact digits (no float conversion, no exponent)
+        return format(value, "f")
+
+    return value
+
+
+def _letters_or_none(value: Any, options: dict[str, Any]) -> str | None:
+    """Convert a value to letters, errors become None (Arrow null)."""
+    try:
+        return make_letters(_python_number(value), **options)
+
+    except (ValueError, TypeError, ArithmeticError):
+        return None
+
+
+def make_letters_arrow(
+    values: Any,
+    dictionary_encode: bool | None = None,
+    max_dictionary_ratio: float = 0.5,
+    **options: Any,
+) -> Any:
+    """Convert a column of numbers to an Arrow column of letters.
+
+    Each distinct value is converted once with make_letters. Null values
+    and values which cannot be converted become nulls.
+
+    Args:
+        values (Any): The column of integers, floats, decimals or strings
+        (pyarrow.Array, pyarrow.ChunkedArray, pandas.Series,
+        polars.Series, etc.).
+        dictionary_encode (bool | None, optional): If True, return a
+        dictionary-encoded array, if False, return a plain string array.
+        If None, dictionary-encode when the cardinality is low.
+        Defaults to None.
+        max_dictionary_ratio (float, optional): When dictionary_encode is
+        None, the maximal ratio of distinct values to rows for which the
+        output is dictionary-encoded. Defaults to 0.5.
+        **options: The keyword arguments of make_letters (mode, gender,
+        plural, language, etc.).
+
+    Returns:
+        Any: A pyarrow string array (or a dictionary array of strings),
+        chunked if the input is chunked.
+    """
+    pa, pc = _import_pyarrow()
+    array = to_arrow(values)
+
+    if pa.types.is_dictionary(array.type):
+        encoded = array
+
+        if isinstance(encoded, pa.ChunkedArray):
+            encoded = encoded.unify_dictionaries()
+
+    else:
+        encoded = pc.dictionary_encode(array)
+
+    # The dictionary is shared by all the chunks of a chunked array
+    if isinstance(encoded, pa.ChunkedArray):
+        chunks = encoded.chunks
+        dictionary = (
+            chunks[0].dictionary if chunks else pa.array([], array.type)
+        )
+
+    else:
+        chunks = [encoded]
+        dictionary = encoded.dictionary
+
+    # Only the distinct values go through Python
+    letters = pa.array(
+        (
+            _letters_or_none(value, options)
+            for value in dictionary.to_pylist()
+        ),
+        type=pa.string(),
+        size=len(dictionary),
+    )
+
+    if dictionary_encode is None:
+        dictionary_encode = (
+            len(dictionary) <= max_dictionary_ratio * len(array)
+        )
+
+    converted_chunks = []
+    for chunk in chunks:
+        indices = chunk.indices
+
+        if letters.null_count:
+            # Rows whose value could not be converted become nulls
+            indices = pc.if_else(
+                pc.is_valid(pc.take(letters, indices)),
+                indices,
+                pa.scalar(None, indices.type),
+            )
+
+        if dictionary_encode:
+            converted_chunks.append(
+                pa.DictionaryArray.from_arrays(indices, letters)
+            )
+
+        else:
+            converted_chunks.append(pc.take(letters, indices))
+
+    if isinstance(encoded, pa.ChunkedArray):
+        output_type = (
+            pa.dictionary(encoded.type.index_type, pa.string())
+            if dictionary_encode
+            else pa.string()
+        )
+        return pa.chunked_array(converted_chunks, type=output_type)
+
+    return converted_chunks[0]
@@ -0,0 +1,388 @@
+"""Precomputed letters of the numbers from 0 to 999,999.
+
+A spelling artifact is a binary file holding the letters of every number
+under a limit (1,000,000 by default) for several (language, mode,
+orthographe) variants. The file is memory-mapped, so that a lookup is a
+slice of a page shared by every process of the host.
+
+Layout of the file (little-endian):
+
+- magic (8 bytes), size of the JSON index (uint32), padding (uint32);
+- JSON index (the tables of each variant, the library version and the
+  hash of the constants), padded to 8 bytes;
+- for each table, the offsets of the letters (uint32, limit + 1 values)
+  followed by the letters (UTF-8, with non-breaking spaces).
+
+Build an artifact with ``python -m nombres_vers_lettres build-artifact``
+and install it with load_artifact().
+"""
+
+import hashlib
+import json
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from nombres_vers_lettres import constants
+from nombres_vers_lettres.constants import (
+    AVAILABLE_LANGUAGES,
+    FRENCH_FRENCH_LIKE,
+    LANGUAGES_DECADES,
+    VALID_MASCULINE,
+)
+from nombres_vers_lettres.make_letters import (
+    make_letters,
+    set_spelling_artifact,
+)
+
+MAGIC = b"NVLLTR01"
+HEADER = struct.Struct("<8sII")
+
+# The numbers under this limit are precomputed by default
+DEFAULT_LIMIT = 1_000_000
+
+# The modes precomputed by default
+DEFAULT_MODES = ("cardinal", "ordinal_adjectival", "ordinal_nominal")
+
+# The modes which can be precomputed (and their aliases)
+ARTIFACT_MODES = {
+    "cardinal": "cardinal",
+    "cardinal_nominal": "cardinal",
+    "ordinal_adjectival": "ordinal_adjectival",
+    "ordinal": "ordinal_adjectival",
+    "ordinal_nominal": "ordinal_nominal",
+}
+
+
+def library_version() -> str:
+    """Get the version of the installed library ("0.0.0" if unknown)."""
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+
+        return version("nombres_vers_lettres")
+
+    except PackageNotFoundError:
+        return "0.0.0"
+
+
+def constants_hash() -> str:
+    """Get a hash of the tables of the constants module.
+
+    Returns:
+        str: The SHA-256 of the constants (hexadecimal).
+    """
+    tables = {
+        name: value
+        for name, value in sorted(vars(constants).items())
+        if name.isupper()
+    }
+    return hashlib.sha256(repr(tables).encode("utf-8")).hexdigest()
+
+
+def variant_key(language: str, mode: str, post_1990_orthographe: bool) -> str:
+    """Get the key of a variant in the index of an artifact."""
+    return f"{language}|{mode}|{int(bool(post_1990_orthographe))}"
+
+
+def _table_key(language: str, mode: str, post_1990_orthographe: bool):
+    """Get a key shared by the variants with the same letters.
+
+    The language is only used through its decades and through
+    FRENCH_FRENCH_LIKE (e.g., fr_BE and fr_CD have the same letters).
+    """
+    return (
+        id(LANGUAGES_DECADES[language]),
+        language in FRENCH_FRENCH_LIKE,
+        mode,
+        bool(post_1990_orthographe),
+    )
+
+
+def _build_table(
+    language: str, mode: str, post_1990_orthographe: bool, limit: int
+) -> bytes:
+    """Build the offsets and the letters of a variant."""
+    offsets = array("I", [0])
+    letters = bytearray()
+
+    for number in range(limit):
+        letters += make_letters(
+            number,
+            mode=mode,
+            language=language,
+            post_1990_orthographe=post_1990_orthographe,
+        ).encode("utf-8")
+        offsets.append(len(letters))
+
+    if sys.byteorder != "little":
+        offsets.byteswap()
+
+    return offsets.tobytes() + bytes(letters)
+
+
+def _pad(size: int) -> bytes:
+    """Get the padding to align a size on 8 bytes."""
+    return b"\0" * (-size % 8)
+
+
+def build_artifact(
+    path: str,
+    languages: Iterable[str] = AVAILABLE_LANGUAGES,
+    modes: Iterable[str] = DEFAULT_MODES,
+    limit: int = DEFAULT_LIMIT,
+    workers: int | None = None,
+) -> None:
+    """Build a spelling artifact.
+
+    Args:
+        path (str): The path of the artifact.
+        languages (Iterable[str], optional): Defaults to every language.
+        modes (Iterable[str], optional): Defaults to DEFAULT_MODES.
+        limit (int, optional): The numbers under this limit are
+        precomputed. Defaults to DEFAULT_LIMIT.
+        workers (int | None, optional): The number of worker processes.
+        Defaults to the number of CPUs.
+
+    Raises:
+        ValueError: If a language or a mode is invalid.
+    """
+    variants: dict[str, int] = {}
+    tables: list[tuple[str, str, bool]] = []
+    table_indices: dict[Any, int] = {}
+
+    for language in languages:
+        if language not in LANGUAGES_DECADES:
+            raise ValueError(f"Invalid language ({language = })")
+
+        for mode in modes:
+            if mode not in ARTIFACT_MODES:
+                raise ValueError(f"Invalid mode ({mode = })")
+
+            mode = ARTIFACT_MODES[mode]
+            for post_1990_orthographe in (False, True):
+                key = _table_key(language, mode, post_1990_orthographe)
+
+                if key not in table_indices:
+                    table_indices[key] = len(tables)
+                    tables.append((language, mode, post_1990_orthographe))
+
+                variant = variant_key(language, mode, post_1990_orthographe)
+                variants[variant] = table_indices[key]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        contents = list(
+            executor.map(
+                _build_table,
+                *zip(*tables),
+                [limit] * len(tables),
+            )
+        )
+
+    # The positions of the tables depend on the size of the index
+    offsets_size = 4 * (limit + 1)
+    table_positions: list[list[int]] = []
+    position = 0
+    for content in contents:
+        table_positions.append([position, len(content) - offsets_size])
+        position += len(content) + len(_pad(len(content)))
+
+    index = {
+        "limit": limit,
+        "version": library_version(),
+        "constants": constants_hash(),
+        "variants": variants,
+        "tables": table_positions,
+    }
+
+    index_bytes = json.dumps(index).encode("utf-8")
+    index_bytes += _pad(HEADER.size + len(index_bytes))
+
+    with open(path, "wb") as artifact_file:
+        artifact_file.write(HEADER.pack(MAGIC, len(index_bytes), 0))
+        artifact_file.write(index_bytes)
+
+        for content in contents:
+            artifact_file.write(content)
+            artifact_file.write(_pad(len(content)))
+
+
+class SpellingArtifact:
+    """Letters of the numbers under a limit, read from a buffer.
+
+    The buffer is usually a memory-mapped artifact (see open_artifact),
+    it can also be a shared memory block.
+
+    Attributes:
+        limit (int): The numbers under this limit are precomputed.
+        version (str): The library version which built the artifact.
+        constants (str): The hash of the constants which built the artifact.
+    """
+
+    def __init__(self, buffer: Any):
+        self._buffer = buffer
+        view = memoryview(buffer)
+        magic, index_size, _ = HEADER.unpack_from(view)
+
+        if magic != MAGIC:
+            raise ValueError("Invalid spelling artifact (bad magic number)")
+
+        data_start = HEADER.size + index_size
+        index = json.loads(
+            bytes(view[HEADER.size:data_start]).rstrip(b"\0")
+        )
+        self.limit: int = index["limit"]
+        self.version: str = index["version"]
+        self.constants: str = index["constants"]
+
+        offsets_size = 4 * (self.limit + 1)
+        tables = []
+        for position, letters_size in index["tables"]:
+            offsets_start = data_start + position
+            letters_start = offsets_start + offsets_size
+            offsets: Any = view[offsets_start:letters_start].cast("I")
+
+            if sys.byteorder != "little":
+                offsets = array("I", offsets)
+                offsets.byteswap()
+
+            letters_end = letters_start + letters_size
+            tables.append((offsets, view[letters_start:letters_end]))
+
+        self._variants = {
+            key: tables[table] for key, table in index["variants"].items()
+        }
+
+    def is_current(self) -> bool:
+        """Check if the artifact was built by this library and constants."""
+        return (
+            self.version == library_version()
+            and self.constants == constants_hash()
+        )
+
+    def variants(self) -> list[str]:
+        """Get the keys of the precomputed variants."""
+        return sorted(self._variants)
+
+    def lookup(
+        self,
+        number: Any,
+        mode: str = "cardinal",
+        gender: str = "masculin",
+        plural: bool = False,
+        language: str = "fr_BE",
+        post_1990_orthographe: bool = True,
+    ) -> str | None:
+        """Get the precomputed letters of a number (with non-breaking spaces).
+
+        Only the masculine singular letters are precomputed (the gender
+        and the plural are ignored by the ordinal_adjectival mode), any
+        other gender (even an invalid one) is left to make_letters.
+
+        Args:
+            number (Any): The number (int or string of digits).
+            mode (str, optional): Defaults to "cardinal".
+            gender (str, optional): Defaults to "masculin".
+            plural (bool, optional): Defaults to False.
+            language (str, optional): Defaults to "fr_BE".
+            post_1990_orthographe (bool, optional): Defaults to True.
+
+        Returns:
+            str | None: The letters, None if the number or the variant is
+            not precomputed.
+        """
+        if type(number) is int:
+            value = number
+
+        elif (
+            isinstance(number, str)
+            and 0 < len(number) <= 7
+            and number.isascii()
+            and number.isdigit()
+        ):
+            value = int(number)
+
+        else:
+            return None
+
+        if not 0 <= value < self.limit:
+            return None
+
+        mode = ARTIFACT_MODES.get(mode, "")
+        if mode != "ordinal_adjectival" and (
+            plural or gender not in VALID_MASCULINE
+        ):
+            return None
+
+        table = self._variants.get(
+            variant_key(language, mode, post_1990_orthographe)
+        )
+        if table is None:
+            return None
+
+        offsets, letters = table
+        start = offsets[value]
+        end = offsets[value + 1]
+        return str(letters[start:end], "utf-8")
+
+    def close(self) -> None:
+        """Release the buffer (the artifact cannot be used afterwards)."""
+        self._variants = {}
+
+        if isinstance(self._buffer, mmap.mmap):
+            try:
+                self._buffer.close()
+
+            except BufferError:
+                # Still referenced, unmapped once garbage collected
+                pass
+
+
+def open_artifact(path: str) -> SpellingArtifact:
+    """Memory-map a spelling artifact.
+
+    Args:
+        path (str): The path of the artifact.
+
+    Returns:
+        SpellingArtifact: The artifact.
+    """
+    with open(path, "rb") as artifact_file:
+        buffer = mmap.mmap(artifact_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return SpellingArtifact(buffer)
+
+
+def load_artifact(path: str, strict: bool = True) -> SpellingArtifact:
+    """Memory-map a spelling artifact and use it in make_letters.
+
+    Args:
+        path (str): The path of the artifact.
+        strict (bool, optional): If True, reject an artifact built by
+        another version of the library or other constants.
+        Defaults to True.
+
+    Raises:
+        ValueError: If the artifact is stale (and strict is True).
+
+    Returns:
+        SpellingArtifact: The installed artifact.
+    """
+    artifact = open_artifact(path)
+
+    if strict and not artifact.is_current():
+        artifact.close()
+        raise ValueError(
+            f"Stale spelling artifact ({path}, version {artifact.version})"
+        )
+
+    set_spelling_artifact(artifact)
+    return artifact
+
+
+def unload_artifact() -> None:
+    """Stop using the spelling artifact in make_letters."""
+    set_spelling_artifact(None)
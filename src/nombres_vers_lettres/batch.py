@@ -0,0 +1,242 @@
+"""Convert many numbers at once, collecting the errors instead of raising."""
+
+import json
+import os
+import pickle
+from collections.abc import Iterable
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Any, NamedTuple
+
+from nombres_vers_lettres.constants import (
+    AVAILABLE_LANGUAGES,
+    ERROR_INVALID_LANGUAGE,
+    ERROR_INVALID_MODE,
+    ERROR_INVALID_NUMBER,
+)
+from nombres_vers_lettres.make_letters import (
+    ConversionError,
+    check_number,
+    make_letters,
+)
+
+
+class LettersResult(NamedTuple):
+    """The result of a conversion (letters or error code)."""
+
+    letters: str | None
+    error: str | None
+
+
+def make_letters_batch(
+    values: Iterable[float | int | str], **options: Any
+) -> list[LettersResult]:
+    """Convert numbers to letters without raising on invalid numbers.
+
+    Invalid numbers are detected by check_number before any conversion,
+    so that dirty data costs less than valid data.
+
+    Args:
+        values (Iterable[float | int | str]): The numbers to convert.
+        **options: The keyword arguments of make_letters (mode, gender,
+        plural, language, etc.).
+
+    Returns:
+        list[LettersResult]: The letters or the error code of each number.
+    """
+    mode = options.get("mode", "cardinal")
+
+    # The mode and the language are the same for all the numbers
+    if check_number(0, mode) == ERROR_INVALID_MODE:
+        return [LettersResult(None, ERROR_INVALID_MODE) for _ in values]
+
+    if options.get("language", "fr_BE") not in AVAILABLE_LANGUAGES:
+        return [LettersResult(None, ERROR_INVALID_LANGUAGE) for _ in values]
+
+    results = []
+    for value in values:
+        error = check_number(value, mode)
+
+        if error is not None:
+            results.append(LettersResult(None, error))
+            continue
+
+        try:
+            results.append(LettersResult(make_letters(value, **options), None))
+
+        except ConversionError as exception:
+            results.append(LettersResult(None, exception.code))
+
+        except ValueError:
+            results.append(LettersResult(None, ERROR_INVALID_NUMBER))
+
+    return results
+
+
+# The executors of make_letters_parallel
+PARALLEL_BACKENDS = ("thread", "process", "interpreter")
+
+# Number of numbers converted by a task of make_letters_parallel
+DEFAULT_CHUNK_SIZE = 4096
+
+
+def create_executor(
+    backend: str = "process", workers: int | None = None
+) -> Executor:
+    """Create an executor of a backend of make_letters_parallel.
+
+    The executor can be reused by several calls of make_letters_parallel
+    (see its executor argument), so that the workers start only once.
+
+    Args:
+        backend (str, optional): "thread", "process" or "interpreter"
+        (sub-interpreters, Python 3.14+). Defaults to "process".
+        workers (int | None, optional): The number of workers.
+        Defaults to the number of CPUs.
+
+    Raises:
+        ValueError: If the backend is invalid or not available.
+
+    Returns:
+        Executor: The executor (the caller must shut it down).
+    """
+    worker_count = workers or os.cpu_count() or 1
+
+    if backend == "thread":
+        return ThreadPoolExecutor(max_workers=worker_count)
+
+    if backend == "process":
+        return ProcessPoolExecutor(max_workers=worker_count)
+
+    if backend == "interpreter":
+        try:
+            # Python 3.14+ (PEP 734)
+            from concurrent.futures import (  # type: ignore[attr-defined]
+                InterpreterPoolExecutor,
+            )
+
+        except ImportError as exception:
+            raise ValueError(
+                "The interpreter backend requires Python 3.14 or later"
+            ) from exception
+
+        return InterpreterPoolExecutor(max_workers=worker_count)
+
+    raise ValueError(
+        f"Invalid backend ({backend = }), "
+        f"expected one of {', '.join(PARALLEL_BACKENDS)}"
+    )
+
+
+def _encode_chunk(chunk: list[Any]) -> bytes:
+    """Encode a chunk of numbers for a worker.
+
+    The chunk is pickled (not JSON-encoded) so that the buffers and the
+    other numbers which are not JSON values give the same results as in
+    make_letters_batch. The memory views, which cannot be pickled, are
+    copied to bytes.
+    """
+    return pickle.dumps(
+        [
+            value.tobytes() if isinstance(value, memoryview) else value
+            for value in chunk
+        ],
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+
+
+def _make_letters_encoded(values: bytes, options: bytes) -> bytes:
+    """Convert an encoded chunk of numbers (in a worker).
+
+    The chunks and the results cross the process or interpreter boundary
+    as bytes (see _encode_chunk), the results are JSON-encoded.
+    """
+    results = make_letters_batch(pickle.loads(values), **json.loads(options))
+    return json.dumps(results, ensure_ascii=False).encode("utf-8")
+
+
+def make_letters_parallel(
+    values: Iterable[float | int | str],
+    backend: str = "process",
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    executor: Executor | None = None,
+    **options: Any,
+) -> list[LettersResult]:
+    """Convert numbers to letters on several cores (see make_letters_batch).
+
+    Args:
+        values (Iterable[float | int | str]): The numbers to convert.
+        backend (str, optional): "thread", "process" or "interpreter"
+        (sub-interpreters, Python 3.14+). Defaults to "process".
+        workers (int | None, optional): The number of workers.
+        Defaults to the number of CPUs.
+        chunk_size (int, optional): The number of numbers converted by a
+        task. Defaults to DEFAULT_CHUNK_SIZE.
+        executor (Executor | None, optional): An executor of the backend to
+        reuse, see create_executor (workers is then ignored).
+        Defaults to a new executor.
+        **options: The keyword arguments of make_letters (mode, gender,
+        plural, language, etc.).
+
+    Raises:
+        ValueError: If the backend is invalid or not available.
+
+    Returns:
+        list[LettersResult]: The letters or the error code of each number.
+    """
+    if backend not in PARALLEL_BACKENDS:
+        raise ValueError(
+            f"Invalid backend ({backend = }), "
+            f"expected one of {', '.join(PARALLEL_BACKENDS)}"
+        )
+
+    values = list(values)
+    chunks = [
+        values[start:start + chunk_size]
+        for start in range(0, len(values), max(1, chunk_size))
+    ]
+
+    if executor is None:
+        # No more workers than chunks
+        worker_count = min(
+            workers or os.cpu_count() or 1, max(1, len(chunks))
+        )
+
+        with create_executor(backend, worker_count) as new_executor:
+            return _map_chunks(new_executor, backend, chunks, options)
+
+    return _map_chunks(executor, backend, chunks, options)
+
+
+def _map_chunks(
+    executor: Executor,
+    backend: str,
+    chunks: list[list[Any]],
+    options: dict[str, Any],
+) -> list[LettersResult]:
+    """Convert chunks of numbers in an executor (in order)."""
+    results = []
+
+    if backend == "thread":
+        for chunk_results in executor.map(
+            lambda chunk: make_letters_batch(chunk, **options), chunks
+        ):
+            results.extend(chunk_results)
+
+        return results
+
+    encoded_options = json.dumps(options).encode("utf-8")
+    for encoded_results in executor.map(
+        _make_letters_encoded,
+        (_encode_chunk(chunk) for chunk in chunks),
+        [encoded_options] * len(chunks),
+    ):
+        results.extend(
+            LettersResult(*result) for result in json.loads(encoded_results)
+        )
+
+    return results
@@ -0,0 +1,386 @@
+"""Cache of the letters returned by make_letters.
+
+enable_cache() installs a cache in make_letters: the letters of each
+(number, options) are computed once and then read from the cache. The
+cache can be the in-process ResultCache or a SharedResultCache shared by
+the processes of a host (see nombres_vers_lettres.shared).
+
+save_snapshot() writes the entries of a cache in a binary file which
+load_snapshot() memory-maps after a restart, so that the cache starts
+warm. Layout of a snapshot (little-endian):
+
+- magic (8 bytes), size of the JSON index (uint32), padding (uint32);
+- JSON index (number of entries, library version and hash of the
+  constants), padded to 8 bytes;
+- hashes of the keys (uint64, sorted), offsets of the entries (uint32,
+  number of entries + 1 values), entries (UTF-8 key, NUL, UTF-8 letters).
+
+The offsets are 32 bits, so the entries of a snapshot cannot exceed
+4 GiB (MAX_SNAPSHOT_SIZE).
+"""
+
+import bisect
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterator
+from typing import Any
+
+from nombres_vers_lettres.artifact import constants_hash, library_version
+from nombres_vers_lettres.make_letters import (
+    get_result_cache,
+    set_result_cache,
+)
+
+# Default number of entries of an in-process cache
+DEFAULT_MAXSIZE = 65_536
+
+SNAPSHOT_MAGIC = b"NVLSNP01"
+SNAPSHOT_HEADER = struct.Struct("<8sII")
+# The entries are located by uint32 offsets
+MAX_SNAPSHOT_SIZE = 2**32 - 1
+
+
+def _key_hash(key: bytes) -> int:
+    """Get the hash of a key in a snapshot."""
+    return int.from_bytes(
+        hashlib.blake2b(key, digest_size=8).digest(), "little"
+    )
+
+
+class CacheSnapshot:
+    """Entries of a cache, read from a memory-mapped snapshot.
+
+    Attributes:
+        version (str): The library version which saved the snapshot.
+        constants (str): The hash of the constants which saved the snapshot.
+    """
+
+    def __init__(self, buffer: Any):
+        self._buffer = buffer
+        view = memoryview(buffer)
+        magic, index_size, _ = SNAPSHOT_HEADER.unpack_from(view)
+
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Invalid cache snapshot (bad magic number)")
+
+        data_start = SNAPSHOT_HEADER.size + index_size
+        index = json.loads(
+            bytes(view[SNAPSHOT_HEADER.size:data_start]).rstrip(b"\0")
+        )
+        self.version: str = index["version"]
+        self.constants: str = index["constants"]
+        self._count: int = index["count"]
+
+        offsets_start = data_start + 8 * self._count
+        entries_start = offsets_start + 4 * (self._count + 1)
+        hashes: Any = view[data_start:offsets_start].cast("Q")
+        offsets: Any = view[offsets_start:entries_start].cast("I")
+
+        if sys.byteorder != "little":
+            hashes = array("Q", hashes)
+            hashes.byteswap()
+            offsets = array("I", offsets)
+            offsets.byteswap()
+
+        self._hashes = hashes
+        self._offsets = offsets
+        self._entries = view[entries_start:]
+
+    def is_current(self) -> bool:
+        """Check if the snapshot was saved by this library and constants."""
+        return (
+            self.version == library_version()
+            and self.constants == constants_hash()
+        )
+
+    def _entry(self, position: int) -> tuple[bytes, bytes]:
+        """Get the key and the letters of an entry."""
+        start = self._offsets[position]
+        end = self._offsets[position + 1]
+        key, _, letters = bytes(self._entries[start:end]).partition(b"\0")
+        return key, letters
+
+    def get(self, key: str) -> str | None:
+        """Get the letters of a key, None if the key is not in the snapshot."""
+        key_bytes = key.encode("utf-8")
+        key_hash = _key_hash(key_bytes)
+        position = bisect.bisect_left(self._hashes, key_hash)
+
+        while position < self._count and self._hashes[position] == key_hash:
+            entry_key, letters = self._entry(position)
+
+            if entry_key == key_bytes:
+                return letters.decode("utf-8")
+
+            position += 1
+
+        return None
+
+    def items(self) -> Iterator[tuple[str, str]]:
+        """Iterate over the keys and letters of the snapshot."""
+        for position in range(self._count):
+            key, letters = self._entry(position)
+            yield key.decode("utf-8"), letters.decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        """Release the buffer (the snapshot cannot be used afterwards)."""
+        self._count = 0
+        self._hashes = self._offsets = self._entries = memoryview(b"")
+
+        if isinstance(self._buffer, mmap.mmap):
+            try:
+                self._buffer.close()
+
+            except BufferError:
+                # Still referenced, unmapped once garbage collected
+                pass
+
+
+class ResultCache:
+    """In-process least recently used cache of the letters.
+
+    The entries of a snapshot (see load_snapshot) are read from the
+    snapshot, they are not counted in maxsize. The cache can be used by
+    several threads.
+
+    Attributes:
+        maxsize (int): The maximal number of entries.
+        snapshot (CacheSnapshot | None): The entries of a snapshot.
+        hits (int): The number of keys found in the cache.
+        misses (int): The number of keys not found in the cache.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAXSIZE,
+        snapshot: CacheSnapshot | None = None,
+    ):
+        if maxsize < 1:
+            raise ValueError(f"Invalid cache size ({maxsize = })")
+
+        self.maxsize = maxsize
+        self.snapshot = snapshot
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        # Another thread may evict an entry between two operations
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        """Get the letters of a key, None if the key is not cached."""
+        with self._lock:
+            letters = self._entries.get(key)
+
+            if letters is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return letters
+
+        snapshot = self.snapshot
+        if snapshot is not None:
+            letters = snapshot.get(key)
+
+        with self._lock:
+            if letters is None:
+                self.misses += 1
+
+            else:
+                self.hits += 1
+
+        return letters
+
+    def put(self, key: str, letters: str) -> None:
+        """Cache the letters of a key (the oldest entry may be evicted)."""
+        with self._lock:
+            self._entries[key] = letters
+            self._entries.move_to_end(key)
+
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def items(self) -> Iterator[tuple[str, str]]:
+        """Iterate over the keys and letters of the cache."""
+        with self._lock:
+            entries = list(self._entries.items())
+
+        snapshot = self.snapshot
+        if snapshot is not None:
+            keys = {key for key, _ in entries}
+            for key, letters in snapshot.items():
+                if key not in keys:
+                    yield key, letters
+
+        yield from entries
+
+    def clear(self) -> None:
+        """Remove every entry (including the snapshot)."""
+        with self._lock:
+            self._entries.clear()
+            self.snapshot = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def enable_cache(cache: Any = None) -> Any:
+    """Use a cache of the letters in make_letters.
+
+    Args:
+        cache (Any, optional): The cache, with get(key) and put(key,
+        letters) methods. Defaults to a new ResultCache.
+
+    Returns:
+        Any: The installed cache.
+    """
+    if cache is None:
+        cache = ResultCache()
+
+    set_result_cache(cache)
+    return cache
+
+
+def disable_cache() -> None:
+    """Stop using a cache of the letters in make_letters."""
+    set_result_cache(None)
+
+
+def _pad(size: int) -> bytes:
+    """Get the padding to align a size on 8 bytes."""
+    return b"\0" * (-size % 8)
+
+
+def save_snapshot(path: str, cache: Any = None) -> int:
+    """Save the entries of a cache in a snapshot file.
+
+    The file is written next to the path and then renamed, so that a
+    snapshot is never read while it is written.
+
+    Args:
+        path (str): The path of the snapshot.
+        cache (Any, optional): The cache, with an items() method.
+        Defaults to the cache used by make_letters.
+
+    Raises:
+        ValueError: If there is no cache, or if its entries exceed
+        MAX_SNAPSHOT_SIZE bytes.
+
+    Returns:
+        int: The number of saved entries.
+    """
+    if cache is None:
+        cache = get_result_cache()
+
+    if cache is None:
+        raise ValueError("No cache to save (see enable_cache)")
+
+    entries = sorted(
+        (_key_hash(key_bytes), key_bytes, letters.encode("utf-8"))
+        for key_bytes, letters in (
+            (key.encode("utf-8"), letters) for key, letters in cache.items()
+        )
+    )
+
+    hashes = array("Q", (key_hash for key_hash, _, _ in entries))
+    offsets = array("I", [0])
+    content = bytearray()
+    for _, key_bytes, letters_bytes in entries:
+        content += key_bytes + b"\0" + letters_bytes
+
+        if len(content) > MAX_SNAPSHOT_SIZE:
+            raise ValueError(
+                f"Cache too large for a snapshot ({len(entries)} entries, "
+                f"more than {MAX_SNAPSHOT_SIZE} bytes)"
+            )
+
+        offsets.append(len(content))
+
+    if sys.byteorder != "little":
+        hashes.byteswap()
+        offsets.byteswap()
+
+    index = {
+        "count": len(entries),
+        "version": library_version(),
+        "constants": constants_hash(),
+    }
+    index_bytes = json.dumps(index).encode("utf-8")
+    index_bytes += _pad(SNAPSHOT_HEADER.size + len(index_bytes))
+
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as snapshot_file:
+        snapshot_file.write(
+            SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, len(index_bytes), 0)
+        )
+        snapshot_file.write(index_bytes)
+        snapshot_file.write(hashes.tobytes())
+        snapshot_file.write(offsets.tobytes())
+        snapshot_file.write(content)
+
+    os.replace(temporary_path, path)
+    return len(entries)
+
+
+def open_snapshot(path: str) -> CacheSnapshot:
+    """Memory-map a cache snapshot.
+
+    Args:
+        path (str): The path of the snapshot.
+
+    Returns:
+        CacheSnapshot: The snapshot.
+    """
+    with open(path, "rb") as snapshot_file:
+        buffer = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return CacheSnapshot(buffer)
+
+
+def load_snapshot(
+    path: str,
+    strict: bool = True,
+    maxsize: int = DEFAULT_MAXSIZE,
+    install: bool = True,
+) -> ResultCache:
+    """Create a cache from a snapshot (memory-mapped, read lazily).
+
+    Args:
+        path (str): The path of the snapshot.
+        strict (bool, optional): If True, reject a snapshot saved by
+        another version of the library or other constants.
+        Defaults to True.
+        maxsize (int, optional): The maximal number of new entries.
+        Defaults to DEFAULT_MAXSIZE.
+        install (bool, optional): If True, use the cache in make_letters.
+        Defaults to True.
+
+    Raises:
+        ValueError: If the snapshot is invalid or stale (and strict is
+        True).
+
+    Returns:
+        ResultCache: The cache.
+    """
+    snapshot = open_snapshot(path)
+
+    if strict and not snapshot.is_current():
+        snapshot.close()
+        raise ValueError(
+            f"Stale cache snapshot ({path}, version {snapshot.version})"
+        )
+
+    cache = ResultCache(maxsize=maxsize, snapshot=snapshot)
+
+    if install:
+        set_result_cache(cache)
+
+    return cache
@@ -0,0 +1,331 @@
+"""Specialized converters generated for a configuration.
+
+make_letters carries its options through every call of the conversion.
+compile_converter() generates (once per configuration) a function with
+the options baked in as constants: the letters of the groups of three
+digits are precomputed and only the code of the selected mode remains.
+
+The generated function converts non-negative integers (int or string of
+digits), any other number is converted by make_letters with the same
+options, so both always return the same letters.
+
+compile_currency_converter() does the same for the amounts of a currency
+(e.g., "1234.56"), on top of the converter of the cardinal mode.
+"""
+
+import functools
+import re
+from collections.abc import Callable
+from typing import Any
+
+from nombres_vers_lettres.constants import (
+    BIG_NUMBERS_BY_RANK,
+    CURRENCY_FORMS_FR,
+    LANGUAGES_DECADES,
+    MAX_INTEGER_DIGITS,
+    VALID_FEMININE,
+)
+from nombres_vers_lettres.make_letters import (
+    make_letters,
+    make_ordinal,
+    positive_integer_under_one_thousand,
+)
+
+# make_letters formats the integers as floats, only the integers which
+# are exactly represented by a float are converted by the generated code
+MAX_EXACT_INTEGER = 2**53
+
+COMPILED_MODES = {
+    "cardinal": "cardinal",
+    "cardinal_nominal": "cardinal",
+    "ordinal_adjectival": "ordinal_adjectival",
+    "ordinal": "ordinal_adjectival",
+    "ordinal_nominal": "ordinal_nominal",
+}
+
+# The amounts converted by the currency converters (e.g., "12", "12.5" or
+# "1234,56"), any other amount is converted by make_letters
+AMOUNT_PATTERN = re.compile(r"(0|[1-9][0-9]*)(?:[.,]([0-9]{1,2}))?")
+
+SOURCE_TEMPLATE = '''
+def {name}(number):
+    if type(number) is int and 0 <= number < MAX_EXACT_INTEGER:
+        value = number
+
+    elif (
+        type(number) is str
+        and 0 < len(number) <= MAX_INTEGER_DIGITS
+        and number.isascii()
+        and number.isdigit()
+    ):
+        value = int(number)
+
+    else:
+        return fallback(number)
+
+    if value < 1000:
+        return {under_one_thousand}
+
+    words = []
+    rank = 0
+    while value:
+        value, group = divmod(value, 1000)
+
+        if group:
+            if rank == 0:
+                words.append(LAST_GROUPS[group])
+
+            elif rank == 3:
+                words.append(THOUSAND_GROUPS[group])
+
+            else:
+                words.append(
+                    GROUPS[group]
+                    + (PLURAL_RANKS[rank] if group > 1 else RANKS[rank])
+                )
+
+        rank += 3
+
+    words.reverse()
+    return {letters}
+'''
+
+
+def _group_letters(
+    space: str,
+    gender: str = "masculin",
+    plural: bool = False,
+    ordinal: bool = False,
+    post_1990_orthographe: bool = False,
+    language: str = "fr_BE",
+) -> tuple[str, ...]:
+    """Get the letters of the numbers from 0 to 999."""
+    return tuple(
+        positive_integer_under_one_thousand(
+            number,
+            gender=gender,
+            plural=plural,
+            ordinal=ordinal,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        ).replace("\xa0", space)
+        for number in range(1000)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def compile_converter(
+    mode: str = "cardinal",
+    gender: str = "masculin",
+    plural: bool = False,
+    language: str = "fr_BE",
+    post_1990_orthographe: bool = True,
+    use_non_breaking_spaces: bool = True,
+) -> Callable[[Any], str]:
+    """Generate a converter specialized for a configuration (cached).
+
+    The arguments are the options of make_letters.
+
+    Raises:
+        ValueError: If the mode or the language is not supported.
+
+    Returns:
+        Callable[[Any], str]: The converter, which returns the same
+        letters as make_letters with the same options.
+    """
+    if mode not in COMPILED_MODES:
+        raise ValueError(f"Mode not supported by the compiler ({mode = })")
+
+    if language not in LANGUAGES_DECADES:
+        raise ValueError(f"Invalid language ({language = })")
+
+    options = {
+        "mode": mode,
+        "gender": gender,
+        "plural": plural,
+        "language": language,
+        "post_1990_orthographe": post_1990_orthographe,
+        "use_non_breaking_spaces": use_non_breaking_spaces,
+    }
+    compiled_mode = COMPILED_MODES[mode]
+    ordinal = compiled_mode == "ordinal_adjectival"
+    space = "\xa0" if use_non_breaking_spaces else " "
+    separator = "-" if post_1990_orthographe else space
+
+    groups = _group_letters(
+        space,
+        ordinal=ordinal,
+        post_1990_orthographe=post_1990_orthographe,
+        language=language,
+    )
+    thousand_groups = tuple(
+        letters + separator + "mille"
+        for letters in _group_letters(
+            space,
+            ordinal=True,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        )
+    )
+    # "mille", not "un mille"
+    thousand_groups = ("",) + ("mille",) + thousand_groups[2:]
+
+    if compiled_mode == "cardinal":
+        # The gender and the plural only change the last group
+        last_groups = _group_letters(
+            space,
+            gender=gender,
+            plural=plural,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        )
+
+    else:
+        last_groups = groups
+
+    namespace: dict[str, Any] = {
+        "MAX_EXACT_INTEGER": MAX_EXACT_INTEGER,
+        "MAX_INTEGER_DIGITS": MAX_INTEGER_DIGITS,
+        "LAST_GROUPS": last_groups,
+        "THOUSAND_GROUPS": thousand_groups,
+        "GROUPS": tuple(letters + separator for letters in groups),
+        "RANKS": {
+            rank: BIG_NUMBERS_BY_RANK[rank]
+            for rank in BIG_NUMBERS_BY_RANK
+            if rank > 3
+        },
+        "PLURAL_RANKS": {
+            rank: BIG_NUMBERS_BY_RANK[rank] + "s"
+            for rank in BIG_NUMBERS_BY_RANK
+            if rank > 3
+        },
+        "fallback": functools.partial(
+            make_letters,
+            mode=mode,
+            gender=gender,
+            plural=plural,
+            language=language,
+            post_1990_orthographe=post_1990_orthographe,
+            use_non_breaking_spaces=use_non_breaking_spaces,
+        ),
+    }
+
+    letters = f"{separator!r}.join(words)"
+    under_one_thousand = "LAST_GROUPS[value]"
+
+    if compiled_mode == "ordinal_nominal":
+        namespace["make_ordinal"] = make_ordinal
+        namespace["ORDINAL_GROUPS"] = tuple(
+            make_ordinal(letters, gender=gender, plural=plural)
+            for letters in groups
+        )
+        under_one_thousand = "ORDINAL_GROUPS[value]"
+        letters = (
+            f"make_ordinal({letters}, gender={gender!r}, plural={plural!r})"
+        )
+
+    name = "letters_{}_{}_{}{}{}{}".format(
+        language,
+        compiled_mode,
+        "f" if gender in VALID_FEMININE else "m",
+        "p" if plural else "s",
+        "_1990" if post_1990_orthographe else "",
+        "_nbsp" if use_non_breaking_spaces else "",
+    )
+    source = SOURCE_TEMPLATE.format(
+        name=name, under_one_thousand=under_one_thousand, letters=letters
+    )
+    exec(compile(source, f"<compiled {name}>", "exec"), namespace)
+
+    converter = namespace[name]
+    converter.__doc__ = f"Convert a number to letters ({options})."
+    converter.source = source
+    return converter
+
+
+@functools.lru_cache(maxsize=None)
+def compile_currency_converter(
+    currency: str = "EUR",
+    language: str = "fr_BE",
+    post_1990_orthographe: bool = True,
+    use_non_breaking_spaces: bool = True,
+) -> Callable[[Any], str]:
+    """Get a converter of the amounts in a currency (cached).
+
+    The forms of the currency and the letters of the cents are resolved
+    once, the units are written by the converter of the cardinal mode.
+
+    Raises:
+        ValueError: If the currency or the language is not supported.
+
+    Returns:
+        Callable[[Any], str]: The converter, which returns the same
+        letters as make_letters in the mode of the currency.
+    """
+    if currency not in CURRENCY_FORMS_FR:
+        raise ValueError(f"Invalid currency ({currency = })")
+
+    cardinal = compile_converter(
+        language=language,
+        post_1990_orthographe=post_1990_orthographe,
+        use_non_breaking_spaces=use_non_breaking_spaces,
+    )
+    fallback = functools.partial(
+        make_letters,
+        mode=currency,
+        language=language,
+        post_1990_orthographe=post_1990_orthographe,
+        use_non_breaking_spaces=use_non_breaking_spaces,
+    )
+    space = "\xa0" if use_non_breaking_spaces else " "
+
+    (unit, units), (cent, cents) = CURRENCY_FORMS_FR[currency]
+    # "un million d'euros", "un million de dollars"
+    elision = space + ("d'" if unit.startswith(tuple("aeiouy")) else "de")
+    if not elision.endswith("'"):
+        elision += space
+
+    and_ = space + "et" + space
+    cents_letters = tuple(
+        cardinal(value) + space + (cents if value > 1 else cent)
+        for value in range(100)
+    )
+
+    def converter(number: Any) -> str:
+        if type(number) is int and 0 <= number < MAX_EXACT_INTEGER:
+            digits, decimals = str(number), None
+
+        else:
+            match = None
+            if type(number) is str and len(number) <= MAX_INTEGER_DIGITS:
+                match = AMOUNT_PATTERN.fullmatch(number)
+
+            if match is None:
+                return fallback(number)
+
+            digits, decimals = match.groups()
+
+        # "5" is 50 cents, under one unit only the cents are written
+        if decimals is not None and digits == "0":
+            return cents_letters[int(decimals.ljust(2, "0"))]
+
+        if digits.endswith("000000"):
+            letters = cardinal(digits) + elision + units
+
+        else:
+            letters = (
+                cardinal(digits)
+                + space
+                + (unit if digits in ("0", "1") else units)
+            )
+
+        if decimals is None:
+            return letters
+
+        return letters + and_ + cents_letters[int(decimals.ljust(2, "0"))]
+
+    converter.__doc__ = (
+        f"Convert an amount to letters ({currency = }, {language = }, "
+        f"{post_1990_orthographe = }, {use_non_breaking_spaces = })."
+    )
+    return converter
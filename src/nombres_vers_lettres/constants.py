@@ -158,5 +158,50 @@ BIG_NUMBERS_BY_RANK = {
     63: "décilliard",
 }
 
+# Modes of make_letters (in addition to the currency codes)
+MODES = (
+    "cardinal",
+    "cardinal_nominal",
+    "ordinal_adjectival",
+    "ordinal",
+    "ordinal_nominal",
+)
+
+# Months of the dates (see nombres_vers_lettres.dates)
+MONTHS_FR = (
+    "janvier",
+    "février",
+    "mars",
+    "avril",
+    "mai",
+    "juin",
+    "juillet",
+    "août",
+    "septembre",
+    "octobre",
+    "novembre",
+    "décembre",
+)
+
 VALID_FEMININE = ("feminine", "féminin", "feminin", "f")
 VALID_MASCULINE = ("masculine", "masculin", "m")
+
+# Error codes (see ConversionError)
+ERROR_EMPTY_INPUT = "empty_input"
+ERROR_INVALID_NUMBER = "invalid_number"
+ERROR_TOO_MANY_SEPARATORS = "too_many_separators"
+ERROR_MISPLACED_SIGN = "misplaced_sign"
+ERROR_NOT_AN_INTEGER = "not_an_integer"
+ERROR_RANK_OUT_OF_RANGE = "rank_out_of_range"
+ERROR_INVALID_MODE = "invalid_mode"
+ERROR_INVALID_LANGUAGE = "invalid_language"
+ERROR_INVALID_REQUEST = "invalid_request"
+ERROR_INPUT_TOO_LONG = "input_too_long"
+ERROR_OUTPUT_TOO_LONG = "output_too_long"
+ERROR_INVALID_RECORD = "invalid_record"
+
+# Digits which can be written in letters
+# (up to "décilliard" for the integer part and "décilliardième" for the
+# decimal part)
+MAX_INTEGER_DIGITS = 66
+MAX_DECIMAL_DIGITS = 63
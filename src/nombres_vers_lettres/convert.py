@@ -0,0 +1,371 @@
+"""Convert columns of CSV and JSON Lines files to letters.
+
+The input file is split in byte-range shards aligned on line boundaries.
+Each shard is read through ``mmap`` by a worker process and written to a
+temporary file, the temporary files are then merged in order.
+
+A CSV file with quoted fields (which may hold new lines) is converted
+in a single shard. A JSON Lines record which is not an object (or a line
+which is not JSON) is written as an error record (with the "record",
+"error" and "message" keys).
+"""
+
+import csv
+import io
+import json
+import mmap
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, NamedTuple
+
+from nombres_vers_lettres.constants import (
+    AVAILABLE_LANGUAGES,
+    ERROR_INVALID_RECORD,
+)
+from nombres_vers_lettres.make_letters import make_letters
+
+FILE_FORMATS = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+}
+
+# Under this size, the file is converted in the current process
+MIN_SHARD_SIZE = 1 << 20
+
+
+class ColumnSpec(NamedTuple):
+    """A column to convert (source column, new column and options)."""
+
+    source: str
+    target: str
+    options: dict[str, Any]
+
+
+def parse_column_spec(
+    spec: str, suffix: str = "_lettres", **default_options: Any
+) -> ColumnSpec:
+    """Parse a column specification.
+
+    The specification is ``column[:mode[:language]]``, where the mode can
+    be any make_letters mode, including currency codes (e.g.,
+    ``amount:EUR:fr_FR`` or ``rank:ordinal_nominal``).
+
+    Args:
+        spec (str): The column specification.
+        suffix (str, optional): The suffix of the new column.
+        Defaults to "_lettres".
+        **default_options: The make_letters options of the column.
+
+    Raises:
+        ValueError: If the specification is invalid.
+
+    Returns:
+        ColumnSpec: The column to convert.
+    """
+    source, *parts = spec.split(":")
+
+    if source == "" or len(parts) > 2:
+        raise ValueError(
+            f"Invalid column specification ({spec = }), "
+            "expected column[:mode[:language]]"
+        )
+
+    options = dict(default_options)
+
+    if len(parts) > 0 and parts[0]:
+        options["mode"] = parts[0]
+
+    if len(parts) > 1 and parts[1]:
+        if parts[1] not in AVAILABLE_LANGUAGES:
+            raise ValueError(
+                f"Invalid language ({parts[1]}) in column specification "
+                f"({spec = })"
+            )
+        options["language"] = parts[1]
+
+    return ColumnSpec(source, source + suffix, options)
+
+
+def detect_file_format(path: str) -> str:
+    """Detect the file format (csv or jsonl) from the file extension.
+
+    Args:
+        path (str): The path of the file.
+
+    Raises:
+        ValueError: If the extension is unknown.
+
+    Returns:
+        str: The file format.
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    try:
+        return FILE_FORMATS[extension]
+
+    except KeyError as exception:
+        raise ValueError(
+            f"Unknown file format ({extension = }), "
+            "use a .csv or .jsonl file or set the format explicitly"
+        ) from exception
+
+
+def _letters_or_none(value: Any, options: dict[str, Any]) -> str | None:
+    """Convert a value to letters, None and invalid values give None."""
+    if value is None or value == "":
+        return None
+
+    try:
+        return make_letters(value, **options)
+
+    except (ValueError, TypeError, ArithmeticError):
+        return None
+
+
+def _convert_csv_lines(
+    text: str,
+    columns: list[ColumnSpec],
+    header: list[str],
+    delimiter: str,
+) -> str:
+    """Convert the CSV records of a shard."""
+    indices = [header.index(column.source) for column in columns]
+
+    output = io.StringIO()
+    writer = csv.writer(output, delimiter=delimiter, lineterminator="\n")
+
+    for row in csv.reader(io.StringIO(text), delimiter=delimiter):
+        if not row:
+            continue
+
+        new_values = []
+        for index, column in zip(indices, columns):
+            value = row[index] if index < len(row) else None
+            letters = _letters_or_none(value, column.options)
+            new_values.append("" if letters is None else letters)
+
+        writer.writerow(row + new_values)
+
+    return output.getvalue()
+
+
+def _convert_jsonl_lines(text: str, columns: list[ColumnSpec]) -> str:
+    """Convert the JSON Lines records of a shard."""
+    output = []
+
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+
+        try:
+            record = json.loads(line)
+
+        except json.JSONDecodeError as exception:
+            record = {
+                "record": line,
+                "error": ERROR_INVALID_RECORD,
+                "message": f"Invalid record ({exception})",
+            }
+            output.append(json.dumps(record, ensure_ascii=False) + "\n")
+            continue
+
+        if not isinstance(record, dict):
+            record = {
+                "record": record,
+                "error": ERROR_INVALID_RECORD,
+                "message": "Invalid record (expected a JSON object)",
+            }
+            output.append(json.dumps(record, ensure_ascii=False) + "\n")
+            continue
+
+        for column in columns:
+            record[column.target] = _letters_or_none(
+                record.get(column.source), column.options
+            )
+
+        output.append(json.dumps(record, ensure_ascii=False) + "\n")
+
+    return "".join(output)
+
+
+def _convert_shard(
+    input_path: str,
+    start: int,
+    end: int,
+    shard_path: str,
+    file_format: str,
+    columns: list[ColumnSpec],
+    header: list[str],
+    delimiter: str,
+) -> str:
+    """Convert the records between the start and end bytes of a file.
+
+    Returns:
+        str: The path of the converted shard.
+    """
+    with open(input_path, "rb") as input_file:
+        with mmap.mmap(
+            input_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as input_map:
+            text = input_map[start:end].decode("utf-8")
+
+    if file_format == "csv":
+        converted = _convert_csv_lines(text, columns, header, delimiter)
+
+    else:
+        converted = _convert_jsonl_lines(text, columns)
+
+    with open(shard_path, "w", encoding="utf-8", newline="") as shard_file:
+        shard_file.write(converted)
+
+    return shard_path
+
+
+def shard_boundaries(
+    input_map: mmap.mmap | bytes, start: int, shards: int
+) -> list[tuple[int, int]]:
+    """Split a byte range in shards aligned on line boundaries.
+
+    Args:
+        input_map (mmap.mmap | bytes): The content of the file.
+        start (int): The first byte of the first record.
+        shards (int): The number of shards.
+
+    Returns:
+        list[tuple[int, int]]: The (start, end) bytes of the non-empty
+        shards.
+    """
+    size = len(input_map)
+    shard_size = max(1, -(-(size - start) // max(1, shards)))
+
+    boundaries = []
+    while start < size:
+        end = min(size, start + shard_size)
+
+        # Extend the shard up to the end of its last line
+        if end < size:
+            new_line = input_map.find(b"\n", end - 1)
+            end = size if new_line == -1 else new_line + 1
+
+        boundaries.append((start, end))
+        start = end
+
+    return boundaries
+
+
+def convert_file(
+    input_path: str,
+    output_path: str,
+    columns: list[ColumnSpec],
+    file_format: str | None = None,
+    workers: int | None = None,
+    delimiter: str = ",",
+    min_shard_size: int = MIN_SHARD_SIZE,
+) -> None:
+    """Add converted columns to a CSV or a JSON Lines file.
+
+    Args:
+        input_path (str): The path of the input file.
+        output_path (str): The path of the output file.
+        columns (list[ColumnSpec]): The columns to convert.
+        file_format (str | None, optional): "csv" or "jsonl", detected from
+        the extension of the input file if None. Defaults to None.
+        workers (int | None, optional): The number of worker processes.
+        Defaults to the number of CPUs.
+        delimiter (str, optional): The CSV delimiter. Defaults to ",".
+        min_shard_size (int, optional): The minimal size of a shard in
+        bytes. Defaults to MIN_SHARD_SIZE.
+
+    Raises:
+        ValueError: If the file format or a CSV column is invalid.
+    """
+    if file_format is None:
+        file_format = detect_file_format(input_path)
+
+    if file_format not in FILE_FORMATS.values():
+        raise ValueError(f"Invalid file format ({file_format = })")
+
+    workers = workers or os.cpu_count() or 1
+
+    with open(input_path, "rb") as input_file:
+        size = os.fstat(input_file.fileno()).st_size
+        header_line = b""
+        boundaries: list[tuple[int, int]] = []
+
+        if size > 0:
+            with mmap.mmap(
+                input_file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as input_map:
+                data_start = 0
+
+                if file_format == "csv":
+                    new_line = input_map.find(b"\n")
+                    data_start = size if new_line == -1 else new_line + 1
+                    header_line = input_map[:data_start]
+
+                shards = min(workers, max(1, size // max(1, min_shard_size)))
+
+                # A quoted field may hold a new line, which the shards
+                # cannot split on
+                if file_format == "csv" and input_map.find(b'"') != -1:
+                    shards = 1
+
+                boundaries = shard_boundaries(input_map, data_start, shards)
+
+    header: list[str] = []
+    if file_format == "csv":
+        header = next(
+            csv.reader(
+                io.StringIO(header_line.decode("utf-8")), delimiter=delimiter
+            ),
+            [],
+        )
+        missing = [
+            column.source for column in columns if column.source not in header
+        ]
+        if missing:
+            raise ValueError(f"Unknown CSV columns: {', '.join(missing)}")
+
+    output_directory = os.path.dirname(os.path.abspath(output_path))
+    with tempfile.TemporaryDirectory(dir=output_directory) as directory:
+        arguments = [
+            (
+                input_path,
+                start,
+                end,
+                os.path.join(directory, f"shard_{index:06d}"),
+                file_format,
+                columns,
+                header,
+                delimiter,
+            )
+            for index, (start, end) in enumerate(boundaries)
+        ]
+
+        if len(arguments) > 1 and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                shard_paths = list(
+                    executor.map(_convert_shard, *zip(*arguments))
+                )
+
+        else:
+            shard_paths = [
+                _convert_shard(*shard_arguments)
+                for shard_arguments in arguments
+            ]
+
+        # Merge the shards in order
+        with open(
+            output_path, "w", encoding="utf-8", newline=""
+        ) as output_file:
+            if file_format == "csv":
+                csv.writer(
+                    output_file, delimiter=delimiter, lineterminator="\n"
+                ).writerow(header + [column.target for column in columns])
+
+            for shard_path in shard_paths:
+                with open(shard_path, encoding="utf-8", newline="") as shard:
+                    shutil.copyfileobj(shard, output_file)
@@ -0,0 +1,206 @@
+"""Local daemon answering conversions on a Unix domain socket.
+
+The daemon speaks the JSON Lines protocol (see
+nombres_vers_lettres.protocol): each connection sends one request per
+line and receives one response per line. Start it with:
+
+    python -m nombres_vers_lettres serve --unix /run/nvl.sock
+
+The ``nvl-client`` entry point sends its arguments to the daemon and
+converts the number itself when the daemon is not running. Shell scripts
+can also talk to the daemon directly (e.g., with socat).
+"""
+
+import getpass
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import tempfile
+import threading
+from typing import Any
+
+from nombres_vers_lettres.protocol import handle_line
+
+# The socket of the daemon, unless set otherwise
+SOCKET_ENVIRONMENT_VARIABLE = "NVL_SOCKET"
+SOCKET_NAME = "nombres_vers_lettres.sock"
+
+# Timeout of the client requests, in seconds
+CLIENT_TIMEOUT = 5.0
+
+
+def _user_socket_path() -> str:
+    """Get the path of the socket in a directory of the current user.
+
+    The runtime directory of the user ($XDG_RUNTIME_DIR) is only
+    accessible to the user. Otherwise, the socket is in the temporary
+    directory, with the user ID in its name.
+    """
+    runtime_directory = os.environ.get("XDG_RUNTIME_DIR")
+
+    if runtime_directory:
+        return os.path.join(runtime_directory, SOCKET_NAME)
+
+    name, extension = os.path.splitext(SOCKET_NAME)
+    user = os.getuid() if hasattr(os, "getuid") else getpass.getuser()
+    return os.path.join(tempfile.gettempdir(), f"{name}-{user}{extension}")
+
+
+def default_socket_path() -> str:
+    """Get the path of the socket of the daemon (NVL_SOCKET or default)."""
+    return os.environ.get(SOCKET_ENVIRONMENT_VARIABLE) or _user_socket_path()
+
+
+def _owned_by_another_user(path: str) -> bool:
+    """Check if a socket was created by another user."""
+    if not hasattr(os, "getuid"):
+        return False
+
+    try:
+        return os.stat(path).st_uid != os.getuid()
+
+    except OSError:
+        return False
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answer the requests of a connection, one per line."""
+
+    def handle(self):
+        for line in self.rfile:
+            if line.strip():
+                self.wfile.write(handle_line(line))
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+
+    class LettersServer(socketserver.ThreadingUnixStreamServer):
+        """Threaded server of the conversions on a Unix domain socket."""
+
+        daemon_threads = True
+
+        def __init__(self, path: str):
+            _remove_stale_socket(path)
+            super().__init__(path, _RequestHandler)
+
+        def server_close(self):
+            super().server_close()
+
+            try:
+                os.unlink(self.server_address)
+
+            except OSError:
+                pass
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Remove the socket file of a daemon which is not running anymore.
+
+    Raises:
+        OSError: If the path is not a socket or if a daemon is running.
+    """
+    try:
+        mode = os.stat(path).st_mode
+
+    except FileNotFoundError:
+        return
+
+    if not stat.S_ISSOCK(mode):
+        raise OSError(f"Not a socket ({path})")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(path)
+
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(path)
+            return
+
+    raise OSError(f"A daemon is already running ({path})")
+
+
+def _interrupt(signal_number: int, frame: Any) -> None:
+    """Stop the daemon (SIGTERM handler)."""
+    raise KeyboardInterrupt
+
+
+def serve_unix(path: str | None = None) -> None:
+    """Answer the conversions on a Unix domain socket until interrupted.
+
+    Args:
+        path (str | None, optional): The path of the socket.
+        Defaults to default_socket_path().
+
+    Raises:
+        OSError: If the socket cannot be created (e.g., a daemon is
+        already running or Unix domain sockets are not supported).
+    """
+    if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+        raise OSError("Unix domain sockets are not supported")
+
+    if threading.current_thread() is threading.main_thread():
+        # Also remove the socket file when the daemon is terminated
+        signal.signal(signal.SIGTERM, _interrupt)
+
+    with LettersServer(path or default_socket_path()) as server:
+        try:
+            server.serve_forever()
+
+        except KeyboardInterrupt:
+            pass
+
+
+def request_daemon(
+    request: dict[str, Any],
+    path: str | None = None,
+    timeout: float = CLIENT_TIMEOUT,
+) -> dict[str, Any] | None:
+    """Send a request to the daemon.
+
+    Args:
+        request (dict[str, Any]): The request (see handle_request).
+        path (str | None, optional): The path of the socket.
+        Defaults to default_socket_path().
+        timeout (float, optional): The timeout in seconds.
+        Defaults to CLIENT_TIMEOUT.
+
+    Returns:
+        dict[str, Any] | None: The response, None if the daemon is not
+        running (or if the default socket belongs to another user).
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    if path is None:
+        path = default_socket_path()
+
+        # The default socket can be in a shared temporary directory,
+        # where another user could answer in place of the daemon
+        if _owned_by_another_user(path):
+            return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(path)
+            client.sendall(
+                json.dumps(request, ensure_ascii=False).encode("utf-8")
+                + b"\n"
+            )
+
+            response = b""
+            while not response.endswith(b"\n"):
+                block = client.recv(4096)
+
+                if not block:
+                    return None
+
+                response += block
+
+    except OSError:
+        return None
+
+    return json.loads(response)
@@ -0,0 +1,243 @@
+"""Dates and times written in letters.
+
+make_date_letters() writes a date (e.g., "le vingt et un mars deux mille
+vingt-six") and make_time_letters() a time (e.g., "quatorze heures
+trente"). The letters of the days (with "premier"), of the months, of the
+years of a window, of the hours and of the minutes are precomputed once
+per configuration (see compile_date_converter and
+compile_time_converter), so that a date or a time only costs a few
+lookups. The numbers are written by the converters of
+nombres_vers_lettres.compiler, with the rules of the language.
+"""
+
+import datetime
+import functools
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from nombres_vers_lettres.compiler import compile_converter
+from nombres_vers_lettres.constants import ERROR_INVALID_NUMBER, MONTHS_FR
+from nombres_vers_lettres.make_letters import ConversionError
+
+# The years precomputed by default (first and last, included)
+DEFAULT_YEAR_WINDOW = (1800, 2199)
+
+
+@functools.lru_cache(maxsize=None)
+def compile_date_converter(
+    article: bool = True,
+    language: str = "fr_BE",
+    post_1990_orthographe: bool = True,
+    use_non_breaking_spaces: bool = True,
+    years: tuple[int, int] = DEFAULT_YEAR_WINDOW,
+) -> Callable[[datetime.date], str]:
+    """Precompute the letters of the dates for a configuration (cached).
+
+    Args:
+        article (bool, optional): If True, the date starts with "le".
+        Defaults to True.
+        years (tuple[int, int], optional): The first and the last years
+        precomputed, the other years are converted on each call.
+        Defaults to DEFAULT_YEAR_WINDOW.
+        The other arguments are the options of make_letters.
+
+    Raises:
+        ValueError: If the language or the years are invalid.
+
+    Returns:
+        Callable[[datetime.date], str]: The converter of the dates.
+    """
+    first_year, last_year = years
+
+    if first_year > last_year:
+        raise ValueError(f"Invalid years ({years = }), expected first, last")
+
+    cardinal = compile_converter(
+        "cardinal",
+        language=language,
+        post_1990_orthographe=post_1990_orthographe,
+        use_non_breaking_spaces=use_non_breaking_spaces,
+    )
+    space = "\xa0" if use_non_breaking_spaces else " "
+    prefix = f"le{space}" if article else ""
+
+    # The day, the month and the spaces before the year
+    days = ("",) + tuple(
+        prefix + ("premier" if day == 1 else cardinal(day)) + space
+        for day in range(1, 32)
+    )
+    months = tuple(month + space for month in MONTHS_FR)
+    year_letters = tuple(
+        cardinal(year) for year in range(first_year, last_year + 1)
+    )
+
+    def convert(date: datetime.date) -> str:
+        year = date.year
+
+        if first_year <= year <= last_year:
+            letters = year_letters[year - first_year]
+
+        else:
+            letters = cardinal(year)
+
+        return days[date.day] + months[date.month - 1] + letters
+
+    return convert
+
+
+@functools.lru_cache(maxsize=None)
+def compile_time_converter(
+    minute_unit: bool = False,
+    language: str = "fr_BE",
+    post_1990_orthographe: bool = True,
+    use_non_breaking_spaces: bool = True,
+) -> Callable[[datetime.time], str]:
+    """Precompute the letters of the times for a configuration (cached).
+
+    Args:
+        minute_unit (bool, optional): If True, the minutes are followed by
+        "minute" or "minutes". Defaults to False.
+        The other arguments are the options of make_letters.
+
+    Raises:
+        ValueError: If the language is invalid.
+
+    Returns:
+        Callable[[datetime.time], str]: The converter of the times.
+    """
+    # "une heure", "vingt et une minutes"
+    cardinal = compile_converter(
+        "cardinal",
+        gender="feminine",
+        language=language,
+        post_1990_orthographe=post_1990_orthographe,
+        use_non_breaking_spaces=use_non_breaking_spaces,
+    )
+    space = "\xa0" if use_non_breaking_spaces else " "
+
+    hours = tuple(
+        cardinal(hour) + space + ("heure" if hour < 2 else "heures")
+        for hour in range(24)
+    )
+    units = [""] * 60
+
+    if minute_unit:
+        units = [space + "minute"] * 2 + [space + "minutes"] * 58
+
+    # Nothing after the hours for the round hours
+    minutes = ("",) + tuple(
+        space + cardinal(minute) + units[minute] for minute in range(1, 60)
+    )
+
+    def convert(time: datetime.time) -> str:
+        return hours[time.hour] + minutes[time.minute]
+
+    return convert
+
+
+def _convert_values(
+    values: Any, value_types: tuple[type, ...], convert: Callable[[Any], str]
+) -> str | list[str]:
+    """Convert a value or each value of an array.
+
+    Raises:
+        ConversionError: If a value is not of the value types.
+    """
+    if isinstance(values, value_types):
+        return convert(values)
+
+    if isinstance(values, (str, bytes)) or not isinstance(values, Iterable):
+        raise ConversionError(
+            ERROR_INVALID_NUMBER,
+            f"Invalid value: {values!r} (expected "
+            f"{' or '.join(value_type.__name__ for value_type in value_types)}"
+            " or an array of them)",
+        )
+
+    # The arrays of numpy or pandas give datetime objects with tolist()
+    if hasattr(values, "tolist"):
+        values = values.tolist()
+
+    letters = []
+
+    for value in values:
+        if not isinstance(value, value_types):
+            raise ConversionError(
+                ERROR_INVALID_NUMBER, f"Invalid value in array: {value!r}"
+            )
+
+        letters.append(convert(value))
+
+    return letters
+
+
+def make_date_letters(
+    date: datetime.date | Iterable[datetime.date],
+    article: bool = True,
+    language: str = "fr_BE",
+    post_1990_orthographe: bool = True,
+    use_non_breaking_spaces: bool = True,
+    years: tuple[int, int] = DEFAULT_YEAR_WINDOW,
+) -> str | list[str]:
+    """Write a date in letters (e.g., "le premier mars deux mille vingt").
+
+    Args:
+        date (datetime.date | Iterable[datetime.date]): The date (or a
+        datetime, whose time is ignored), or an array of dates.
+        The other arguments are those of compile_date_converter.
+
+    Raises:
+        ConversionError: If a date is not a date.
+        ValueError: If the language or the years are invalid.
+
+    Returns:
+        str | list[str]: The date in letters, or the list of the dates in
+        letters for an array.
+    """
+    return _convert_values(
+        date,
+        (datetime.date,),
+        compile_date_converter(
+            article=article,
+            language=language,
+            post_1990_orthographe=post_1990_orthographe,
+            use_non_breaking_spaces=use_non_breaking_spaces,
+            years=tuple(years),
+        ),
+    )
+
+
+def make_time_letters(
+    time: datetime.time | datetime.datetime | Iterable[datetime.time],
+    minute_unit: bool = False,
+    language: str = "fr_BE",
+    post_1990_orthographe: bool = True,
+    use_non_breaking_spaces: bool = True,
+) -> str | list[str]:
+    """Write a time in letters (e.g., "quatorze heures trente").
+
+    The seconds are ignored.
+
+    Args:
+        time (datetime.time | datetime.datetime | Iterable[datetime.time]):
+        The time (or a datetime), or an array of times.
+        The other arguments are those of compile_time_converter.
+
+    Raises:
+        ConversionError: If a time is not a time.
+        ValueError: If the language is invalid.
+
+    Returns:
+        str | list[str]: The time in letters, or the list of the times in
+        letters for an array.
+    """
+    return _convert_values(
+        time,
+        (datetime.time, datetime.datetime),
+        compile_time_converter(
+            minute_unit=minute_unit,
+            language=language,
+            post_1990_orthographe=post_1990_orthographe,
+            use_non_breaking_spaces=use_non_breaking_spaces,
+        ),
+    )
@@ -0,0 +1,344 @@
+"""Export aligned (number, letters) datasets.
+
+export_dataset() writes the letters of every number of a range, for
+several modes and languages, in shards generated by worker processes:
+
+- the boundaries of the shards only depend on the range and the number
+  of shards;
+- each shard is written to ``<shard>.part`` and renamed when complete,
+  so that an interrupted export is resumed by running it again (the
+  complete shards are skipped);
+- the letters of consecutive numbers are generated incrementally: the
+  numbers from k * 1000 to k * 1000 + 999 share the letters of their
+  thousands, so each block of a thousand numbers only needs two calls
+  of make_letters.
+
+A JSON Lines record is ``{"number": 21, "mode": "cardinal", "language":
+"fr_BE", "letters": "vingt et un"}``, a TSV line holds the number, the
+mode, the language and the letters (without header).
+"""
+
+import json
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from nombres_vers_lettres.artifact import library_version
+from nombres_vers_lettres.compiler import COMPILED_MODES
+from nombres_vers_lettres.constants import LANGUAGES_DECADES
+from nombres_vers_lettres.make_letters import make_letters
+
+EXPORT_FORMATS = ("jsonl", "tsv")
+
+# The description of an export, to resume it with the same parameters
+MANIFEST_NAME = "manifest.json"
+
+# Number of records written at once
+WRITE_CHUNK_SIZE = 1_000
+
+
+def parse_range(spec: str) -> tuple[int, int]:
+    """Parse a range of numbers given as ``start:stop`` (stop excluded).
+
+    Raises:
+        ValueError: If the range is invalid or empty.
+
+    Returns:
+        tuple[int, int]: The start and the stop of the range.
+    """
+    try:
+        start, stop = (int(bound) for bound in spec.split(":"))
+
+    except ValueError as exception:
+        raise ValueError(
+            f"Invalid range ({spec = }), expected start:stop"
+        ) from exception
+
+    if start >= stop:
+        raise ValueError(f"Empty range ({spec = })")
+
+    return start, stop
+
+
+def shard_ranges(start: int, stop: int, shards: int) -> list[tuple[int, int]]:
+    """Split a range of numbers in shards of (nearly) the same size.
+
+    Args:
+        start (int): The first number.
+        stop (int): The number after the last one.
+        shards (int): The number of shards.
+
+    Returns:
+        list[tuple[int, int]]: The (start, stop) of the non-empty shards.
+    """
+    size = stop - start
+    shards = max(1, min(shards, size))
+
+    return [
+        (start + index * size // shards, start + (index + 1) * size // shards)
+        for index in range(shards)
+    ]
+
+
+def iter_letters(
+    start: int,
+    stop: int,
+    mode: str = "cardinal",
+    gender: str = "masculin",
+    plural: bool = False,
+    language: str = "fr_BE",
+    post_1990_orthographe: bool = True,
+    use_non_breaking_spaces: bool = True,
+) -> Iterator[str]:
+    """Generate the letters of the numbers of a range.
+
+    The letters are the letters of make_letters (of the numbers as
+    strings, so that the big numbers are exact).
+
+    Args:
+        start (int): The first number.
+        stop (int): The number after the last one.
+        The other arguments are the options of make_letters.
+
+    Raises:
+        ValueError: If the options are invalid.
+
+    Yields:
+        str: The letters of each number.
+    """
+    def letters(number: int) -> str:
+        return make_letters(
+            str(number),
+            mode=mode,
+            gender=gender,
+            plural=plural,
+            language=language,
+            post_1990_orthographe=post_1990_orthographe,
+            use_non_breaking_spaces=use_non_breaking_spaces,
+        )
+
+    # Raise the errors of the options before the first number
+    letters(1000)
+
+    if mode not in COMPILED_MODES:
+        # The currencies write the unit after the number
+        for number in range(start, stop):
+            yield letters(number)
+
+        return
+
+    # The numbers under one thousand (and the negative numbers)
+    number = start
+    while number < min(stop, 1000):
+        yield letters(number)
+        number += 1
+
+    if number >= stop:
+        return
+
+    # The letters of the last three digits, as written after "mille"
+    space = "\xa0" if use_non_breaking_spaces else " "
+    head = len("mille" + ("-" if post_1990_orthographe else space))
+    suffixes = [""] + [letters(1000 + low)[head:] for low in range(1, 1000)]
+
+    while number < stop:
+        block, low = divmod(number, 1000)
+        end = min(stop, (block + 1) * 1000) - block * 1000
+
+        if low == 0:
+            yield letters(number)
+            low = 1
+
+        if low < end:
+            first = letters(block * 1000 + low)
+            yield first
+
+            prefix = first[:len(first) - len(suffixes[low])]
+            for low in range(low + 1, end):
+                yield prefix + suffixes[low]
+
+        number = block * 1000 + end
+
+
+def _variants(
+    modes: Iterable[str], languages: Iterable[str]
+) -> list[tuple[str, str]]:
+    """Get the (mode, language) variants of an export."""
+    return [(mode, language) for mode in modes for language in languages]
+
+
+def _shard_name(index: int, shards: int, file_format: str) -> str:
+    """Get the file name of a shard."""
+    return f"part-{index:05d}-of-{shards:05d}.{file_format}"
+
+
+def _write_shard(
+    path: str,
+    start: int,
+    stop: int,
+    variants: list[tuple[str, str]],
+    file_format: str,
+    options: dict[str, Any],
+) -> str:
+    """Write the records of a shard (to a .part file renamed at the end).
+
+    Returns:
+        str: The path of the shard.
+    """
+    generators = [
+        iter_letters(start, stop, mode=mode, language=language, **options)
+        for mode, language in variants
+    ]
+
+    # The letters hold no quote, backslash or tab, they are written as is
+    if file_format == "jsonl":
+        templates = [
+            '{"number": %d, '
+            + f'"mode": {json.dumps(mode)}, '
+            + f'"language": {json.dumps(language)}, '
+            + '"letters": "%s"}\n'
+            for mode, language in variants
+        ]
+
+    else:
+        templates = [
+            "%d\t" + f"{mode}\t{language}\t" + "%s\n"
+            for mode, language in variants
+        ]
+
+    part_path = path + ".part"
+    with open(part_path, "w", encoding="utf-8", newline="") as shard_file:
+        for chunk_start in range(start, stop, WRITE_CHUNK_SIZE):
+            chunk_stop = min(stop, chunk_start + WRITE_CHUNK_SIZE)
+            columns = [
+                [next(generator) for _ in range(chunk_stop - chunk_start)]
+                for generator in generators
+            ]
+            shard_file.writelines(
+                template % (number, column[offset])
+                for offset, number in enumerate(range(chunk_start, chunk_stop))
+                for template, column in zip(templates, columns)
+            )
+
+        shard_file.flush()
+        os.fsync(shard_file.fileno())
+
+    os.replace(part_path, path)
+    return path
+
+
+def export_dataset(
+    directory: str,
+    start: int,
+    stop: int,
+    modes: Iterable[str] = ("cardinal",),
+    languages: Iterable[str] = ("fr_BE",),
+    shards: int | None = None,
+    file_format: str = "jsonl",
+    workers: int | None = None,
+    post_1990_orthographe: bool = False,
+    use_non_breaking_spaces: bool = False,
+) -> list[str]:
+    """Export the letters of the numbers of a range, in shards.
+
+    The shards already written by a previous export with the same
+    parameters are kept (see MANIFEST_NAME).
+
+    Args:
+        directory (str): The directory of the shards (created if needed).
+        start (int): The first number.
+        stop (int): The number after the last one.
+        modes (Iterable[str], optional): Defaults to ("cardinal",).
+        languages (Iterable[str], optional): Defaults to ("fr_BE",).
+        shards (int | None, optional): The number of shards. Defaults to
+        the number of workers.
+        file_format (str, optional): "jsonl" or "tsv". Defaults to "jsonl".
+        workers (int | None, optional): The number of worker processes.
+        Defaults to the number of CPUs.
+        post_1990_orthographe (bool, optional): Defaults to False.
+        use_non_breaking_spaces (bool, optional): Defaults to False.
+
+    Raises:
+        ValueError: If a parameter is invalid or if the directory holds an
+        export with other parameters.
+
+    Returns:
+        list[str]: The paths of the shards, in the order of the numbers.
+    """
+    modes = list(modes)
+    languages = list(languages)
+
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f"Invalid file format ({file_format = })")
+
+    if start >= stop:
+        raise ValueError(f"Empty range ({start = }, {stop = })")
+
+    for language in languages:
+        if language not in LANGUAGES_DECADES:
+            raise ValueError(f"Invalid language ({language = })")
+
+    options: dict[str, Any] = {
+        "post_1990_orthographe": post_1990_orthographe,
+        "use_non_breaking_spaces": use_non_breaking_spaces,
+    }
+    variants = _variants(modes, languages)
+    for mode, language in variants:
+        # Raise the errors of the modes before any work
+        make_letters(
+            0,
+            mode=mode,
+            language=language,
+            post_1990_orthographe=post_1990_orthographe,
+            use_non_breaking_spaces=use_non_breaking_spaces,
+        )
+
+    workers = workers or os.cpu_count() or 1
+    ranges = shard_ranges(start, stop, shards or workers)
+
+    manifest = {
+        "range": [start, stop],
+        "shards": len(ranges),
+        "modes": modes,
+        "languages": languages,
+        "format": file_format,
+        **options,
+        "version": library_version(),
+    }
+
+    os.makedirs(directory, exist_ok=True)
+    manifest_path = os.path.join(directory, MANIFEST_NAME)
+
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as manifest_file:
+            if json.load(manifest_file) != manifest:
+                raise ValueError(
+                    f"The directory ({directory}) holds another export, "
+                    "use an empty directory"
+                )
+
+    else:
+        with open(manifest_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(manifest, manifest_file, indent=2)
+
+    paths = [
+        os.path.join(directory, _shard_name(index, len(ranges), file_format))
+        for index in range(len(ranges))
+    ]
+    arguments = [
+        (path, shard_start, shard_stop, variants, file_format, options)
+        for path, (shard_start, shard_stop) in zip(paths, ranges)
+        if not os.path.exists(path)
+    ]
+
+    if len(arguments) > 1 and workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Consume the results to raise the errors of the workers
+            list(executor.map(_write_shard, *zip(*arguments)))
+
+    else:
+        for shard_arguments in arguments:
+            _write_shard(*shard_arguments)
+
+    return paths
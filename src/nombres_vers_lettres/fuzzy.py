@@ -0,0 +1,606 @@
+"""Read numbers written in letters, even misspelled (e.g., by an OCR).
+
+fuzzy_parse() maps a text such as "quatre vingt dix neut" or "deux mile
+euros et cinq cents" to the most likely number, with a confidence score:
+
+- each word is matched to the closest word of the vocabulary (the words
+  of NUMBERS, LANGUAGES_DECADES, BIG_NUMBERS_BY_RANK and
+  CURRENCY_FORMS_FR), looked up in a BK-tree built once, so that a
+  lookup only compares the word with a small part of the vocabulary;
+- the words are assembled in a number;
+- the confidence is the similarity of the words with the vocabulary,
+  times the similarity of the words with the letters of the number (as
+  written by make_letters, in every language), so that a misplaced word
+  (e.g., "deux trois") lowers the confidence.
+
+The accents and the case are ignored.
+"""
+
+import functools
+import re
+import unicodedata
+from typing import NamedTuple
+
+from nombres_vers_lettres.constants import (
+    BIG_NUMBERS_BY_RANK,
+    CURRENCY_FORMS_FR,
+    LANGUAGES_DECADES,
+    MAX_INTEGER_DIGITS,
+    NUMBERS,
+)
+from nombres_vers_lettres.make_letters import make_letters, make_ordinal
+
+# Separators of the words
+WORDS_PATTERN = re.compile(r"[^\w]+|_")
+
+# Words which only link the others (e.g., "vingt et un", "d'euros")
+LINKING_WORDS = ("et", "de", "d")
+
+# The integers from this one cannot be written in letters
+MAX_INTEGER = 10**MAX_INTEGER_DIGITS
+
+
+def _decades_words() -> dict[str, frozenset[str]]:
+    """Get the words of the decades of each way of writing them.
+
+    Returns:
+        dict[str, frozenset[str]]: The words, by the first language which
+        writes the decades this way (e.g., "fr_BE" for "septante").
+    """
+    decades_words: dict[str, frozenset[str]] = {}
+
+    for language, decades in LANGUAGES_DECADES.items():
+        words = frozenset(
+            word for decade in decades.values() for word in decade.split("-")
+        )
+
+        if words not in decades_words.values():
+            decades_words[language] = words
+
+    return decades_words
+
+
+# The words of the decades, to compare the words with the letters in the
+# languages which write the decades as them first
+DECADES_WORDS = _decades_words()
+ALL_DECADES_WORDS = frozenset().union(*DECADES_WORDS.values())
+
+
+@functools.lru_cache(maxsize=65_536)
+def normalize_word(word: str) -> str:
+    """Lower a word and remove its accents (e.g., "Zéro" becomes "zero")."""
+    return "".join(
+        character
+        for character in unicodedata.normalize("NFKD", word.lower())
+        if not unicodedata.combining(character)
+    )
+
+
+@functools.lru_cache(maxsize=65_536)
+def levenshtein(word: str, other: str) -> int:
+    """Get the edit distance between two words (Levenshtein distance)."""
+    if len(word) < len(other):
+        word, other = other, word
+
+    previous = list(range(len(other) + 1))
+
+    for index, character in enumerate(word, 1):
+        current = [index]
+
+        for other_index, other_character in enumerate(other, 1):
+            current.append(
+                min(
+                    previous[other_index] + 1,
+                    current[other_index - 1] + 1,
+                    previous[other_index - 1]
+                    + (character != other_character),
+                )
+            )
+
+        previous = current
+
+    return previous[-1]
+
+
+class BKTree:
+    """Burkhard-Keller tree of words, for the lookups with typos.
+
+    The children of a word are indexed by their distance to the word, so
+    that a lookup skips the branches which cannot hold a close word
+    (triangle inequality).
+    """
+
+    def __init__(self, words: list[str] | None = None):
+        self._root: tuple[str, dict] | None = None
+        self._size = 0
+
+        for word in words or []:
+            self.add(word)
+
+    def add(self, word: str) -> None:
+        """Add a word (once)."""
+        if self._root is None:
+            self._root = (word, {})
+            self._size = 1
+            return
+
+        node = self._root
+        while True:
+            distance = levenshtein(word, node[0])
+
+            if distance == 0:
+                return
+
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                self._size += 1
+                return
+
+            node = child
+
+    def search(self, word: str, max_distance: int) -> list[tuple[int, str]]:
+        """Get the words at most max_distance edits away from a word.
+
+        Returns:
+            list[tuple[int, str]]: The distances and the words, closest
+            first.
+        """
+        matches = []
+        nodes = [self._root] if self._root is not None else []
+
+        while nodes:
+            node_word, children = nodes.pop()
+            distance = levenshtein(word, node_word)
+
+            if distance <= max_distance:
+                matches.append((distance, node_word))
+
+            for child_distance, child in children.items():
+                if abs(child_distance - distance) <= max_distance:
+                    nodes.append(child)
+
+        matches.sort()
+        return matches
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class Word(NamedTuple):
+    """The meanings of a word of the vocabulary."""
+
+    word: str
+    value: int | None = None
+    rank: int | None = None
+    units: tuple[str, ...] = ()
+    subunits: tuple[str, ...] = ()
+    fraction: int | None = None
+
+
+class FuzzyMatch(NamedTuple):
+    """The number read in a text (see fuzzy_parse).
+
+    Attributes:
+        number (str): The number (e.g., "-1234.5").
+        confidence (float): From 0 (no confidence) to 1 (exact letters).
+        words (tuple[str, ...]): The words, corrected.
+        currencies (tuple[str, ...]): The codes of the currency of the
+        amount (e.g., ("EUR",)), empty if there is no currency.
+    """
+
+    number: str
+    confidence: float
+    words: tuple[str, ...]
+    currencies: tuple[str, ...]
+
+
+@functools.lru_cache(maxsize=None)
+def vocabulary() -> dict[str, Word]:
+    """Get the words of the numbers, indexed by their normalized form."""
+    meanings: dict[str, dict] = {}
+
+    def add(word: str, **meaning) -> None:
+        entry = meanings.setdefault(
+            normalize_word(word), {"word": word, "units": (), "subunits": ()}
+        )
+
+        for name, value in meaning.items():
+            if name in ("units", "subunits"):
+                entry[name] += value
+
+            else:
+                entry[name] = value
+
+    for value, word in NUMBERS.items():
+        add(word, value=value)
+
+    add("une", value=1)
+
+    for decades in LANGUAGES_DECADES.values():
+        for value, word in decades.items():
+            # "quatre-vingt" is read as "quatre" and "vingt"
+            if "-" not in word:
+                add(word, value=value)
+                add(word + "s", value=value)
+
+    for rank, word in BIG_NUMBERS_BY_RANK.items():
+        if rank >= 3:
+            add(word, rank=rank)
+            add(word + "s", rank=rank)
+
+    for rank in (1, 2, 3) + tuple(
+        rank for rank in BIG_NUMBERS_BY_RANK if rank > 3
+    ):
+        ordinal = make_ordinal(BIG_NUMBERS_BY_RANK[rank])
+        add(ordinal, fraction=rank)
+        add(ordinal + "s", fraction=rank)
+
+    for code, (units, subunits) in CURRENCY_FORMS_FR.items():
+        for word in units:
+            add(word, units=(code,))
+
+        for word in subunits:
+            add(word, subunits=(code,))
+
+    for word in ("moins", "virgule") + LINKING_WORDS:
+        add(word)
+
+    return {
+        normalized: Word(
+            word=entry["word"],
+            value=entry.get("value"),
+            rank=entry.get("rank"),
+            units=tuple(dict.fromkeys(entry["units"])),
+            subunits=tuple(dict.fromkeys(entry["subunits"])),
+            fraction=entry.get("fraction"),
+        )
+        for normalized, entry in meanings.items()
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def vocabulary_tree() -> BKTree:
+    """Get the BK-tree of the normalized words of the vocabulary."""
+    return BKTree(sorted(vocabulary()))
+
+
+def max_distance(word: str) -> int:
+    """Get the number of typos tolerated in a word (by its length)."""
+    if len(word) <= 2:
+        return 0
+
+    return 1 if len(word) <= 5 else 2
+
+
+@functools.lru_cache(maxsize=65_536)
+def match_word(word: str) -> tuple[Word | None, int]:
+    """Get the closest word of the vocabulary.
+
+    Args:
+        word (str): The word, normalized (see normalize_word).
+
+    Returns:
+        tuple[Word | None, int]: The word (None if no word is close enough)
+        and its distance to the given word.
+    """
+    words = vocabulary()
+
+    if word in words:
+        return words[word], 0
+
+    matches = vocabulary_tree().search(word, max_distance(word))
+    if not matches:
+        return None, len(word)
+
+    # The numbers first, when several words are as close
+    distance = matches[0][0]
+    closest = [
+        words[match]
+        for match_distance, match in matches
+        if match_distance == distance
+    ]
+    closest.sort(key=lambda candidate: candidate.value is None)
+    return closest[0], distance
+
+
+def _segment_value(words: list[Word]) -> int:
+    """Assemble the words of an integer (e.g., "deux cent mille").
+
+    A rank multiplies the lower ranks before it (e.g., "mille milliards"
+    is 10**12).
+    """
+    # The values of the ranks read so far, by rank (highest first)
+    ranks: list[tuple[int, int]] = []
+    current = 0
+    previous = None
+
+    for word in words:
+        if word.rank is not None:
+            multiplier = current
+            while ranks and ranks[-1][0] < word.rank:
+                multiplier += ranks.pop()[1]
+
+            ranks.append((word.rank, max(multiplier, 1) * 10**word.rank))
+            current = 0
+
+        elif word.value == 100:
+            current = max(current, 1) * 100
+
+        elif word.value == 20 and previous == 4 and current % 100 == 4:
+            # "quatre vingt"
+            current += 76
+
+        elif word.value is not None:
+            current += word.value
+
+        previous = word.value
+
+    return sum(value for _, value in ranks) + current
+
+
+@functools.lru_cache(maxsize=65_536)
+def _canonical_words(value: int, language: str) -> tuple[str, ...]:
+    """Get the normalized words of an integer in a language."""
+    return tuple(
+        normalize_word(word)
+        for word in WORDS_PATTERN.split(
+            make_letters(str(value), language=language)
+        )
+        if word
+    )
+
+
+def _words_distance(words: tuple[str, ...], other: tuple[str, ...]) -> float:
+    """Get the edit distance between two lists of words.
+
+    The cost of a substitution is the ratio of the letters which differ.
+    """
+    previous = [float(index) for index in range(len(other) + 1)]
+
+    for index, word in enumerate(words, 1):
+        current = [float(index)]
+
+        for other_index, other_word in enumerate(other, 1):
+            cost = 0.0
+            if word != other_word:
+                cost = min(
+                    1.0,
+                    levenshtein(word, other_word)
+                    / max(len(word), len(other_word)),
+                )
+
+            current.append(
+                min(
+                    previous[other_index] + 1,
+                    current[other_index - 1] + 1,
+                    previous[other_index - 1] + cost,
+                )
+            )
+
+        previous = current
+
+    return previous[-1]
+
+
+def _segment_distance(words: list[Word], value: int) -> tuple[float, int]:
+    """Compare the words of an integer with its letters.
+
+    Returns:
+        tuple[float, int]: The distance (in words) and the number of words.
+    """
+    normalized = tuple(
+        "un" if word.word == "une" else normalize_word(word.word)
+        for word in words
+    )
+    decades = ALL_DECADES_WORDS.intersection(normalized)
+
+    # The languages which write the same decades first
+    languages = sorted(
+        DECADES_WORDS,
+        key=lambda language: not decades <= DECADES_WORDS[language],
+    )
+    canonicals = []
+
+    for language in languages:
+        canonical = _canonical_words(value, language)
+
+        if canonical == normalized:
+            return 0.0, len(normalized)
+
+        canonicals.append(canonical)
+
+    distance, count = min(
+        (
+            _words_distance(normalized, canonical),
+            max(len(normalized), len(canonical)),
+        )
+        for canonical in canonicals
+    )
+    return distance, count
+
+
+def _strip_linking_words(words: list[Word]) -> list[Word]:
+    """Remove the linking words around the words of a number.
+
+    The "et" inside a number (e.g., "vingt et un") is kept, as it is part
+    of its letters.
+    """
+    words = [word for word in words if word.word not in ("de", "d")]
+    start = 0
+    end = len(words)
+
+    while start < end and words[start].word == "et":
+        start += 1
+
+    while end > start and words[end - 1].word == "et":
+        end -= 1
+
+    return words[start:end]
+
+
+def _read_words(
+    words: list[Word], cents_unit: bool
+) -> tuple[str, float, tuple[str, ...]] | None:
+    """Read the number of corrected words.
+
+    Args:
+        words (list[Word]): The words (without the sign).
+        cents_unit (bool): If True, a last "cent" or "cents" is the unit of
+        the cents, not a hundred.
+
+    Returns:
+        tuple[str, float, tuple[str, ...]] | None: The number, the
+        similarity of the words with the letters of the number (from 0 to
+        1) and the codes of the currency. None if the number has too many
+        digits to be written in letters.
+    """
+    integer_words = words
+    decimal_words: list[Word] = []
+    decimals = 0
+    currencies: tuple[str, ...] = ()
+
+    unit_index = next(
+        (index for index, word in enumerate(words) if word.units), None
+    )
+    point_index = next(
+        (
+            index
+            for index, word in enumerate(words)
+            if word.word == "virgule"
+        ),
+        None,
+    )
+    last = words[-1] if words else None
+
+    if unit_index is not None:
+        integer_words = words[:unit_index]
+        decimal_words = words[unit_index + 1:]
+        currencies = words[unit_index].units
+
+    elif point_index is not None:
+        integer_words = words[:point_index]
+        decimal_words = words[point_index + 1:]
+
+    elif (
+        last is not None
+        and last.subunits
+        and (last.value is None or cents_unit)
+    ):
+        # Only cents (e.g., "cinquante cents")
+        integer_words = []
+        decimal_words = words
+        currencies = last.subunits
+
+    if currencies:
+        decimals = 2
+        if decimal_words and decimal_words[-1].subunits and (
+            decimal_words[-1].value is None or cents_unit
+        ):
+            decimal_words = decimal_words[:-1]
+
+    elif decimal_words and decimal_words[-1].fraction is not None:
+        decimals = decimal_words[-1].fraction
+        decimal_words = decimal_words[:-1]
+
+    integer_words = _strip_linking_words(integer_words)
+    decimal_words = _strip_linking_words(decimal_words)
+
+    distance = 0.0
+    count = 0
+    integer = _segment_value(integer_words)
+
+    if integer >= MAX_INTEGER:
+        return None
+
+    if integer_words or not decimal_words:
+        distance, count = _segment_distance(integer_words, integer)
+
+    number = str(integer)
+
+    if decimal_words:
+        # The zeros before the decimals (e.g., "virgule zéro cinq")
+        zeros = 0
+        while (
+            zeros < len(decimal_words) - 1 and decimal_words[zeros].value == 0
+        ):
+            zeros += 1
+
+        decimal = _segment_value(decimal_words[zeros:])
+
+        if decimal >= MAX_INTEGER:
+            return None
+
+        decimal_distance, decimal_count = _segment_distance(
+            decimal_words[zeros:], decimal
+        )
+        distance += decimal_distance
+        count += decimal_count + zeros
+
+        if currencies and decimal >= 100:
+            # The cents of an amount are below a hundred
+            distance += 1
+
+        digits = "0" * zeros + str(decimal)
+        number += "." + digits.rjust(decimals, "0")
+
+    return number, 1.0 - distance / max(count, 1), currencies
+
+
+def fuzzy_parse(text: str) -> FuzzyMatch | None:
+    """Read the number written in letters in a text, even misspelled.
+
+    Args:
+        text (str): The text (e.g., "quatre vingt dix neut").
+
+    Returns:
+        FuzzyMatch | None: The most likely number and its confidence, None
+        if no word of the text is a number, or if the number has too many
+        digits to be written in letters.
+    """
+    raw_words = [
+        normalize_word(word) for word in WORDS_PATTERN.split(text) if word
+    ]
+    words = []
+    distance = 0
+    length = 0
+
+    for raw_word in raw_words:
+        word, word_distance = match_word(raw_word)
+        distance += word_distance
+        length += len(raw_word)
+
+        if word is not None:
+            words.append(word)
+
+    corrected = tuple(word.word for word in words)
+    negative = bool(words) and words[0].word == "moins"
+    if negative:
+        words = words[1:]
+
+    if not any(
+        word.value is not None or word.rank is not None for word in words
+    ):
+        return None
+
+    spelling = 1.0 - distance / max(length, 1)
+
+    # "cent" or "cents" at the end may be a hundred or the cents
+    readings = [_read_words(words, cents_unit=False)]
+    if words[-1].subunits and words[-1].value is not None:
+        readings.append(_read_words(words, cents_unit=True))
+
+    valid_readings = [reading for reading in readings if reading is not None]
+    if not valid_readings:
+        return None
+
+    number, structure, currencies = max(
+        valid_readings, key=lambda reading: reading[1]
+    )
+
+    return FuzzyMatch(
+        number=("-" if negative else "") + number,
+        confidence=round(spelling * structure, 4),
+        words=corrected,
+        currencies=currencies,
+    )
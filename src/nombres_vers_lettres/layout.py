@@ -0,0 +1,487 @@
+"""Length and line breaks of the letters, for printed fields (cheques).
+
+letters_length() computes the length of the letters of make_letters
+without building them: the lengths of the letters of the groups of three
+digits and of the ranks are precomputed once per configuration, and the
+length of a number is summed from its groups (see
+nombres_vers_lettres.parsed). The numbers which are not supported (the
+negative numbers and the decimal numbers, except the amounts with cents)
+are measured on the letters of make_letters.
+
+line_bounds() breaks letters in lines of a given width, at the spaces
+and after the hyphens, without copying them.
+"""
+
+import functools
+from typing import Any, NamedTuple
+
+from nombres_vers_lettres.compiler import COMPILED_MODES, MAX_EXACT_INTEGER
+from nombres_vers_lettres.constants import (
+    BIG_NUMBERS_BY_RANK,
+    CURRENCY_FORMS_FR,
+    LANGUAGES_DECADES,
+)
+from nombres_vers_lettres.make_letters import (
+    make_currency,
+    make_letters,
+    make_ordinal,
+    positive_integer_under_one_thousand,
+)
+from nombres_vers_lettres.parsed import ParsedNumber, parse_number
+
+# The spaces at which a line can be broken (a line can also be broken
+# after a hyphen). The non-breaking spaces of make_letters keep the letters
+# on the line of the text around them, but a field is filled with the
+# letters only.
+BREAKING_SPACES = (" ", "\xa0")
+
+
+class LengthTables(NamedTuple):
+    """The lengths of the letters of a configuration (see letters_length).
+
+    Attributes:
+        under_one_thousand (tuple[int, ...]): The length of the numbers
+        from 0 to 999.
+        last_groups (tuple[int, ...]): The length of the last group.
+        thousand_groups (tuple[int, ...]): The length of the group of the
+        thousands, "mille" included.
+        groups (tuple[int, ...]): The length of the other groups, the space
+        before the rank included.
+        ranks (dict[int, tuple[int, int]]): The length of each rank, in the
+        singular and in the plural.
+        last_deltas (tuple[int, ...]): The length added by make_ordinal when
+        the number ends with the last group (ordinal_nominal mode).
+        thousand_delta (int): The same when it ends with "mille".
+        rank_deltas (dict[int, tuple[int, int]]): The same when it ends with
+        a rank.
+    """
+
+    under_one_thousand: tuple[int, ...]
+    last_groups: tuple[int, ...]
+    thousand_groups: tuple[int, ...]
+    groups: tuple[int, ...]
+    ranks: dict[int, tuple[int, int]]
+    last_deltas: tuple[int, ...]
+    thousand_delta: int
+    rank_deltas: dict[int, tuple[int, int]]
+
+
+def _group_lengths(
+    gender: str = "masculin",
+    plural: bool = False,
+    ordinal: bool = False,
+    post_1990_orthographe: bool = False,
+    language: str = "fr_BE",
+) -> tuple[int, ...]:
+    """Get the length of the letters of the numbers from 0 to 999."""
+    return tuple(
+        len(
+            positive_integer_under_one_thousand(
+                number,
+                gender=gender,
+                plural=plural,
+                ordinal=ordinal,
+                post_1990_orthographe=post_1990_orthographe,
+                language=language,
+            )
+        )
+        for number in range(1000)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def length_tables(
+    mode: str = "cardinal",
+    gender: str = "masculin",
+    plural: bool = False,
+    language: str = "fr_BE",
+    post_1990_orthographe: bool = True,
+) -> LengthTables:
+    """Precompute the lengths of the letters of a configuration (cached).
+
+    The arguments are the options of make_letters (the currency modes
+    share the tables of the masculine cardinal).
+
+    Raises:
+        ValueError: If the mode or the language is not supported.
+
+    Returns:
+        LengthTables: The lengths.
+    """
+    if mode in CURRENCY_FORMS_FR:
+        mode, gender, plural = "cardinal", "masculin", False
+
+    if mode not in COMPILED_MODES:
+        raise ValueError(f"Mode not supported ({mode = })")
+
+    if language not in LANGUAGES_DECADES:
+        raise ValueError(f"Invalid language ({language = })")
+
+    mode = COMPILED_MODES[mode]
+    ordinal_nominal = mode == "ordinal_nominal"
+    groups = _group_lengths(
+        ordinal=mode == "ordinal_adjectival",
+        post_1990_orthographe=post_1990_orthographe,
+        language=language,
+    )
+
+    # "mille", not "un mille" (the separator is one character long)
+    thousand_groups = (0, len("mille")) + tuple(
+        length + 1 + len("mille")
+        for length in _group_lengths(
+            ordinal=True,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        )[2:]
+    )
+
+    if mode == "cardinal":
+        # The gender and the plural only change the last group
+        last_groups = _group_lengths(
+            gender=gender,
+            plural=plural,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        )
+
+    else:
+        last_groups = groups
+
+    def ordinal_delta(cardinal_number_str: str) -> int:
+        """Get the length added by make_ordinal to a number ending so."""
+        if not ordinal_nominal:
+            return 0
+
+        # The separator keeps make_ordinal from writing "premier"
+        return (
+            len(make_ordinal("-" + cardinal_number_str, plural=plural))
+            - len(cardinal_number_str)
+            - 1
+        )
+
+    under_one_thousand = last_groups
+    last_deltas: tuple[int, ...] = (0,) * 1000
+
+    if ordinal_nominal:
+        cardinal_groups = [
+            positive_integer_under_one_thousand(
+                number,
+                post_1990_orthographe=post_1990_orthographe,
+                language=language,
+            )
+            for number in range(1000)
+        ]
+        under_one_thousand = tuple(
+            len(make_ordinal(letters, gender=gender, plural=plural))
+            for letters in cardinal_groups
+        )
+        last_deltas = tuple(
+            ordinal_delta(letters) for letters in cardinal_groups
+        )
+
+    big_ranks = [rank for rank in BIG_NUMBERS_BY_RANK if rank > 3]
+
+    return LengthTables(
+        under_one_thousand=under_one_thousand,
+        last_groups=last_groups,
+        thousand_groups=thousand_groups,
+        groups=tuple(length + 1 for length in groups),
+        ranks={
+            rank: (
+                len(BIG_NUMBERS_BY_RANK[rank]),
+                len(BIG_NUMBERS_BY_RANK[rank]) + 1,
+            )
+            for rank in big_ranks
+        },
+        last_deltas=last_deltas,
+        thousand_delta=ordinal_delta("mille"),
+        rank_deltas={
+            rank: (
+                ordinal_delta(BIG_NUMBERS_BY_RANK[rank]),
+                ordinal_delta(BIG_NUMBERS_BY_RANK[rank] + "s"),
+            )
+            for rank in big_ranks
+        },
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _cents_lengths(
+    currency: str, language: str, post_1990_orthographe: bool
+) -> tuple[int, ...]:
+    """Get the length of the cents from "0.00" to "0.99" in a currency."""
+    return tuple(
+        len(
+            make_currency(
+                f"0.{cents:02d}",
+                currency=currency,
+                post_1990_orthographe=post_1990_orthographe,
+                language=language,
+            )
+        )
+        for cents in range(100)
+    )
+
+
+def _integer_groups(number: Any) -> list[tuple[int, int]] | None:
+    """Get the rank and the value of the non-empty groups of an integer.
+
+    Returns:
+        list[tuple[int, int]] | None: The groups, from the highest, None if
+        the number is not a non-negative integer exactly represented by a
+        float (make_letters formats the integers as floats).
+    """
+    if type(number) is not int or not 0 <= number < MAX_EXACT_INTEGER:
+        return None
+
+    groups = []
+    rank = 0
+
+    while number:
+        number, group = divmod(number, 1000)
+
+        if group:
+            groups.append((rank, group))
+
+        rank += 3
+
+    groups.reverse()
+    return groups
+
+
+def _integer_length(
+    tables: LengthTables, groups: list[tuple[int, int]]
+) -> int | None:
+    """Sum the length of the letters of the groups of an integer.
+
+    Returns:
+        int | None: The length, None if a rank is out of range.
+    """
+    if not groups:
+        return tables.under_one_thousand[0]
+
+    last_rank, last_group = groups[-1]
+
+    if groups[0][0] == 0:
+        return tables.under_one_thousand[last_group]
+
+    # The separators between the groups
+    length = len(groups) - 1
+
+    for rank, group in groups:
+        if rank == 0:
+            length += tables.last_groups[group]
+
+        elif rank == 3:
+            length += tables.thousand_groups[group]
+
+        elif rank in tables.ranks:
+            length += tables.groups[group] + tables.ranks[rank][group > 1]
+
+        else:
+            return None
+
+    if last_rank == 0:
+        return length + tables.last_deltas[last_group]
+
+    if last_rank == 3:
+        return length + tables.thousand_delta
+
+    return length + tables.rank_deltas[last_rank][last_group > 1]
+
+
+def _parsed_length(
+    parsed: ParsedNumber,
+    mode: str,
+    tables: LengthTables,
+    language: str,
+    post_1990_orthographe: bool,
+) -> int | None:
+    """Get the length of the letters of a parsed number (None if unsure)."""
+    if parsed.integer_groups is None or parsed.negative:
+        return None
+
+    groups = [(rank, group) for rank, group, _ in parsed.integer_groups]
+
+    if mode not in CURRENCY_FORMS_FR:
+        return _integer_length(tables, groups) if parsed.is_integer else None
+
+    integer_part, point, decimal_part = parsed.number_str.partition(".")
+    cents = decimal_part.rstrip("0")
+
+    if len(cents) > 2 or (point and isinstance(parsed.number, float)):
+        return None
+
+    cents_length = 0
+    if point:
+        cents_length = _cents_lengths(mode, language, post_1990_orthographe)[
+            int(cents.ljust(2, "0"))
+        ]
+
+        # Under one unit, only the cents are written
+        if -1 < parsed.value < 1:
+            return cents_length
+
+        if not groups:
+            return None
+
+        # " et "
+        cents_length += 4
+
+    integer_length = _integer_length(tables, groups)
+    if integer_length is None:
+        return None
+
+    # The plural is the one of the integer part
+    plural = int(groups != [] and (groups[0][0] > 0 or groups[0][1] > 1))
+    current_currency = CURRENCY_FORMS_FR[mode][0][plural]
+
+    # " " or " de " or " d'"
+    de_or_space = 1
+    if integer_part.endswith("000000"):
+        de_or_space = (
+            3 if current_currency.startswith(("a", "e", "i", "o", "u", "y"))
+            else 4
+        )
+
+    return integer_length + de_or_space + len(current_currency) + cents_length
+
+
+def letters_length(
+    number: ParsedNumber | float | int | str,
+    mode: str = "cardinal",
+    gender: str = "masculin",
+    plural: bool = False,
+    language: str = "fr_BE",
+    post_1990_orthographe: bool = True,
+    use_non_breaking_spaces: bool = True,
+) -> int:
+    """Get the length of the letters of a number, without building them.
+
+    Args:
+        number (ParsedNumber | float | int | str): The number, parsed or
+        not (see nombres_vers_lettres.parsed).
+        The other arguments are the options of make_letters.
+
+    Raises:
+        ConversionError: If the number or the options are invalid.
+
+    Returns:
+        int: The length of make_letters(number, **options).
+    """
+    length = None
+
+    if (
+        mode in COMPILED_MODES or mode in CURRENCY_FORMS_FR
+    ) and language in LANGUAGES_DECADES:
+        tables = length_tables(
+            mode,
+            gender=gender,
+            plural=plural,
+            language=language,
+            post_1990_orthographe=post_1990_orthographe,
+        )
+        groups = _integer_groups(number)
+
+        if groups is not None and mode in COMPILED_MODES:
+            length = _integer_length(tables, groups)
+
+        else:
+            length = _parsed_length(
+                (
+                    number
+                    if isinstance(number, ParsedNumber)
+                    else parse_number(number)
+                ),
+                mode,
+                tables,
+                language=language,
+                post_1990_orthographe=post_1990_orthographe,
+            )
+
+    if length is not None:
+        return length
+
+    # Measure the letters (and raise the errors of make_letters)
+    return len(
+        make_letters(
+            number.number if isinstance(number, ParsedNumber) else number,
+            mode=mode,
+            gender=gender,
+            plural=plural,
+            language=language,
+            post_1990_orthographe=post_1990_orthographe,
+            use_non_breaking_spaces=use_non_breaking_spaces,
+        )
+    )
+
+
+def line_bounds(letters: str, width: int) -> list[tuple[int, int]]:
+    """Break letters in lines, at the spaces and after the hyphens.
+
+    The lines are filled greedily. A word longer than the width is left
+    on its own line (the line is longer than the width).
+
+    Args:
+        letters (str): The letters (e.g., of make_letters).
+        width (int): The maximal number of characters per line.
+
+    Raises:
+        ValueError: If the width is not positive.
+
+    Returns:
+        list[tuple[int, int]]: The start and the end of each line
+        (letters[start:end]), without the spaces at the breaks.
+    """
+    if width < 1:
+        raise ValueError(f"The width must be positive (received {width})")
+
+    bounds = []
+    start = 0
+    length = len(letters)
+
+    while length - start > width:
+        limit = start + width
+
+        # The last break which fits (a space may be just after the line)
+        end = max(
+            letters.rfind(" ", start, limit + 1),
+            letters.rfind("\xa0", start, limit + 1),
+            letters.rfind("-", start, limit) + 1,
+        )
+
+        if end <= start:
+            # The word does not fit, break after it
+            ends = [
+                end
+                for end in (
+                    letters.find(" ", limit),
+                    letters.find("\xa0", limit),
+                    letters.find("-", limit) + 1,
+                )
+                if end > 0
+            ]
+
+            if not ends:
+                break
+
+            end = min(ends)
+
+        bounds.append((start, end))
+        start = end
+
+        # The space is not printed
+        if start < length and letters[start] in BREAKING_SPACES:
+            start += 1
+
+    bounds.append((start, length))
+    return bounds
+
+
+def wrap_letters(letters: str, width: int) -> list[str]:
+    """Break letters in lines of at most width characters (see line_bounds).
+
+    Returns:
+        list[str]: The lines.
+    """
+    return [letters[start:end] for start, end in line_bounds(letters, width)]
@@ -0,0 +1,345 @@
+"""Limits of the inputs of make_letters and cost of a conversion.
+
+estimate_cost() measures a number without converting it: the length of
+the input is checked first (O(1)), then the digits are counted in one
+pass over the input (O(n)). The length of the letters is bounded from
+the number of groups of three digits, so that a caller can route or
+reject an input before any conversion.
+
+enable_limits() installs limits in make_letters, which then rejects the
+inputs out of the limits with a ConversionError before any work, for
+example::
+
+    enable_limits(ConversionLimits(max_input_length=256))
+    make_letters("1" * 1_000_000)  # ConversionError (input_too_long)
+"""
+
+import functools
+import math
+from typing import Any, NamedTuple
+
+from nombres_vers_lettres.constants import (
+    BIG_NUMBERS_BY_RANK,
+    CURRENCY_FORMS_FR,
+    CURRENCY_FORMS_FR_CODES,
+    ERROR_INPUT_TOO_LONG,
+    ERROR_INVALID_NUMBER,
+    ERROR_OUTPUT_TOO_LONG,
+    ERROR_RANK_OUT_OF_RANGE,
+    LANGUAGES_DECADES,
+    MAX_DECIMAL_DIGITS,
+    MAX_INTEGER_DIGITS,
+)
+from nombres_vers_lettres.make_letters import (
+    BUFFER_TYPES,
+    ConversionError,
+    buffer_to_str,
+    clean_number_str,
+    get_conversion_limits,
+    integer_to_letters,
+    set_conversion_limits,
+)
+
+# The ints longer than this (in bits) are measured from their bit length
+# (str() is quadratic in the digits)
+_EXACT_INT_BITS = 1024
+# Letters which are not in the groups of digits
+_OVERHEAD_LENGTH = len("moins ") + len(" virgule ") + len("zéro")
+# Letters of the names of a currency (e.g., " euros et ", " de cents")
+_CURRENCY_LENGTH = len(" et ") + 2 * max(
+    len(name) + len(" d'")
+    for forms in CURRENCY_FORMS_FR.values()
+    for form in forms
+    for name in form
+)
+
+
+class ConversionCost(NamedTuple):
+    """The cost of a conversion, measured without converting.
+
+    The digits and the length of the letters are 0 if the input is
+    rejected from its length.
+
+    Attributes:
+        input_length (int): The length of the input (0 if not a string
+        or a buffer).
+        integer_digits (int): The digits of the integer part, without the
+        leading zeros.
+        decimal_digits (int): The digits of the decimal part, without the
+        trailing zeros.
+        output_length (int): An upper bound of the length of the letters.
+        error (str | None): The error code if the number is invalid or out
+        of the limits, None otherwise.
+    """
+
+    input_length: int
+    integer_digits: int
+    decimal_digits: int
+    output_length: int
+    error: str | None
+
+
+class ConversionLimits(NamedTuple):
+    """Limits of the inputs of make_letters (see enable_limits).
+
+    The defaults are the limits of the conversion itself, except for the
+    length of the input and of the letters, which are not limited.
+
+    Attributes:
+        max_input_length (int | None): The characters of a string or the
+        bytes of a buffer (e.g., spaces and leading zeros included), None
+        for no limit.
+        max_integer_digits (int): The digits of the integer part.
+        max_decimal_digits (int): The digits of the decimal part, the
+        amounts of a currency included.
+        max_output_length (int | None): The upper bound of the length of
+        the letters (see ConversionCost), None for no limit.
+    """
+
+    max_input_length: int | None = None
+    max_integer_digits: int = MAX_INTEGER_DIGITS
+    max_decimal_digits: int = MAX_DECIMAL_DIGITS
+    max_output_length: int | None = None
+
+    def check(self, number: Any, mode: str = "cardinal") -> None:
+        """Check that a number is in the limits, without converting it.
+
+        Args:
+            number (Any): The number to check.
+            mode (str, optional): The mode of make_letters.
+            Defaults to "cardinal".
+
+        Raises:
+            ConversionError: If the number is invalid or out of the limits.
+        """
+        if (
+            isinstance(number, str)
+            and len(number) <= _short_length(
+                self, mode in CURRENCY_FORMS_FR_CODES
+            )
+            and "e" not in number
+            and "E" not in number
+        ):
+            # Too short to be out of the limits
+            return
+
+        _, error = _measure(number, mode, self)
+
+        if error is not None:
+            raise error
+
+
+@functools.lru_cache(maxsize=1)
+def _group_length() -> int:
+    """Get an upper bound of the letters of a group of three digits.
+
+    The bound is the longest group (in any language, orthographe and
+    gender) followed by the longest rank, both in the plural ordinal form.
+    """
+    # Not make_letters, which checks the limits
+    longest_group = max(
+        len(
+            integer_to_letters(
+                number,
+                gender="feminine",
+                plural=True,
+                language=language,
+                post_1990_orthographe=post_1990_orthographe,
+            )
+        )
+        for number in range(1, 1000)
+        for language in LANGUAGES_DECADES
+        for post_1990_orthographe in (False, True)
+    )
+    longest_rank = max(len(rank) for rank in BIG_NUMBERS_BY_RANK.values())
+    suffix_length = len("ièmes")
+
+    return longest_group + longest_rank + 2 * (suffix_length + 1)
+
+
+@functools.lru_cache(maxsize=64)
+def _short_length(limits: ConversionLimits, currency: bool) -> int:
+    """Get the length of the strings which cannot be out of limits.
+
+    A string (without exponent) has at most as many digits as characters,
+    in at most (length + 4) // 3 groups of three digits.
+    """
+    length = min(limits.max_integer_digits, limits.max_decimal_digits)
+
+    if limits.max_input_length is not None:
+        length = min(length, limits.max_input_length)
+
+    if limits.max_output_length is not None:
+        overhead = _OVERHEAD_LENGTH + (_CURRENCY_LENGTH if currency else 0)
+
+        while (
+            length > 0
+            and (length + 4) // 3 * _group_length() + overhead
+            > limits.max_output_length
+        ):
+            length -= 1
+
+    return length
+
+
+def _integer_digits(number: int) -> int:
+    """Get the digits of an int, without formatting the long ones."""
+    number = abs(number)
+
+    if number.bit_length() <= _EXACT_INT_BITS:
+        return len(str(number)) if number else 0
+
+    return int(number.bit_length() * math.log10(2)) + 1
+
+
+def _measure(
+    number: Any, mode: str, limits: ConversionLimits
+) -> tuple[ConversionCost, ConversionError | None]:
+    """Measure a number and check it against limits.
+
+    Returns:
+        tuple[ConversionCost, ConversionError | None]: The cost and the
+        error (not raised) if the number is invalid or out of the limits.
+    """
+    if isinstance(number, BUFFER_TYPES):
+        input_length = memoryview(number).nbytes
+
+    else:
+        input_length = len(number) if isinstance(number, str) else 0
+
+    # O(1), before reading the input
+    if (
+        limits.max_input_length is not None
+        and input_length > limits.max_input_length
+    ):
+        return ConversionCost(
+            input_length, 0, 0, 0, ERROR_INPUT_TOO_LONG
+        ), ConversionError(
+            ERROR_INPUT_TOO_LONG,
+            f"Input too long ({input_length} characters, "
+            f"limit {limits.max_input_length})",
+        )
+
+    integer_digits = decimal_digits = 0
+    error: ConversionError | None = None
+
+    if isinstance(number, BUFFER_TYPES):
+        try:
+            number = buffer_to_str(number)
+
+        except ConversionError as decode_error:
+            return (
+                ConversionCost(input_length, 0, 0, 0, decode_error.code),
+                decode_error,
+            )
+
+    if isinstance(number, float) and not math.isfinite(number):
+        error = ConversionError(
+            ERROR_INVALID_NUMBER, f"Invalid number: {number}"
+        )
+        return ConversionCost(0, 0, 0, 0, error.code), error
+
+    if isinstance(number, int):
+        integer_digits = _integer_digits(number)
+
+    elif isinstance(number, (float, str)):
+        # The small floats are represented in scientific notation
+        number_str, error = clean_number_str(
+            number if isinstance(number, str) else f"{number}"
+        )
+
+        if error is not None:
+            return ConversionCost(input_length, 0, 0, 0, error.code), error
+
+        integer_part, _, decimal_part = (
+            number_str.strip().lstrip("-").partition(".")
+        )
+        integer_digits = len(integer_part.lstrip("0"))
+        decimal_digits = len(decimal_part.rstrip("0"))
+
+    groups = -(-integer_digits // 3) + -(-decimal_digits // 3)
+    output_length = groups * _group_length() + _OVERHEAD_LENGTH
+
+    if mode in CURRENCY_FORMS_FR_CODES:
+        output_length += _CURRENCY_LENGTH
+
+    cost = ConversionCost(
+        input_length, integer_digits, decimal_digits, output_length, None
+    )
+
+    if integer_digits > limits.max_integer_digits:
+        error = ConversionError(
+            ERROR_RANK_OUT_OF_RANGE,
+            f"Too many integer digits ({integer_digits}, "
+            f"limit {limits.max_integer_digits})",
+        )
+
+    elif decimal_digits > limits.max_decimal_digits:
+        error = ConversionError(
+            ERROR_RANK_OUT_OF_RANGE,
+            f"Too many decimal digits ({decimal_digits}, "
+            f"limit {limits.max_decimal_digits})",
+        )
+
+    elif (
+        limits.max_output_length is not None
+        and cost.output_length > limits.max_output_length
+    ):
+        error = ConversionError(
+            ERROR_OUTPUT_TOO_LONG,
+            f"Letters too long (up to {cost.output_length} characters, "
+            f"limit {limits.max_output_length})",
+        )
+
+    if error is not None:
+        cost = cost._replace(error=error.code)
+
+    return cost, error
+
+
+def estimate_cost(
+    number: Any,
+    mode: str = "cardinal",
+    limits: ConversionLimits | None = None,
+) -> ConversionCost:
+    """Measure a number without converting it.
+
+    Args:
+        number (Any): The number to measure.
+        mode (str, optional): The mode of make_letters.
+        Defaults to "cardinal".
+        limits (ConversionLimits | None, optional): The limits to check,
+        None for the limits of make_letters (see enable_limits) or the
+        defaults. Defaults to None.
+
+    Returns:
+        ConversionCost: The cost of the conversion.
+    """
+    if limits is None:
+        limits = get_conversion_limits() or ConversionLimits()
+
+    return _measure(number, mode, limits)[0]
+
+
+def enable_limits(
+    limits: ConversionLimits | None = None,
+) -> ConversionLimits:
+    """Check the inputs of make_letters against limits.
+
+    Args:
+        limits (ConversionLimits | None, optional): The limits, None for
+        the defaults. Defaults to None.
+
+    Returns:
+        ConversionLimits: The limits checked by make_letters.
+    """
+    if limits is None:
+        limits = ConversionLimits()
+
+    set_conversion_limits(limits)
+    return limits
+
+
+def disable_limits() -> None:
+    """Stop checking the inputs of make_letters."""
+    set_conversion_limits(None)
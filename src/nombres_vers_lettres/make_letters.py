@@ -6,20 +6,103 @@ https://fr.wikipedia.org/wiki/Noms_des_grands_nombres
 https://fr.wikipedia.org/wiki/Nombres_en_fran%C3%A7ais
 """
 
+import decimal
+import math
 import re
-import traceback
+from collections.abc import Callable, Iterable
+from typing import Any, NamedTuple
 
 from nombres_vers_lettres.constants import (  # CURRENCY_FORMS_FR,
     BIG_NUMBERS_BY_RANK,
     CURRENCY_FORMS_FR,
     CURRENCY_FORMS_FR_CODES,
+    ERROR_EMPTY_INPUT,
+    ERROR_INVALID_MODE,
+    ERROR_INVALID_NUMBER,
+    ERROR_MISPLACED_SIGN,
+    ERROR_NOT_AN_INTEGER,
+    ERROR_RANK_OUT_OF_RANGE,
+    ERROR_TOO_MANY_SEPARATORS,
     FRENCH_FRENCH_LIKE,
     LANGUAGES_DECADES,
+    MAX_DECIMAL_DIGITS,
+    MAX_INTEGER_DIGITS,
+    MODES,
     NUMBERS,
     VALID_FEMININE,
     VALID_MASCULINE,
 )
 
+# Characters which are not part of a number (e.g., spaces between groups)
+NOT_A_NUMBER_PATTERN = re.compile(r"[^\-\d\.\,\n]+")
+# What int() or float() accepts once the number has been cleaned
+NUMBER_PATTERN = re.compile(r"\s*-?(?:\d+(?:\.\d*)?|\.\d+)\s*")
+# Characters which are not part of a number in scientific notation
+NOT_A_SCIENTIFIC_PATTERN = re.compile(r"[^\-+\d.,eE]+")
+# A number in scientific notation (e.g., "-2,5e-40")
+SCIENTIFIC_PATTERN = re.compile(
+    r"([-+]?)(?=[.,]?\d)(\d*)(?:[.,](\d*))?[eE]([-+]?\d+)"
+)
+# The first number which cannot be written in letters
+MAX_INTEGER = 10**MAX_INTEGER_DIGITS
+# Buffers of ASCII digits accepted as numbers (e.g., slices of a socket
+# or of a memory-mapped file)
+BUFFER_TYPES = (bytes, bytearray, memoryview)
+# A plain number in a buffer, with the leading zeros of its integer and
+# decimal parts in their own groups (the line feeds are left to
+# clean_number_str, like in the strings)
+DIGIT_BUFFER_PATTERN = re.compile(
+    rb"[ \t\r\x0b\x0c]*(-?)(0*)(\d*)(?:([.,])(0*)(\d*))?[ \t\r\x0b\x0c]*"
+)
+# The longer buffers are decoded (e.g., long runs of zeros)
+_MAX_PARSED_BUFFER_LENGTH = 256
+
+# Runs the conversions when the reference check is enabled
+# (see nombres_vers_lettres.reference)
+_reference_oracle: Callable[..., str] | None = None
+# Precomputed letters (see nombres_vers_lettres.artifact)
+_spelling_artifact: Any = None
+# Cache of the letters (see nombres_vers_lettres.cache)
+_result_cache: Any = None
+# Limits of the inputs (see nombres_vers_lettres.limits)
+_conversion_limits: Any = None
+# Records the calls (see nombres_vers_lettres.workload)
+_call_recorder: Callable[..., str] | None = None
+
+
+class BufferDigits(NamedTuple):
+    """A buffer of ASCII digits parsed in place (see parse_digit_buffer).
+
+    Attributes:
+        negative (bool): If True, the number is negative.
+        integer_groups (list[tuple[int, int, int]]): The rank, the value and
+        the number of digits of each non-empty group of the integer part.
+        decimal_groups (list[tuple[int, int, int]]): The same for the
+        decimal part.
+        is_integer (bool): If True, the number has no decimal point.
+    """
+
+    negative: bool
+    integer_groups: list[tuple[int, int, int]]
+    decimal_groups: list[tuple[int, int, int]]
+    is_integer: bool
+
+
+class ConversionError(ValueError):
+    """A number (or an option) cannot be converted to letters.
+
+    Attributes:
+        code (str): The error code (one of the ERROR_* constants).
+    """
+
+    def __init__(self, code: str, message: str):
+        super().__init__(message)
+        self.code = code
+
+    def __reduce__(self):
+        # Keep the code when the error is sent to another process
+        return type(self), (self.code, str(self))
+
 
 def make_currency(
     number: float | int | str,
@@ -35,9 +118,43 @@ def make_currency(
         decimal_rank (bool, optional): Defaults to True.
         post_1990_orthographe (bool, optional): Defaults to False.
 
+    Raises:
+        ConversionError: If the number is out of the limits (see
+        set_conversion_limits).
+
     Returns:
         str: The number in letters.
     """
+    if _conversion_limits is not None:
+        _conversion_limits.check(number, currency)
+
+    if _call_recorder is not None:
+        return _call_recorder(
+            "make_currency",
+            _make_currency,
+            number,
+            {
+                "currency": currency,
+                "post_1990_orthographe": post_1990_orthographe,
+                "language": language,
+            },
+        )
+
+    return _make_currency(
+        number,
+        currency=currency,
+        post_1990_orthographe=post_1990_orthographe,
+        language=language,
+    )
+
+
+def _make_currency(
+    number: float | int | str,
+    currency: str = "EUR",
+    post_1990_orthographe: bool = True,
+    language: str = "fr_BE",
+) -> str:
+    """Convert a number to a currency (see make_currency)."""
     number_int_or_float, number_str = numbers(number, mode="float")
 
     # Check if the number is an integer
@@ -95,14 +212,14 @@ def make_currency(
     integer_part, decimal_part = number_str.split(".")
 
     return (
-        make_currency(
+        _make_currency(
             integer_part,
             currency=currency,
             post_1990_orthographe=post_1990_orthographe,
             language=language,
         )
         + " et "
-        + make_currency(
+        + _make_currency(
             f"0.{decimal_part}",
             currency=currency,
             post_1990_orthographe=post_1990_orthographe,
@@ -121,7 +238,7 @@ def numbers(
         mode (str, optional): The mode to use. Defaults to "int".
 
     Raises:
-        ValueError: If the number is invalid.
+        ConversionError: If the number is invalid.
 
     Returns:
         tuple[float | int, str]: The number as a float or int and a string.
@@ -129,49 +246,375 @@ def numbers(
     number_str: str = ""
     number_int_or_float: int | float = 0
 
-    if isinstance(number, str):
-        number_str = number
-        number_str = re.sub(r"[^\-\d\.\,\n]+", "", number_str)
-
-        if number_str.count(".") > 1:
-            raise ValueError("Invalid number: too many decimal points (.)")
-
-        if number_str.count(",") > 1:
-            raise ValueError("Invalid number: too many decimal points (,)")
-
-        # Only keep the decimal point
-        number_str = number_str.replace(",", ".")
+    if isinstance(number, BUFFER_TYPES):
+        number = buffer_to_str(number)
 
-        if "-" in number_str and not number_str.startswith("-"):
-            raise ValueError(
-                "Invalid number: negative sign must be at the beginning"
-            )
-
-        if number_str.count("-") > 1:
-            raise ValueError("Invalid number: too many negative signs")
+    if isinstance(number, str):
+        number_str, error = clean_number_str(number)
 
-        if number_str == "":
-            raise ValueError("Invalid number: empty string")
+        if error is not None:
+            raise error
 
         # Create a number
         if "." not in number_str:
-            number_int_or_float = int(number_str)
+            digits = number_str.strip().lstrip("-").lstrip("0")
+
+            # Fail before any work (int() is quadratic in the digits)
+            if len(digits) > MAX_INTEGER_DIGITS:
+                raise ConversionError(
+                    ERROR_RANK_OUT_OF_RANGE,
+                    f"Rank value (rank = {(len(digits) - 1) // 3 * 3}) "
+                    "out of range.",
+                )
+
+            number_int_or_float = int(digits or "0")
+            if number_str.lstrip().startswith("-"):
+                number_int_or_float = -number_int_or_float
 
         else:
             number_int_or_float = float(number_str)
 
     if isinstance(number, (int, float)):
+        if isinstance(number, float) and not math.isfinite(number):
+            raise ConversionError(
+                ERROR_INVALID_NUMBER, f"Invalid number: {number}"
+            )
+
         number_int_or_float = number
 
         if mode == "int" or number % 1 == 0:
+            if abs(number) >= MAX_INTEGER:
+                # Fail before formatting hundreds of digits (e.g., 1e300)
+                rank = decimal.Decimal(number).adjusted() // 3 * 3
+                raise ConversionError(
+                    ERROR_RANK_OUT_OF_RANGE,
+                    f"Rank value ({rank = }) out of range.",
+                )
+
             number_str = f"{number:.0f}"
 
         elif mode == "float":
             number_str = f"{number}"
 
+            # The small floats are represented in scientific notation
+            # (e.g., 1e-05)
+            match = SCIENTIFIC_PATTERN.fullmatch(number_str)
+            if match is not None:
+                number_str, error = expand_scientific(*match.groups())
+
+                if error is not None:
+                    raise error
+
     return number_int_or_float, number_str
 
 
+def buffer_to_str(buffer: bytes | bytearray | memoryview) -> str:
+    """Decode a buffer of ASCII characters (e.g., b"1 234,5").
+
+    Args:
+        buffer (bytes | bytearray | memoryview): The buffer.
+
+    Raises:
+        ConversionError: If the buffer is not made of ASCII characters.
+
+    Returns:
+        str: The characters of the buffer.
+    """
+    try:
+        # tobytes() also copies the non-contiguous views
+        return memoryview(buffer).tobytes().decode("ascii")
+
+    except (TypeError, ValueError) as exception:
+        raise ConversionError(
+            ERROR_INVALID_NUMBER,
+            f"Invalid number: {buffer!r} (expected ASCII characters)",
+        ) from exception
+
+
+def parse_digit_buffer(
+    buffer: bytes | bytearray | memoryview,
+) -> BufferDigits | None:
+    """Parse a buffer of ASCII digits in place, without decoding it.
+
+    Only the plain numbers are parsed: an optional "-", digits, and an
+    optional decimal point ("." or ",") followed by digits, with ASCII
+    whitespace around. The groups are read from slices of a memoryview
+    of the buffer, so no copy and no string is made.
+
+    Args:
+        buffer (bytes | bytearray | memoryview): The buffer.
+
+    Returns:
+        BufferDigits | None: The groups of the number, None if the buffer
+        is not a plain number which can be written in letters.
+    """
+    try:
+        view = memoryview(buffer).cast("B")
+
+    except TypeError:
+        # Not contiguous
+        return None
+
+    if len(view) > _MAX_PARSED_BUFFER_LENGTH:
+        return None
+
+    match = DIGIT_BUFFER_PATTERN.fullmatch(view)
+
+    if match is None:
+        return None
+
+    # The positions of the digits, the buffer is never copied
+    sign_start, sign_end = match.span(1)
+    integer_start = match.start(2)
+    integer_first, integer_end = match.span(3)
+    point = match.start(4)
+    decimal_start = match.start(5)
+    decimal_first, decimal_end = match.span(6)
+
+    if integer_start == integer_end or (
+        point != -1 and decimal_start == decimal_end
+    ):
+        # E.g., ".5" or "5.", which make_letters cleans
+        return None
+
+    integer_last = integer_end
+    while integer_last > integer_first and view[integer_last - 1] == 48:
+        integer_last -= 1
+
+    decimal_last = decimal_end
+    while decimal_last > decimal_first and view[decimal_last - 1] == 48:
+        decimal_last -= 1
+
+    if (
+        integer_end - integer_first > MAX_INTEGER_DIGITS
+        or decimal_last - decimal_start > MAX_DECIMAL_DIGITS
+    ):
+        return None
+
+    integer_groups = _slice_groups(
+        view[integer_start:integer_end],
+        integer_first - integer_start,
+        integer_last - integer_start,
+    )
+    decimal_groups = []
+
+    if point != -1:
+        decimal_groups = _slice_groups(
+            view[decimal_start:decimal_end],
+            decimal_first - decimal_start,
+            decimal_last - decimal_start,
+            decimal=True,
+        )
+
+    return BufferDigits(
+        sign_end > sign_start and bool(integer_groups or decimal_groups),
+        integer_groups,
+        decimal_groups,
+        point == -1,
+    )
+
+
+def clean_number_str(number_str: str) -> tuple[str, ConversionError | None]:
+    """Clean a number string and check it, without raising.
+
+    Args:
+        number_str (str): The number as a string (e.g., "-1 234,5").
+
+    Returns:
+        tuple[str, ConversionError | None]: The cleaned number (e.g.,
+        "-1234.5") and the error (not raised) if the number is invalid.
+    """
+    if "e" in number_str or "E" in number_str:
+        match = SCIENTIFIC_PATTERN.fullmatch(
+            NOT_A_SCIENTIFIC_PATTERN.sub("", number_str)
+        )
+
+        if match is not None:
+            return expand_scientific(*match.groups())
+
+    number_str = NOT_A_NUMBER_PATTERN.sub("", number_str)
+
+    if number_str.count(".") > 1:
+        return number_str, ConversionError(
+            ERROR_TOO_MANY_SEPARATORS,
+            "Invalid number: too many decimal points (.)",
+        )
+
+    if number_str.count(",") > 1:
+        return number_str, ConversionError(
+            ERROR_TOO_MANY_SEPARATORS,
+            "Invalid number: too many decimal points (,)",
+        )
+
+    # Only keep the decimal point
+    number_str = number_str.replace(",", ".")
+
+    if number_str.count(".") > 1:
+        return number_str, ConversionError(
+            ERROR_TOO_MANY_SEPARATORS,
+            "Invalid number: too many decimal points (. and ,)",
+        )
+
+    if "-" in number_str and not number_str.startswith("-"):
+        return number_str, ConversionError(
+            ERROR_MISPLACED_SIGN,
+            "Invalid number: negative sign must be at the beginning",
+        )
+
+    if number_str.count("-") > 1:
+        return number_str, ConversionError(
+            ERROR_MISPLACED_SIGN, "Invalid number: too many negative signs"
+        )
+
+    if number_str == "":
+        return number_str, ConversionError(
+            ERROR_EMPTY_INPUT, "Invalid number: empty string"
+        )
+
+    if NUMBER_PATTERN.fullmatch(number_str) is None:
+        return number_str, ConversionError(
+            ERROR_INVALID_NUMBER, f"Invalid number: {number_str!r}"
+        )
+
+    return number_str, None
+
+
+def expand_scientific(
+    sign: str, integer_part: str, decimal_part: str | None, exponent: str
+) -> tuple[str, ConversionError | None]:
+    """Expand a number in scientific notation, without raising.
+
+    The size of the number is computed from the exponent, so a number
+    which cannot be written in letters (e.g., "1e300") is rejected before
+    any digit is materialized.
+
+    Args:
+        sign (str): The sign of the number ("-", "+" or "").
+        integer_part (str): The digits before the decimal point.
+        decimal_part (str | None): The digits after the decimal point.
+        exponent (str): The exponent (e.g., "-40").
+
+    Returns:
+        tuple[str, ConversionError | None]: The number in plain notation
+        (e.g., "-0.25") and the error (not raised) if it is out of range.
+    """
+    digits = (integer_part + (decimal_part or "")).lstrip("0")
+    significant_digits = digits.rstrip("0")
+
+    if significant_digits == "":
+        return "0", None
+
+    if len(exponent.lstrip("+-").lstrip("0")) > 18:
+        return "", ConversionError(
+            ERROR_RANK_OUT_OF_RANGE, "Invalid number: exponent out of range"
+        )
+
+    # The number is significant_digits * 10**exponent
+    exponent_int = (
+        int(exponent)
+        - len(decimal_part or "")
+        + len(digits)
+        - len(significant_digits)
+    )
+    integer_digits = len(significant_digits) + exponent_int
+
+    if integer_digits > MAX_INTEGER_DIGITS:
+        return "", ConversionError(
+            ERROR_RANK_OUT_OF_RANGE,
+            f"Rank value (rank = {(integer_digits - 1) // 3 * 3}) "
+            "out of range.",
+        )
+
+    if -exponent_int > MAX_DECIMAL_DIGITS:
+        return "", ConversionError(
+            ERROR_RANK_OUT_OF_RANGE,
+            f"Rank value (rank = {(-exponent_int - 1) // 3 * 3 + 3}) "
+            "out of range.",
+        )
+
+    sign = "-" if sign == "-" else ""
+
+    if exponent_int >= 0:
+        return sign + significant_digits + "0" * exponent_int, None
+
+    if integer_digits > 0:
+        return (
+            sign
+            + significant_digits[:integer_digits]
+            + "."
+            + significant_digits[integer_digits:]
+        ), None
+
+    return sign + "0." + "0" * -integer_digits + significant_digits, None
+
+
+def check_number(
+    number: float | int | str | bytes, mode: str = "cardinal"
+) -> str | None:
+    """Check if a number can be converted to letters, without raising.
+
+    The check is cheap (no conversion), make_letters may still raise
+    a ConversionError for a number which passes it.
+
+    Args:
+        number (float | int | str | bytes): The number to check (or a
+        buffer of ASCII characters, see BUFFER_TYPES).
+        mode (str, optional): The mode of make_letters.
+        Defaults to "cardinal".
+
+    Returns:
+        str | None: The error code, or None if the number seems valid.
+    """
+    if mode not in MODES and mode not in CURRENCY_FORMS_FR:
+        return ERROR_INVALID_MODE
+
+    ordinal = mode.startswith("ordinal")
+
+    if isinstance(number, BUFFER_TYPES):
+        try:
+            number = buffer_to_str(number)
+
+        except ConversionError as decode_error:
+            return decode_error.code
+
+    if isinstance(number, str):
+        number_str, error = clean_number_str(number)
+
+        if error is not None:
+            return error.code
+
+        integer_part, point, decimal_part = number_str.strip().partition(".")
+
+        if ordinal and point:
+            return ERROR_NOT_AN_INTEGER
+
+        if len(integer_part.lstrip("-0")) > MAX_INTEGER_DIGITS:
+            return ERROR_RANK_OUT_OF_RANGE
+
+        if (
+            mode not in CURRENCY_FORMS_FR
+            and len(decimal_part.rstrip("0")) > MAX_DECIMAL_DIGITS
+        ):
+            return ERROR_RANK_OUT_OF_RANGE
+
+        return None
+
+    if isinstance(number, float):
+        if not math.isfinite(number):
+            return ERROR_INVALID_NUMBER
+
+        if ordinal and number % 1 != 0:
+            return ERROR_NOT_AN_INTEGER
+
+    if isinstance(number, (int, float)):
+        if abs(number) >= MAX_INTEGER:
+            return ERROR_RANK_OUT_OF_RANGE
+
+        return None
+
+    return ERROR_INVALID_NUMBER
+
+
 def big_number_from_rank(rank: int) -> str:
     """Get the big number from a rank.
 
@@ -180,6 +623,7 @@ def big_number_from_rank(rank: int) -> str:
 
     Raises:
         ValueError: If the rank is negative.
+        ConversionError: If the rank is out of range.
 
     Returns:
         str: The big number.
@@ -195,9 +639,8 @@ def big_number_from_rank(rank: int) -> str:
         return BIG_NUMBERS_BY_RANK[rank]
 
     except KeyError as exception:
-        traceback.print_exc()
-        raise ValueError(
-            f"Rank value ({rank = }) out of range."
+        raise ConversionError(
+            ERROR_RANK_OUT_OF_RANGE, f"Rank value ({rank = }) out of range."
         ) from exception
 
 
@@ -447,21 +890,33 @@ def integer_to_letters(
         Defaults to False.
 
     Raises:
-        ValueError: If the number is not an integer.
+        ConversionError: If the number is not an integer.
 
     Returns:
         str: The number in letters.
     """
-    number_int, number_str = numbers(number, mode="int")
+    if isinstance(number, str) and number.isascii() and number.isdigit():
+        # Plain digits (e.g., the decimal part of a number), no need to
+        # parse them (int() is quadratic for very long strings)
+        number_str = number
+        is_negative = False
+        under_one_thousand = len(number_str.lstrip("0")) <= 3
 
-    if not isinstance(number_int, int):
-        raise ValueError(
-            "Number must be an integer "
-            f"(received {number}, type {type(number)})"
-        )
+    else:
+        number_int, number_str = numbers(number, mode="int")
+
+        if not isinstance(number_int, int):
+            raise ConversionError(
+                ERROR_NOT_AN_INTEGER,
+                "Number must be an integer "
+                f"(received {number}, type {type(number)})",
+            )
+
+        is_negative = number_int < 0
+        under_one_thousand = number_int < 1000
 
     # Check if the number is negative
-    if number_int < 0:
+    if is_negative:
         return "moins " + integer_to_letters(
             number_str.replace("-", ""),
             language=language,
@@ -470,9 +925,10 @@ def integer_to_letters(
         )
 
     # We already have a function for numbers under 1000
-    if number_int < 1000 and not decimal:
+    if under_one_thousand and not decimal:
         return positive_integer_under_one_thousand(
-            number_int,
+            # The leading zeros may be longer than what int() parses
+            int(number_str.lstrip("0") or "0"),
             gender=gender,
             plural=plural,
             ordinal=ordinal,
@@ -480,63 +936,131 @@ def integer_to_letters(
             language=language,
         )
 
-    # Compute "rank"
-    rank = len(number_str) // 3 * 3
+    return groups_to_letters(
+        digit_groups(number_str, decimal=decimal),
+        decimal=decimal,
+        decimal_rank=decimal_rank,
+        plural=plural,
+        gender=gender,
+        ordinal=ordinal,
+        post_1990_orthographe=post_1990_orthographe,
+        language=language,
+    )
 
-    # print(rank)
 
-    if len(number_str) % 3:
-        rank += 3
+def digit_groups(
+    number_str: str, decimal: bool = False
+) -> list[tuple[int, int, int]]:
+    """Split digits in groups of three digits.
 
-    number_groups = []
+    The empty groups are skipped, and the runs of zeros at both ends are
+    not even sliced (e.g., the decimals of 0.000000000025).
+
+    Args:
+        number_str (str): The digits.
+        decimal (bool, optional): If True, the digits are a decimal part
+        (grouped from the left). Defaults to False.
+
+    Returns:
+        list[tuple[int, int, int]]: The rank, the value and the number of
+        digits of each group, from the highest group.
+    """
+    length = len(number_str)
+    first = length - len(number_str.lstrip("0"))
+    last = len(number_str.rstrip("0"))
+
+    return _slice_groups(number_str, first, last, decimal=decimal)
+
+
+def _slice_groups(
+    digits: str | memoryview, first: int, last: int, decimal: bool = False
+) -> list[tuple[int, int, int]]:
+    """Split digits in groups of three digits (see digit_groups).
+
+    Args:
+        digits (str | memoryview): The digits (a memoryview of ASCII
+        digits is read in place).
+        first (int): The position of the first non-zero digit.
+        last (int): The position after the last non-zero digit.
+        decimal (bool, optional): If True, the digits are a decimal part.
+        Defaults to False.
+    """
+    # Slice each group directly, the number is never copied
+    # (the grouping is linear in the number of digits)
+    length = len(digits)
 
     if not decimal:
-        ranks = big_number_from_rank
-        while len(number_str) > 0:
-            number_groups.append(number_str[-3:])
-            number_str = number_str[:-3]
-        number_groups.reverse()
+        group_slices = []
+        for group_index in range(
+            (length - first - 1) // 3, (length - last) // 3 - 1, -1
+        ):
+            end = length - 3 * group_index
+            group_slices.append((3 * group_index, max(0, end - 3), end))
 
     else:
-        ranks = decimal_from_rank
         # We are grouping the decimal part
-        while len(number_str) > 0:
-            number_groups.append(number_str[:3])
-            number_str = number_str[3:]
-
-    number_str = ""
-    for index, group in enumerate(number_groups):
-        # Compute current rank
-        group_rank = 3 * (index + 1)
-        if not decimal:
-            group_rank = rank - group_rank
-
-        # The group is empty, we skip it
-        if int(group) == 0:
-            continue
-
-        # Add a space or a tiret between groups
-        space = " " if not post_1990_orthographe else "-"
-        if number_str != "":
-            number_str += space
+        group_slices = [
+            (start + 3, start, min(length, start + 3))
+            for start in range(first // 3 * 3, last, 3)
+        ]
+
+    number_groups = []
+    for group_rank, start, end in group_slices:
+        group_int = int(digits[start:end])
+
+        if group_int != 0:
+            number_groups.append((group_rank, group_int, end - start))
+
+    return number_groups
+
+
+def groups_to_letters(
+    number_groups: Iterable[tuple[int, int, int]],
+    decimal: bool = False,
+    decimal_rank: bool = True,
+    plural: bool = False,
+    gender: str = "masculin",
+    ordinal: bool = False,
+    post_1990_orthographe: bool = False,
+    language: str = "fr_BE",
+) -> str:
+    """Convert groups of three digits to letters (see digit_groups).
+
+    Args:
+        number_groups (Iterable[tuple[int, int, int]]): The rank, the value
+        and the number of digits of each non-empty group.
+        The other arguments are the ones of integer_to_letters.
+
+    Raises:
+        ConversionError: If a rank is out of range.
+
+    Returns:
+        str: The number in letters.
+    """
+    ranks = decimal_from_rank if decimal else big_number_from_rank
 
+    # Add a space or a tiret between groups
+    space = " " if not post_1990_orthographe else "-"
+
+    letters_groups = []
+    for group_rank, group_int, width in number_groups:
         rank_str = ranks(group_rank)
         if group_rank > 3:
-            rank_str += "s" if int(group) > 1 and group_rank > 2 else ""
+            rank_str += "s" if group_int > 1 and group_rank > 2 else ""
 
             # We need to pad the group with 0s
-            if decimal and len(group) < 3:
-                group = group.ljust(3, "0")
+            if decimal and width < 3:
+                group_int *= 10 ** (3 - width)
                 rank_str += "s"
 
         # With low ranks, we keep the decimal rank
         elif decimal:
             # Recompute rank
-            rank_str = ranks(len(group))
-            rank_str += "s" if int(group) > 1 and group_rank > 2 else ""
+            rank_str = ranks(width)
+            rank_str += "s" if group_int > 1 and group_rank > 2 else ""
 
             # We may remove the decimal rank for low ranks
-            if len(group) < 3 and decimal_rank is False:
+            if width < 3 and decimal_rank is False:
                 rank_str = ""
 
         # Use ordinal in from of "mille" or
@@ -546,12 +1070,12 @@ def integer_to_letters(
         # We don't say "un cent" or "un mille", we say "mille" or "cent"
         # We do say "un million" or "un milliard", etc.
         # We do say "un dixième", "un centième", etc.
-        if int(group) == 1 and 0 < group_rank < 6 and not decimal:
+        if group_int == 1 and 0 < group_rank < 6 and not decimal:
             group_str = ""
 
         else:
             group_str = positive_integer_under_one_thousand(
-                int(group),
+                group_int,
                 gender=gender if group_rank == 0 else "masculin",
                 plural=plural if group_rank == 0 else False,
                 ordinal=use_ordinal,
@@ -560,9 +1084,9 @@ def integer_to_letters(
             )
             group_str += space if rank_str != "" else ""
 
-        number_str += group_str + rank_str
+        letters_groups.append(group_str + rank_str)
 
-    return number_str
+    return space.join(letters_groups)
 
 
 def float_to_letters(
@@ -631,7 +1155,7 @@ def float_to_letters(
 
 
 def make_letters(
-    number: float | int | str,
+    number: float | int | str | bytes,
     mode: str = "cardinal",
     gender: str = "masculin",
     plural: bool = False,
@@ -642,7 +1166,9 @@ def make_letters(
     """Convert a number to letters.
 
     Args:
-        number (float | int | str): The number to convert.
+        number (float | int | str | bytes): The number to convert (or a
+        buffer of ASCII characters, see BUFFER_TYPES, whose plain digits
+        are read in place).
         gender (str): For ordinal_nominal and cardinal_nominal. If 'feminine',
         the number will be feminine, if 'masculine',
         the number will be masculine.
@@ -656,11 +1182,355 @@ def make_letters(
         use_non_breaking_spaces (bool, optional): If True,
         use non-breaking spaces.
 
+    Raises:
+        ConversionError: If the number or the mode is invalid.
+
     Returns:
         str: The number in letters.
     """
+    if _conversion_limits is not None:
+        _conversion_limits.check(number, mode)
+
+    # Read once, another thread may unset them
+    call_recorder = _call_recorder
+    reference_oracle = _reference_oracle
+
+    if call_recorder is not None or reference_oracle is not None:
+        options = {
+            "mode": mode,
+            "gender": gender,
+            "plural": plural,
+            "language": language,
+            "post_1990_orthographe": post_1990_orthographe,
+            "use_non_breaking_spaces": use_non_breaking_spaces,
+        }
+
+        if call_recorder is not None:
+            return call_recorder(
+                "make_letters", _checked_make_letters, number, options
+            )
+
+        if reference_oracle is not None:
+            return reference_oracle(_make_letters, number, options)
+
+    return _make_letters(
+        number,
+        mode=mode,
+        gender=gender,
+        plural=plural,
+        language=language,
+        post_1990_orthographe=post_1990_orthographe,
+        use_non_breaking_spaces=use_non_breaking_spaces,
+    )
+
+
+def _checked_make_letters(
+    number: float | int | str | bytes, **options: Any
+) -> str:
+    """Convert a number to letters, with the reference check if enabled."""
+    reference_oracle = _reference_oracle
+
+    if reference_oracle is not None:
+        return reference_oracle(_make_letters, number, options)
+
+    return _make_letters(number, **options)
+
+
+def set_call_recorder(recorder: Callable[..., str] | None) -> None:
+    """Set the function which records the make_letters calls.
+
+    The make_currency calls are recorded too. The recorder is called with
+    the name of the function, the conversion function, the number and the
+    options (see nombres_vers_lettres.workload.enable_recording).
+
+    Args:
+        recorder (Callable[..., str] | None): The recorder, None to disable
+        it.
+    """
+    global _call_recorder
+    _call_recorder = recorder
+
+
+def set_reference_oracle(oracle: Callable[..., str] | None) -> None:
+    """Set the function which runs the make_letters conversions.
+
+    The oracle is called with the conversion function, the number and the
+    options (see nombres_vers_lettres.reference.enable_reference_check).
+
+    Args:
+        oracle (Callable[..., str] | None): The oracle, None to disable it.
+    """
+    global _reference_oracle
+    _reference_oracle = oracle
+
+
+def set_spelling_artifact(artifact: Any) -> None:
+    """Set the precomputed letters used by make_letters.
+
+    Args:
+        artifact (Any): The artifact (see nombres_vers_lettres.artifact),
+        None to stop using it.
+    """
+    global _spelling_artifact
+    _spelling_artifact = artifact
+
+
+def set_result_cache(cache: Any) -> None:
+    """Set the cache of the letters used by make_letters.
+
+    Args:
+        cache (Any): The cache, with get(key) and put(key, letters) methods
+        (see nombres_vers_lettres.cache), None to stop using it.
+    """
+    global _result_cache
+    _result_cache = cache
+
+
+def get_result_cache() -> Any:
+    """Get the cache of the letters used by make_letters (None if unset)."""
+    return _result_cache
+
+
+def set_conversion_limits(limits: Any) -> None:
+    """Set the limits checked by make_letters before any conversion.
+
+    Args:
+        limits (Any): The limits, with a check(number, mode) method (see
+        nombres_vers_lettres.limits), None to stop checking them.
+    """
+    global _conversion_limits
+    _conversion_limits = limits
+
+
+def get_conversion_limits() -> Any:
+    """Get the limits checked by make_letters (None if unset)."""
+    return _conversion_limits
+
+
+def cache_key(
+    number: Any,
+    mode: str = "cardinal",
+    gender: str = "masculin",
+    plural: bool = False,
+    language: str = "fr_BE",
+    post_1990_orthographe: bool = True,
+    use_non_breaking_spaces: bool = True,
+) -> str | None:
+    """Get the key of a conversion in a cache of the letters.
+
+    Args:
+        number (Any): The number to convert.
+        The other arguments are the options of make_letters.
+
+    Returns:
+        str | None: The key, None if the number cannot be cached.
+    """
+    if type(number) not in (int, float, str):
+        return None
+
+    return (
+        f"{type(number).__name__}:{number!r}|{mode}|{gender}|{int(plural)}|"
+        f"{language}|{int(post_1990_orthographe)}|"
+        f"{int(use_non_breaking_spaces)}"
+    )
+
+
+def _make_letters(
+    number: float | int | str | bytes,
+    mode: str = "cardinal",
+    gender: str = "masculin",
+    plural: bool = False,
+    language: str = "fr_BE",
+    post_1990_orthographe: bool = True,
+    use_non_breaking_spaces: bool = True,
+) -> str:
+    """Convert a number to letters (see make_letters)."""
+    if _spelling_artifact is not None:
+        letters = _spelling_artifact.lookup(
+            number,
+            mode=mode,
+            gender=gender,
+            plural=plural,
+            language=language,
+            post_1990_orthographe=post_1990_orthographe,
+        )
+
+        if letters is not None:
+            if use_non_breaking_spaces:
+                return letters
+
+            return letters.replace(" ", " ")
+
+    if _result_cache is None:
+        return _convert_number(
+            number,
+            mode=mode,
+            gender=gender,
+            plural=plural,
+            language=language,
+            post_1990_orthographe=post_1990_orthographe,
+            use_non_breaking_spaces=use_non_breaking_spaces,
+        )
+
+    key = cache_key(
+        number,
+        mode=mode,
+        gender=gender,
+        plural=plural,
+        language=language,
+        post_1990_orthographe=post_1990_orthographe,
+        use_non_breaking_spaces=use_non_breaking_spaces,
+    )
+    letters = _result_cache.get(key) if key is not None else None
+
+    if letters is None:
+        letters = _convert_number(
+            number,
+            mode=mode,
+            gender=gender,
+            plural=plural,
+            language=language,
+            post_1990_orthographe=post_1990_orthographe,
+            use_non_breaking_spaces=use_non_breaking_spaces,
+        )
+
+        if key is not None:
+            _result_cache.put(key, letters)
+
+    return letters
+
+
+def _groups_to_integer_letters(
+    groups: list[tuple[int, int, int]],
+    gender: str = "masculin",
+    plural: bool = False,
+    ordinal: bool = False,
+    post_1990_orthographe: bool = False,
+    language: str = "fr_BE",
+) -> str:
+    """Write the groups of a positive integer (see integer_to_letters)."""
+    if all(group_rank == 0 for group_rank, _, _ in groups):
+        return positive_integer_under_one_thousand(
+            groups[0][1] if groups else 0,
+            gender=gender,
+            plural=plural,
+            ordinal=ordinal,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        )
+
+    return groups_to_letters(
+        groups,
+        plural=plural,
+        gender=gender,
+        ordinal=ordinal,
+        post_1990_orthographe=post_1990_orthographe,
+        language=language,
+    )
+
+
+def _buffer_letters(
+    digits: BufferDigits,
+    mode: str,
+    gender: str,
+    plural: bool,
+    language: str,
+    post_1990_orthographe: bool,
+) -> str | None:
+    """Write a parsed buffer (see parse_digit_buffer), with non-breaking
+    spaces.
+
+    Returns:
+        str | None: The letters, None if the number is written from its
+        string (the currencies, and the errors of the ordinal modes).
+    """
+    if mode in ("cardinal", "cardinal_nominal"):
+        if not digits.decimal_groups:
+            letters = _groups_to_integer_letters(
+                digits.integer_groups,
+                gender=gender,
+                plural=plural,
+                post_1990_orthographe=post_1990_orthographe,
+                language=language,
+            )
+
+        else:
+            letters = (
+                _groups_to_integer_letters(
+                    digits.integer_groups,
+                    post_1990_orthographe=post_1990_orthographe,
+                    language=language,
+                )
+                + " virgule "
+                + groups_to_letters(
+                    digits.decimal_groups,
+                    decimal=True,
+                    decimal_rank=True,
+                    post_1990_orthographe=post_1990_orthographe,
+                    language=language,
+                )
+            )
+
+        return "moins " + letters if digits.negative else letters
+
+    if (
+        mode not in ("ordinal_adjectival", "ordinal", "ordinal_nominal")
+        or digits.negative
+        or not digits.is_integer
+    ):
+        return None
+
+    if mode == "ordinal_nominal":
+        return make_ordinal(
+            _groups_to_integer_letters(
+                digits.integer_groups,
+                post_1990_orthographe=post_1990_orthographe,
+                language=language,
+            ),
+            gender=gender,
+            plural=plural,
+        )
+
+    return _groups_to_integer_letters(
+        digits.integer_groups,
+        ordinal=True,
+        post_1990_orthographe=post_1990_orthographe,
+        language=language,
+    )
+
+
+def _convert_number(
+    number: float | int | str | bytes,
+    mode: str = "cardinal",
+    gender: str = "masculin",
+    plural: bool = False,
+    language: str = "fr_BE",
+    post_1990_orthographe: bool = True,
+    use_non_breaking_spaces: bool = True,
+) -> str:
+    """Convert a number to letters, without any cache (see make_letters)."""
     space = " " if use_non_breaking_spaces else " "
 
+    if isinstance(number, BUFFER_TYPES):
+        digits = parse_digit_buffer(number)
+        letters = None
+
+        if digits is not None:
+            letters = _buffer_letters(
+                digits,
+                mode=mode,
+                gender=gender,
+                plural=plural,
+                language=language,
+                post_1990_orthographe=post_1990_orthographe,
+            )
+
+        if letters is not None:
+            return letters.replace(" ", space)
+
+        # Written from its string, with the same errors
+        number = buffer_to_str(number)
+
     if mode in ("cardinal", "cardinal_nominal"):
         # un, deux, trois virgule cinq
         return float_to_letters(
@@ -677,7 +1547,8 @@ def make_letters(
             number = int(number)
 
         else:
-            raise ValueError(
+            raise ConversionError(
+                ERROR_NOT_AN_INTEGER,
                 "Invalid number: float number must be an integer "
                 f"(received {number}, type {type(number)})"
             )
@@ -706,11 +1577,11 @@ def make_letters(
         ).replace(" ", space)
 
     if mode in CURRENCY_FORMS_FR_CODES:
-        return make_currency(
+        return _make_currency(
             number,
             currency=mode,
             post_1990_orthographe=post_1990_orthographe,
             language=language,
         ).replace(" ", space)
 
-    raise ValueError(f"Invalid mode {mode = }")
+    raise ConversionError(ERROR_INVALID_MODE, f"Invalid mode {mode = }")
@@ -0,0 +1,500 @@
+"""Parse a number once, write it in several variants.
+
+parse_number() cleans and groups a number once: the sign, the groups of
+three digits of the integer part and of the decimal part (values, ranks
+and widths). render_letters() writes one variant (mode, gender, plural,
+language and orthographe) from those groups, without parsing the number
+again, and render_variants() writes many variants in one pass, each
+distinct variant being written once:
+
+    parsed = parse_number("1234,5")
+    results = render_variants(
+        parsed,
+        variant_options(
+            modes=("cardinal", "EUR"), languages=("fr_BE", "fr_FR")
+        ),
+    )
+
+The letters are always the ones of make_letters with the same options.
+The numbers which are not plain digits once cleaned (or which cannot be
+parsed) are written by make_letters itself, which raises the same
+errors.
+"""
+
+import itertools
+from collections.abc import Iterable
+from typing import Any, NamedTuple
+
+from nombres_vers_lettres.batch import LettersResult
+from nombres_vers_lettres.constants import (
+    CURRENCY_FORMS_FR,
+    CURRENCY_FORMS_FR_CODES,
+    ERROR_INVALID_NUMBER,
+)
+from nombres_vers_lettres.make_letters import (
+    ConversionError,
+    digit_groups,
+    groups_to_letters,
+    make_currency,
+    make_letters,
+    make_ordinal,
+    numbers,
+    positive_integer_under_one_thousand,
+)
+
+# The options of a variant which change the letters of each mode
+# (the other options are ignored by the mode)
+VARIANT_OPTIONS_BY_MODE = {
+    "cardinal": ("gender", "plural", "language", "post_1990_orthographe"),
+    "cardinal_nominal": (
+        "gender",
+        "plural",
+        "language",
+        "post_1990_orthographe",
+    ),
+    "ordinal_adjectival": ("language", "post_1990_orthographe"),
+    "ordinal": ("language", "post_1990_orthographe"),
+    "ordinal_nominal": (
+        "gender",
+        "plural",
+        "language",
+        "post_1990_orthographe",
+    ),
+}
+
+# The options of make_letters and their defaults
+DEFAULT_OPTIONS = {
+    "mode": "cardinal",
+    "gender": "masculin",
+    "plural": False,
+    "language": "fr_BE",
+    "post_1990_orthographe": True,
+    "use_non_breaking_spaces": True,
+}
+
+
+class ParsedNumber(NamedTuple):
+    """A number parsed once (see parse_number).
+
+    Attributes:
+        number (Any): The number as given.
+        value (float | int): The number as a float or an int.
+        negative (bool): If True, the number is negative.
+        number_str (str): The cleaned number (e.g., "-1234.5").
+        integer_groups (tuple[tuple[int, int, int], ...] | None): The rank,
+        the value and the number of digits of each non-empty group of the
+        integer part, None if the number is written by make_letters.
+        decimal_groups (tuple[tuple[int, int, int], ...]): The same for the
+        decimal part.
+        is_integer (bool): If True, the number has no decimal part.
+    """
+
+    number: Any
+    value: float | int
+    negative: bool
+    number_str: str
+    integer_groups: tuple[tuple[int, int, int], ...] | None
+    decimal_groups: tuple[tuple[int, int, int], ...]
+    is_integer: bool
+
+
+def parse_number(number: float | int | str) -> ParsedNumber:
+    """Parse a number once, to write it in several variants.
+
+    Never raises: the errors are raised when the number is written.
+
+    Args:
+        number (float | int | str): The number to parse.
+
+    Returns:
+        ParsedNumber: The parsed number.
+    """
+    try:
+        value, number_str = numbers(number, mode="float")
+
+    except ValueError:
+        return ParsedNumber(number, 0, False, "", None, (), False)
+
+    negative = value < 0
+    digits = number_str.replace("-", "") if negative else number_str
+    integer_part, point, decimal_part = digits.partition(".")
+
+    if not (
+        integer_part.isascii()
+        and integer_part.isdigit()
+        and decimal_part.isascii()
+        and (decimal_part == "" or decimal_part.isdigit())
+    ):
+        # E.g., ".5" or "12\n", make_letters knows what to do with them
+        return ParsedNumber(
+            number, value, negative, number_str, None, (), False
+        )
+
+    return ParsedNumber(
+        number=number,
+        value=value,
+        negative=negative,
+        number_str=number_str,
+        integer_groups=tuple(digit_groups(integer_part)),
+        decimal_groups=tuple(digit_groups(decimal_part, decimal=True)),
+        is_integer=point == "",
+    )
+
+
+def _integer_letters(
+    integer_groups: tuple[tuple[int, int, int], ...],
+    gender: str = "masculin",
+    plural: bool = False,
+    ordinal: bool = False,
+    post_1990_orthographe: bool = False,
+    language: str = "fr_BE",
+    memo: dict[tuple[Any, ...], str] | None = None,
+) -> str:
+    """Write the groups of a positive integer (see integer_to_letters).
+
+    The letters are kept in memo (if any) for the other variants of the
+    number.
+    """
+    if memo is not None:
+        key = (gender, plural, ordinal, post_1990_orthographe, language)
+        letters = memo.get(key)
+
+        if letters is None:
+            letters = memo[key] = _integer_letters(
+                integer_groups,
+                gender=gender,
+                plural=plural,
+                ordinal=ordinal,
+                post_1990_orthographe=post_1990_orthographe,
+                language=language,
+            )
+
+        return letters
+
+    if all(group_rank == 0 for group_rank, _, _ in integer_groups):
+        return positive_integer_under_one_thousand(
+            integer_groups[0][1] if integer_groups else 0,
+            gender=gender,
+            plural=plural,
+            ordinal=ordinal,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        )
+
+    return groups_to_letters(
+        integer_groups,
+        plural=plural,
+        gender=gender,
+        ordinal=ordinal,
+        post_1990_orthographe=post_1990_orthographe,
+        language=language,
+    )
+
+
+def _currency_letters(
+    parsed: ParsedNumber,
+    currency: str,
+    post_1990_orthographe: bool,
+    language: str,
+    memo: dict[tuple[Any, ...], str] | None = None,
+) -> str:
+    """Write a parsed number in a currency (see make_currency)."""
+    integer_part, point, decimal_part = parsed.number_str.partition(".")
+    integer_groups = parsed.integer_groups or ()
+
+    if point and (-1 < parsed.value < 1 or not integer_groups):
+        # Under one unit, only the cents are written
+        return make_currency(
+            parsed.number_str,
+            currency=currency,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        )
+
+    if parsed.negative:
+        # The negative integers are written without the options
+        letters = "moins\xa0" + _integer_letters(
+            integer_groups, language=language, memo=memo
+        )
+
+    else:
+        letters = _integer_letters(
+            integer_groups,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+            memo=memo,
+        )
+
+    # The amount is plural above one (with the integer part only)
+    plural = 0
+    if integer_groups and not parsed.negative:
+        group_rank, group_int, _ = integer_groups[0]
+        plural = int(group_rank > 0 or group_int > 1)
+    current_currency = CURRENCY_FORMS_FR[currency][0][plural]
+
+    de_or_space = "\xa0"
+    if integer_part.endswith("000000"):
+        start_with_vowel = current_currency.startswith(
+            ("a", "e", "i", "o", "u", "y")
+        )
+        de_or_space = "\xa0d'" if start_with_vowel else "\xa0de\xa0"
+
+    letters += de_or_space + current_currency
+
+    if not point:
+        return letters
+
+    # The cents are written from their own digits
+    return (
+        letters
+        + "\xa0et\xa0"
+        + make_currency(
+            f"0.{decimal_part}",
+            currency=currency,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        )
+    )
+
+
+def _render(
+    parsed: ParsedNumber,
+    mode: str,
+    gender: str,
+    plural: bool,
+    language: str,
+    post_1990_orthographe: bool,
+    memo: dict[tuple[Any, ...], str] | None = None,
+) -> str:
+    """Write a variant of a parsed number, with non-breaking spaces.
+
+    Args:
+        memo (dict[tuple[Any, ...], str] | None, optional): The letters of
+        the integer part shared by the variants of the number.
+        The other arguments are the ones of render_letters.
+    """
+    integer_groups = parsed.integer_groups
+    cardinal = mode in ("cardinal", "cardinal_nominal")
+    currency = mode in CURRENCY_FORMS_FR_CODES
+
+    if (
+        integer_groups is None
+        or (mode not in VARIANT_OPTIONS_BY_MODE and not currency)
+        or not (
+            cardinal
+            or parsed.is_integer
+            # The decimal floats are rejected by the other modes
+            or (currency and not isinstance(parsed.number, float))
+        )
+    ):
+        # make_letters writes the number (or raises its error)
+        return make_letters(
+            parsed.number,
+            mode=mode,
+            gender=gender,
+            plural=plural,
+            language=language,
+            post_1990_orthographe=post_1990_orthographe,
+        )
+
+    if cardinal:
+        if not parsed.decimal_groups:
+            letters = _integer_letters(
+                integer_groups,
+                gender=gender,
+                plural=plural,
+                post_1990_orthographe=post_1990_orthographe,
+                language=language,
+                memo=memo,
+            )
+
+        else:
+            letters = (
+                _integer_letters(
+                    integer_groups,
+                    post_1990_orthographe=post_1990_orthographe,
+                    language=language,
+                    memo=memo,
+                )
+                + "\xa0virgule\xa0"
+                + groups_to_letters(
+                    parsed.decimal_groups,
+                    decimal=True,
+                    decimal_rank=True,
+                    post_1990_orthographe=post_1990_orthographe,
+                    language=language,
+                )
+            )
+
+        return "moins\xa0" + letters if parsed.negative else letters
+
+    if currency:
+        return _currency_letters(
+            parsed,
+            currency=mode,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+            memo=memo,
+        )
+
+    ordinal_adjectival = mode != "ordinal_nominal"
+
+    if parsed.negative:
+        # The negative integers are written without the options
+        letters = "moins\xa0" + _integer_letters(
+            integer_groups, language=language, memo=memo
+        )
+
+    else:
+        letters = _integer_letters(
+            integer_groups,
+            ordinal=ordinal_adjectival,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+            memo=memo,
+        )
+
+    if ordinal_adjectival:
+        return letters
+
+    return make_ordinal(letters, gender=gender, plural=plural)
+
+
+def render_letters(
+    parsed: ParsedNumber,
+    mode: str = "cardinal",
+    gender: str = "masculin",
+    plural: bool = False,
+    language: str = "fr_BE",
+    post_1990_orthographe: bool = True,
+    use_non_breaking_spaces: bool = True,
+) -> str:
+    """Write a parsed number in letters (see make_letters).
+
+    Args:
+        parsed (ParsedNumber): The number (see parse_number).
+        The other arguments are the options of make_letters.
+
+    Raises:
+        ConversionError: If the number or the options are invalid.
+
+    Returns:
+        str: The number in letters.
+    """
+    letters = _render(
+        parsed,
+        mode=mode,
+        gender=gender,
+        plural=plural,
+        language=language,
+        post_1990_orthographe=post_1990_orthographe,
+    )
+
+    if use_non_breaking_spaces:
+        return letters
+
+    return letters.replace("\xa0", " ")
+
+
+def variant_options(
+    modes: Iterable[str] = ("cardinal",),
+    genders: Iterable[str] = ("masculin",),
+    plurals: Iterable[bool] = (False,),
+    languages: Iterable[str] = ("fr_BE",),
+    post_1990_orthographes: Iterable[bool] = (True,),
+    use_non_breaking_spaces: bool = True,
+) -> list[dict[str, Any]]:
+    """Get the options of every combination of variants.
+
+    Returns:
+        list[dict[str, Any]]: The keyword arguments of render_letters (and
+        make_letters) of each variant.
+    """
+    return [
+        {
+            "mode": mode,
+            "gender": gender,
+            "plural": plural,
+            "language": language,
+            "post_1990_orthographe": post_1990_orthographe,
+            "use_non_breaking_spaces": use_non_breaking_spaces,
+        }
+        for mode, gender, plural, language, post_1990_orthographe in (
+            itertools.product(
+                modes, genders, plurals, languages, post_1990_orthographes
+            )
+        )
+    ]
+
+
+def render_variants(
+    parsed: ParsedNumber | float | int | str,
+    variants: Iterable[dict[str, Any]],
+) -> list[LettersResult]:
+    """Write a number in several variants, without raising.
+
+    The number is parsed once, and the variants which only differ by
+    options ignored by their mode (e.g., the gender of an ordinal
+    adjectival) are written once.
+
+    Args:
+        parsed (ParsedNumber | float | int | str): The number, parsed or
+        not.
+        variants (Iterable[dict[str, Any]]): The options of each variant
+        (see variant_options), the missing options have the defaults of
+        make_letters.
+
+    Returns:
+        list[LettersResult]: The letters or the error code of each variant.
+    """
+    if not isinstance(parsed, ParsedNumber):
+        parsed = parse_number(parsed)
+
+    rendered: dict[tuple[Any, ...], LettersResult] = {}
+    memo: dict[tuple[Any, ...], str] = {}
+    results = []
+
+    for variant in variants:
+        options = {**DEFAULT_OPTIONS, **variant}
+        mode = options["mode"]
+        key = (mode,) + tuple(
+            options[name]
+            for name in VARIANT_OPTIONS_BY_MODE.get(
+                mode, ("language", "post_1990_orthographe")
+            )
+        )
+
+        result = rendered.get(key)
+        if result is None:
+            try:
+                result = LettersResult(
+                    _render(
+                        parsed,
+                        mode=mode,
+                        gender=options["gender"],
+                        plural=options["plural"],
+                        language=options["language"],
+                        post_1990_orthographe=options[
+                            "post_1990_orthographe"
+                        ],
+                        memo=memo,
+                    ),
+                    None,
+                )
+
+            except ConversionError as exception:
+                result = LettersResult(None, exception.code)
+
+            except ValueError:
+                result = LettersResult(None, ERROR_INVALID_NUMBER)
+
+            rendered[key] = result
+
+        if result.letters is not None and not options[
+            "use_non_breaking_spaces"
+        ]:
+            result = LettersResult(result.letters.replace("\xa0", " "), None)
+
+        results.append(result)
+
+    return results
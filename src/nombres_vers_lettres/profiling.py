@@ -0,0 +1,275 @@
+"""Allocation profiles of make_letters (with tracemalloc).
+
+profile_allocations() converts sample numbers with one set of options and
+reports, per make_letters call:
+
+- the peak of the memory allocated during the call (temporary strings
+  and lists included);
+- the memory blocks allocated by the call and still allocated when it
+  returns (the letters and what the call keeps, e.g., in a cache);
+- the memory blocks still allocated by the library after the calls (a
+  growth of the retained memory means a leak or an unbounded cache).
+
+Only the allocations made by the library are counted, so that the
+profile tells the library apart from the calling code. The budgets of
+ALLOCATION_BUDGETS, BLOCKS_BUDGETS and RETAINED_BUDGET are checked by
+check_budgets() and by ``python -m nombres_vers_lettres.profiling``.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tracemalloc
+from collections.abc import Iterable
+from typing import Any, NamedTuple
+
+from nombres_vers_lettres.constants import AVAILABLE_LANGUAGES
+from nombres_vers_lettres.make_letters import make_letters
+
+# The modes of the profiles
+PROFILED_MODES = ("cardinal", "ordinal_adjectival", "ordinal_nominal", "EUR")
+
+# Maximal peak of the memory allocated by a call, in bytes, per mode
+ALLOCATION_BUDGETS = {
+    "cardinal": 12_288,
+    "ordinal_adjectival": 12_288,
+    "ordinal_nominal": 12_288,
+    "EUR": 12_288,
+}
+
+# Maximal number of memory blocks allocated by a call and still allocated
+# when it returns (the letters), per mode
+BLOCKS_BUDGETS = {
+    "cardinal": 1.5,
+    "ordinal_adjectival": 1.5,
+    "ordinal_nominal": 1.5,
+    "EUR": 1.5,
+}
+
+# Maximal memory retained by the library after the calls, in bytes
+RETAINED_BUDGET = 1_024
+
+_PACKAGE_FILES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "*")
+
+
+class AllocationProfile(NamedTuple):
+    """The allocations of make_letters for a set of options."""
+
+    options: dict[str, Any]
+    calls: int
+    peak_bytes: int
+    retained_blocks: int
+    retained_bytes: int
+    blocks_per_call: float = 0.0
+
+
+def sample_numbers(count: int = 1_000, seed: int = 0) -> list[Any]:
+    """Get sample numbers of every size (integers, decimals, strings).
+
+    Args:
+        count (int, optional): The number of numbers. Defaults to 1_000.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        list[Any]: The numbers.
+    """
+    generator = random.Random(seed)
+    numbers: list[Any] = []
+
+    for index in range(count):
+        digits = 1 + index % 60
+        number = generator.randrange(10**digits)
+
+        if index % 3 == 0:
+            numbers.append(number)
+
+        elif index % 3 == 1:
+            numbers.append(str(number))
+
+        else:
+            numbers.append(f"{number}.{generator.randrange(100):02d}")
+
+    return numbers
+
+
+def profile_allocations(
+    numbers: Iterable[Any], **options: Any
+) -> AllocationProfile:
+    """Profile the allocations of make_letters on numbers.
+
+    The numbers which cannot be converted with the options are skipped.
+
+    Args:
+        numbers (Iterable[Any]): The numbers to convert.
+        **options: The keyword arguments of make_letters.
+
+    Returns:
+        AllocationProfile: The allocations per call.
+    """
+    numbers = list(numbers)
+    valid_numbers = []
+
+    # Warm up (and skip the invalid numbers)
+    for number in numbers:
+        try:
+            make_letters(number, **options)
+            valid_numbers.append(number)
+
+        except ValueError:
+            pass
+
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+
+    try:
+        # The allocations of the profiling itself are not counted
+        library = (
+            tracemalloc.Filter(True, _PACKAGE_FILES),
+            tracemalloc.Filter(False, __file__),
+        )
+        # The letters are kept until all the calls are made, so that the
+        # blocks still allocated when a call returns are counted (the list
+        # is allocated before, not to count its growth in the peaks)
+        letters: list[str | None] = [None] * len(valid_numbers)
+        before = tracemalloc.take_snapshot().filter_traces(library)
+        peak_bytes = 0
+
+        for index, number in enumerate(valid_numbers):
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            letters[index] = make_letters(number, **options)
+            _, peak = tracemalloc.get_traced_memory()
+            peak_bytes = max(peak_bytes, peak - current)
+
+        kept = tracemalloc.take_snapshot().filter_traces(library)
+        del letters
+        after = tracemalloc.take_snapshot().filter_traces(library)
+
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+    differences = after.compare_to(before, "filename")
+    kept_blocks = sum(
+        difference.count_diff
+        for difference in kept.compare_to(before, "filename")
+    )
+    return AllocationProfile(
+        options=options,
+        calls=len(valid_numbers),
+        peak_bytes=peak_bytes,
+        retained_blocks=sum(
+            difference.count_diff for difference in differences
+        ),
+        retained_bytes=sum(difference.size_diff for difference in differences),
+        blocks_per_call=kept_blocks / max(1, len(valid_numbers)),
+    )
+
+
+def profile_paths(
+    numbers: Iterable[Any] | None = None,
+    modes: Iterable[str] = PROFILED_MODES,
+    languages: Iterable[str] = AVAILABLE_LANGUAGES,
+) -> list[AllocationProfile]:
+    """Profile the allocations of make_letters for each mode and language.
+
+    Args:
+        numbers (Iterable[Any] | None, optional): The numbers to convert.
+        Defaults to sample_numbers().
+        modes (Iterable[str], optional): Defaults to PROFILED_MODES.
+        languages (Iterable[str], optional): Defaults to every language.
+
+    Returns:
+        list[AllocationProfile]: The profiles.
+    """
+    numbers = sample_numbers() if numbers is None else list(numbers)
+    return [
+        profile_allocations(numbers, mode=mode, language=language)
+        for mode in modes
+        for language in languages
+    ]
+
+
+def check_budgets(profiles: Iterable[AllocationProfile]) -> list[str]:
+    """Check the profiles against the budgets.
+
+    The budgets are ALLOCATION_BUDGETS, BLOCKS_BUDGETS and RETAINED_BUDGET.
+
+    Returns:
+        list[str]: The exceeded budgets (empty if none).
+    """
+    exceeded = []
+
+    for profile in profiles:
+        mode = profile.options.get("mode", "cardinal")
+        budget = ALLOCATION_BUDGETS.get(mode)
+
+        if budget is not None and profile.peak_bytes > budget:
+            exceeded.append(
+                f"{profile.options}: peak of {profile.peak_bytes} bytes "
+                f"per call (budget {budget})"
+            )
+
+        blocks_budget = BLOCKS_BUDGETS.get(mode)
+
+        if (
+            blocks_budget is not None
+            and profile.blocks_per_call > blocks_budget
+        ):
+            exceeded.append(
+                f"{profile.options}: {profile.blocks_per_call:.2f} blocks "
+                f"allocated per call (budget {blocks_budget})"
+            )
+
+        if profile.retained_bytes > RETAINED_BUDGET:
+            exceeded.append(
+                f"{profile.options}: {profile.retained_bytes} bytes retained "
+                f"after {profile.calls} calls (budget {RETAINED_BUDGET})"
+            )
+
+    return exceeded
+
+
+def main():
+    """Print the allocation profiles from the command line."""
+    parser = argparse.ArgumentParser(
+        "python -m nombres_vers_lettres.profiling",
+        description=(
+            "Profile the allocations of make_letters for each mode and "
+            "language, and check the allocation budgets"
+        ),
+    )
+    parser.add_argument("--count", type=int, default=1_000)
+    parser.add_argument(
+        "--languages", type=str, default=",".join(AVAILABLE_LANGUAGES)
+    )
+    parser.add_argument("--modes", type=str, default=",".join(PROFILED_MODES))
+    args = parser.parse_args()
+
+    profiles = profile_paths(
+        sample_numbers(args.count),
+        modes=args.modes.split(","),
+        languages=args.languages.split(","),
+    )
+
+    for profile in profiles:
+        print(
+            f"{profile.options['mode']:>18} {profile.options['language']}: "
+            f"peak {profile.peak_bytes:>6} bytes per call, "
+            f"{profile.blocks_per_call:.2f} blocks allocated per call, "
+            f"{profile.retained_blocks} blocks "
+            f"({profile.retained_bytes} bytes) retained "
+            f"after {profile.calls} calls"
+        )
+
+    exceeded = check_budgets(profiles)
+    for message in exceeded:
+        print(f"Budget exceeded: {message}")
+
+    sys.exit(1 if exceeded else 0)
+
+
+if __name__ == "__main__":
+    main()
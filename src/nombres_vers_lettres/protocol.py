@@ -0,0 +1,245 @@
+"""JSON Lines protocol to use the library from another process.
+
+Each request is a JSON object on one line:
+
+    {"id": 1, "number": "21", "mode": "cardinal", "language": "fr_FR",
+     "gender": "féminin", "plural": false, "post_1990_orthographe": true}
+
+Only "number" is required, the other options have the default values of
+make_letters (an unknown mode, gender or language is an error). Each
+response is a JSON object on one line, with the id of the request and
+either the letters or an error code (see ConversionError) and a message:
+
+    {"id": 1, "letters": "vingt-et-une"}
+    {"id": 2, "error": "invalid_number", "message": "..."}
+
+Run ``python -m nombres_vers_lettres --jsonl`` to read the requests from
+the standard input and write the responses to the standard output.
+"""
+
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, BinaryIO
+
+from nombres_vers_lettres.constants import (
+    AVAILABLE_LANGUAGES,
+    CURRENCY_FORMS_FR_CODES,
+    ERROR_INVALID_MODE,
+    ERROR_INVALID_NUMBER,
+    ERROR_INVALID_REQUEST,
+    MODES,
+    VALID_FEMININE,
+    VALID_MASCULINE,
+)
+from nombres_vers_lettres.make_letters import ConversionError, make_letters
+
+# The options of make_letters which a request can set, and their types
+REQUEST_OPTIONS = {
+    "mode": str,
+    "gender": str,
+    "plural": bool,
+    "language": str,
+    "post_1990_orthographe": bool,
+    "use_non_breaking_spaces": bool,
+}
+
+# The values accepted for the options which are names, and the error code
+# of another value
+REQUEST_CHOICES = {
+    "mode": (MODES + tuple(CURRENCY_FORMS_FR_CODES), ERROR_INVALID_MODE),
+    "gender": (VALID_FEMININE + VALID_MASCULINE, ERROR_INVALID_REQUEST),
+    "language": (AVAILABLE_LANGUAGES, ERROR_INVALID_REQUEST),
+}
+
+# Size of the reads of the standard input
+READ_SIZE = 1 << 16
+
+
+def _error(request_id: Any, code: str, message: str) -> dict[str, Any]:
+    """Get an error response."""
+    return {"id": request_id, "error": code, "message": message}
+
+
+def handle_request(request: Any) -> dict[str, Any]:
+    """Convert the number of a request.
+
+    Args:
+        request (Any): The decoded request (a dict with a "number" key).
+
+    Returns:
+        dict[str, Any]: The response, with the letters or the error.
+    """
+    if not isinstance(request, dict):
+        return _error(None, ERROR_INVALID_REQUEST, "Expected a JSON object")
+
+    request_id = request.get("id")
+    number = request.get("number")
+
+    if isinstance(number, bool) or not isinstance(number, (int, float, str)):
+        return _error(
+            request_id,
+            ERROR_INVALID_REQUEST,
+            "Expected a number or a string in 'number'",
+        )
+
+    options = {}
+    for name, option_type in REQUEST_OPTIONS.items():
+        if name not in request:
+            continue
+
+        if not isinstance(request[name], option_type):
+            return _error(
+                request_id,
+                ERROR_INVALID_REQUEST,
+                f"Expected a {option_type.__name__} in '{name}'",
+            )
+
+        if name in REQUEST_CHOICES:
+            choices, code = REQUEST_CHOICES[name]
+
+            if request[name] not in choices:
+                return _error(
+                    request_id,
+                    code,
+                    f"Invalid {name} ({request[name]!r}), expected one of "
+                    f"{', '.join(choices)}",
+                )
+
+        options[name] = request[name]
+
+    try:
+        return {"id": request_id, "letters": make_letters(number, **options)}
+
+    except ConversionError as exception:
+        return _error(request_id, exception.code, str(exception))
+
+    except (ValueError, ArithmeticError) as exception:
+        return _error(request_id, ERROR_INVALID_NUMBER, str(exception))
+
+    except Exception as exception:
+        # A single request never stops the process which answers the
+        # others
+        return _error(
+            request_id,
+            ERROR_INVALID_REQUEST,
+            f"Unexpected error ({type(exception).__name__}: {exception})",
+        )
+
+
+def handle_line(line: bytes | str) -> bytes:
+    """Convert the number of an encoded request.
+
+    Args:
+        line (bytes | str): The JSON request.
+
+    Returns:
+        bytes: The JSON response, with a new line.
+    """
+    try:
+        request = json.loads(line)
+
+    except ValueError as exception:
+        response = _error(None, ERROR_INVALID_REQUEST, str(exception))
+
+    else:
+        response = handle_request(request)
+
+    return json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def handle_lines(lines: list[bytes]) -> bytes:
+    """Convert the numbers of encoded requests (blank lines are skipped).
+
+    Returns:
+        bytes: The JSON responses, one per line.
+    """
+    return b"".join(handle_line(line) for line in lines if line.strip())
+
+
+def _split(lines: list[bytes], chunks: int) -> list[list[bytes]]:
+    """Split the lines in chunks of about the same size."""
+    size = max(1, -(-len(lines) // chunks))
+    return [lines[start:start + size] for start in range(0, len(lines), size)]
+
+
+def serve_jsonl(
+    input_fd: int | None = None,
+    output: BinaryIO | None = None,
+    workers: int = 0,
+    ordered: bool = True,
+) -> None:
+    """Answer JSON Lines requests until the end of the input.
+
+    The input is read by blocks, the requests of the complete lines of a
+    block form a batch, whose responses are written and flushed together.
+
+    Args:
+        input_fd (int | None, optional): The file descriptor of the
+        requests. Defaults to the standard input.
+        output (BinaryIO | None, optional): The binary stream of the
+        responses. Defaults to the standard output.
+        workers (int, optional): The number of worker processes, 0 to
+        convert in the current process. Defaults to 0.
+        ordered (bool, optional): If True, the responses of a batch are in
+        the order of the requests, otherwise they are written as soon as
+        they are ready (use the ids to match them). Defaults to True.
+    """
+    if input_fd is None:
+        input_fd = sys.stdin.fileno()
+
+    if output is None:
+        output = sys.stdout.buffer
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers else None
+    # The blocks of the line being read, joined once the line is complete
+    # (a long line read in many blocks is not copied at each block)
+    pending: list[bytes] = []
+
+    try:
+        while True:
+            block = os.read(input_fd, READ_SIZE)
+
+            if block:
+                end = block.rfind(b"\n")
+
+                if end == -1:
+                    pending.append(block)
+                    continue
+
+                pending.append(block[:end])
+                lines = b"".join(pending).split(b"\n")
+                pending = [block[end + 1:]]
+
+            else:
+                # End of the input, the last line may have no new line
+                lines = [b"".join(pending)]
+                pending = []
+
+            if executor is None or len(lines) < 2:
+                output.write(handle_lines(lines))
+
+            elif ordered:
+                for responses in executor.map(
+                    handle_lines, _split(lines, 4 * workers)
+                ):
+                    output.write(responses)
+
+            else:
+                futures = [
+                    executor.submit(handle_lines, chunk)
+                    for chunk in _split(lines, 4 * workers)
+                ]
+                for future in as_completed(futures):
+                    output.write(future.result())
+                    output.flush()
+
+            output.flush()
+
+            if not block:
+                break
+
+    finally:
+        if executor is not None:
+            executor.shutdown()
@@ -0,0 +1,1118 @@
+"""Reference implementation and differential checks of make_letters.
+
+The functions of this module are the original (recursive, string
+slicing) implementation of make_letters, kept unchanged to check that
+the optimized code paths produce exactly the same letters:
+
+- enable_reference_check() runs a sampled fraction of the make_letters
+  calls through the reference implementation too and reports the
+  mismatches through a callback;
+- differential_sweep() compares both implementations on a range of
+  numbers, for every language and mode (run ``python -m
+  nombres_vers_lettres.reference --help`` for the command line).
+
+The reference parses the numbers with its own copy of the original
+parser (numbers), so that the optimized parsing (scientific notation,
+buffers) is checked too. Only the helpers which do not build letters
+(big_number_from_rank and decimal_from_rank) are shared with the
+optimized implementation.
+"""
+
+import argparse
+import decimal
+import math
+import random
+import re
+import sys
+import warnings
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, NamedTuple
+
+from nombres_vers_lettres.constants import (
+    AVAILABLE_LANGUAGES,
+    CURRENCY_FORMS_FR,
+    CURRENCY_FORMS_FR_CODES,
+    ERROR_EMPTY_INPUT,
+    ERROR_INVALID_NUMBER,
+    ERROR_MISPLACED_SIGN,
+    ERROR_RANK_OUT_OF_RANGE,
+    ERROR_TOO_MANY_SEPARATORS,
+    FRENCH_FRENCH_LIKE,
+    LANGUAGES_DECADES,
+    MAX_DECIMAL_DIGITS,
+    MAX_INTEGER_DIGITS,
+    MODES,
+    NUMBERS,
+    VALID_FEMININE,
+    VALID_MASCULINE,
+)
+from nombres_vers_lettres.make_letters import (
+    BUFFER_TYPES,
+    ConversionError,
+    big_number_from_rank,
+    decimal_from_rank,
+    set_reference_oracle,
+)
+from nombres_vers_lettres.make_letters import (
+    make_letters as optimized_make_letters,
+)
+
+# The modes of the differential sweep
+SWEEP_MODES = MODES + tuple(CURRENCY_FORMS_FR_CODES)
+# The modes which take the gender and the plural options
+GENDERED_MODES = ("cardinal", "cardinal_nominal", "ordinal_nominal")
+
+# Characters which are not part of a number (e.g., spaces between groups)
+NOT_A_NUMBER_PATTERN = re.compile(r"[^\-\d\.\,\n]+")
+# What int() or float() accepts once the number has been cleaned
+NUMBER_PATTERN = re.compile(r"\s*-?(?:\d+(?:\.\d*)?|\.\d+)\s*")
+# Characters which are not part of a number in scientific notation
+NOT_A_SCIENTIFIC_PATTERN = re.compile(r"[^\-+\d.,eE]+")
+
+
+def expand_scientific(number_str: str) -> str | None:
+    """Expand a number in scientific notation with decimal.
+
+    Args:
+        number_str (str): The number (e.g., "-2,5e-40").
+
+    Raises:
+        ConversionError: If the number is out of range.
+
+    Returns:
+        str | None: The number in plain notation (e.g., "-0.25"), None if
+        it is not in scientific notation.
+    """
+    number_str = NOT_A_SCIENTIFIC_PATTERN.sub("", number_str).replace(",", ".")
+
+    try:
+        value = decimal.Decimal(number_str)
+
+    except decimal.InvalidOperation:
+        return None
+
+    if not value.is_finite():
+        return None
+
+    if value.is_zero():
+        return "0"
+
+    # Drop the trailing zeros, as the plain number is written from the
+    # significant digits (e.g., "12.3400e1" is "123.4")
+    sign, digits, exponent = value.as_tuple()
+    significant_digits = "".join(map(str, digits)).rstrip("0")
+    # The exponent of a finite number is an int
+    exponent = int(exponent) + len(digits) - len(significant_digits)
+
+    # Do not format the digits of a huge exponent (e.g., "1e300")
+    if (
+        value.adjusted() >= MAX_INTEGER_DIGITS
+        or -exponent > MAX_DECIMAL_DIGITS
+    ):
+        raise ConversionError(
+            ERROR_RANK_OUT_OF_RANGE, f"Invalid number: {number_str!r}"
+        )
+
+    value = decimal.Decimal(f"{significant_digits}e{exponent}")
+
+    return format(value.copy_negate() if sign else value, "f")
+
+
+def clean_number_str(number_str: str) -> str:
+    """Clean a number string and check it.
+
+    Args:
+        number_str (str): The number as a string (e.g., "-1 234,5").
+
+    Raises:
+        ConversionError: If the number is invalid.
+
+    Returns:
+        str: The cleaned number (e.g., "-1234.5").
+    """
+    if "e" in number_str or "E" in number_str:
+        expanded = expand_scientific(number_str)
+
+        if expanded is not None:
+            return expanded
+
+    number_str = NOT_A_NUMBER_PATTERN.sub("", number_str)
+
+    if number_str.count(".") > 1 or number_str.count(",") > 1:
+        raise ConversionError(
+            ERROR_TOO_MANY_SEPARATORS,
+            "Invalid number: too many decimal points",
+        )
+
+    # Only keep the decimal point
+    number_str = number_str.replace(",", ".")
+
+    if number_str.count(".") > 1:
+        raise ConversionError(
+            ERROR_TOO_MANY_SEPARATORS,
+            "Invalid number: too many decimal points (. and ,)",
+        )
+
+    if "-" in number_str and not number_str.startswith("-"):
+        raise ConversionError(
+            ERROR_MISPLACED_SIGN,
+            "Invalid number: negative sign must be at the beginning",
+        )
+
+    if number_str.count("-") > 1:
+        raise ConversionError(
+            ERROR_MISPLACED_SIGN, "Invalid number: too many negative signs"
+        )
+
+    if number_str == "":
+        raise ConversionError(
+            ERROR_EMPTY_INPUT, "Invalid number: empty string"
+        )
+
+    if NUMBER_PATTERN.fullmatch(number_str) is None:
+        raise ConversionError(
+            ERROR_INVALID_NUMBER, f"Invalid number: {number_str!r}"
+        )
+
+    return number_str
+
+
+def numbers(
+    number: int | float | str | bytes, mode: str = "int"
+) -> tuple[float | int, str]:
+    """Create a float or int and a string of the number.
+
+    Args:
+        number (int | float | str | bytes): The number to convert.
+        mode (str, optional): The mode to use. Defaults to "int".
+
+    Raises:
+        ConversionError: If the number is invalid.
+
+    Returns:
+        tuple[float | int, str]: The number as a float or int and a string.
+    """
+    number_str: str = ""
+    number_int_or_float: int | float = 0
+
+    if isinstance(number, BUFFER_TYPES):
+        number = memoryview(number).tobytes().decode("ascii")
+
+    if isinstance(number, str):
+        number_str = clean_number_str(number)
+
+        # Create a number
+        if "." not in number_str:
+            digits = number_str.strip().lstrip("-").lstrip("0")
+
+            # Fail before any work (int() is quadratic in the digits)
+            if len(digits) > MAX_INTEGER_DIGITS:
+                raise ConversionError(
+                    ERROR_RANK_OUT_OF_RANGE,
+                    f"Rank value (rank = {(len(digits) - 1) // 3 * 3}) "
+                    "out of range.",
+                )
+
+            number_int_or_float = int(digits or "0")
+            if number_str.lstrip().startswith("-"):
+                number_int_or_float = -number_int_or_float
+
+        else:
+            number_int_or_float = float(number_str)
+
+    if isinstance(number, (int, float)):
+        if isinstance(number, float) and not math.isfinite(number):
+            raise ConversionError(
+                ERROR_INVALID_NUMBER, f"Invalid number: {number}"
+            )
+
+        number_int_or_float = number
+
+        if mode == "int" or number % 1 == 0:
+            number_str = f"{number:.0f}"
+
+        elif mode == "float":
+            number_str = f"{number}"
+
+            # The small floats are represented in scientific notation
+            if "e" in number_str:
+                number_str = clean_number_str(number_str)
+
+    return number_int_or_float, number_str
+
+
+def make_currency(
+    number: float | int | str,
+    currency: str = "EUR",
+    post_1990_orthographe: bool = True,
+    language: str = "fr_BE",
+) -> str:
+    """Convert a number to a currency.
+
+    Args:
+        number (float | int | str): The number to convert.
+        currency (str, optional): Defaults to "EUR".
+        decimal_rank (bool, optional): Defaults to True.
+        post_1990_orthographe (bool, optional): Defaults to False.
+
+    Returns:
+        str: The number in letters.
+    """
+    number_int_or_float, number_str = numbers(number, mode="float")
+
+    # Check if the number is an integer
+    if "." not in number_str:
+        plural = 1 if number_int_or_float > 1 else 0
+        current_currency = CURRENCY_FORMS_FR[currency][0][plural]
+
+        de_or_space = " "
+        if number_str.endswith("000000"):
+            start_with_vowel = current_currency.startswith(
+                ("a", "e", "i", "o", "u", "y")
+            )
+            de_or_space = " d'" if start_with_vowel else " de "
+        return (
+            integer_to_letters(
+                number_str,
+                post_1990_orthographe=post_1990_orthographe,
+                language=language,
+            )
+            + de_or_space
+            + current_currency
+        )
+
+    # Under 1 XYZ
+    if -1 < number_int_or_float < 1:
+        number_str = number_str.split(".")[1].rstrip("0").ljust(2, "0")
+
+        separator = " "
+        if len(number_str) > 2:
+            number_str = number_str[:2] + "." + number_str[2:]
+            plural = 1 if float(number_str) > 1 else 0
+            current_currency = CURRENCY_FORMS_FR[currency][1][plural]
+            start_with_vowel = current_currency.startswith(
+                ("a", "e", "i", "o", "u", "y")
+            )
+            separator = " d'" if start_with_vowel else " de "
+
+        else:
+            plural = 1 if float(number_str) > 1 else 0
+            current_currency = CURRENCY_FORMS_FR[currency][1][plural]
+
+        if number_int_or_float < 0:
+            number_str = "-" + number_str
+
+        return (
+            float_to_letters(
+                number_str,
+                post_1990_orthographe=post_1990_orthographe,
+                language=language,
+            ).replace("zéro virgule ", "")
+            + separator
+            + current_currency
+        )
+
+    integer_part, decimal_part = number_str.split(".")
+
+    return (
+        make_currency(
+            integer_part,
+            currency=currency,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        )
+        + " et "
+        + make_currency(
+            f"0.{decimal_part}",
+            currency=currency,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        )
+    )
+
+
+def make_ordinal(
+    cardinal_number_str: str,
+    gender: str = "masculin",
+    plural: bool = False,
+) -> str:
+    """Convert a cardinal number to an ordinal number.
+
+    Args:
+        cardinal_number_str (str): The cardinal number to convert.
+        gender (str): masculine or feminine (the gender of the ordinal number).
+        plural (bool): If True, the ordinal number will be plural.
+
+    Returns:
+        str: The ordinal number.
+    """
+    # Number is already an ordinal number
+    if cardinal_number_str.endswith(("ième", "ièmes")):
+        if cardinal_number_str.endswith("s"):
+            cardinal_number_str = cardinal_number_str[:-1]
+
+        return cardinal_number_str + ("s" if plural else "")
+
+    if cardinal_number_str in ("un", "une"):
+        if gender in VALID_FEMININE:
+            return "première" if not plural else "premières"
+
+        if gender in VALID_MASCULINE:
+            return "premier" if not plural else "premiers"
+
+    ordinal_number_str = cardinal_number_str
+    suffix = "ième"
+
+    if plural:
+        suffix += "s"
+
+    match cardinal_number_str[-1]:
+        case "e":
+            return cardinal_number_str[:-1] + suffix
+        case "f":
+            return cardinal_number_str[:-1] + "v" + suffix
+        case "q":
+            ordinal_number_str += "u" + suffix
+        case "s":
+            return cardinal_number_str[:-1] + suffix
+        case _:
+            ordinal_number_str += suffix
+
+    return ordinal_number_str
+
+
+def positive_integer_up_to_one_hundred(
+    number: int,
+    gender: str = "masculin",
+    plural: bool = False,
+    ordinal: bool = False,
+    post_1990_orthographe: bool = False,
+    language: str = "fr_BE",
+) -> str:
+    """Convert a integer between 0 and 100 included to letters.
+
+    Args:
+        number (int): The number to convert.
+        ordinal (bool, optional): If True, use ordinal numbers.
+        Defaults to False.
+        post_1990_orthographe (bool, optional): If True, use tiret with "et".
+        Defaults to False.
+
+    Raises:
+        ValueError: If the number is over 99.
+    """
+    if number > 100:
+        raise ValueError(
+            f"Number must be under or equal to 100 (received {number})"
+        )
+
+    if number % 1 != 0:
+        raise ValueError(
+            "Number must be an integer "
+            f"(received {number}, type {type(number)})"
+        )
+
+    # 80 is a special case (4 times 20)
+    decades = LANGUAGES_DECADES[language]
+    if number == 80 and decades[80] == "quatre-vingt" and ordinal is False:
+        return decades[number] + ("s" if decades[number] else "")
+
+    un = "une" if gender in VALID_FEMININE and ordinal is False else "un"
+
+    if number == 1:
+        return un + "s" if plural else un
+
+    # Directly lookup decades
+    if number in (NUMBERS | decades):
+        return (NUMBERS | decades).get(number, "")
+
+    if language in FRENCH_FRENCH_LIKE:
+        if 71 < number < 80:
+            return "soixante-" + positive_integer_up_to_one_hundred(
+                number - 60
+            )
+
+        if 90 < number < 100:
+            return "quatre-vingt-" + positive_integer_up_to_one_hundred(
+                number - 80
+            )
+
+        if number == 71:
+            return (
+                "soixante-et-onze"
+                if post_1990_orthographe
+                else "soixante et onze"
+            )
+
+    if number % 10 == 1:
+        if number == 81 and decades[80] == "quatre-vingt":
+            return f"quatre-vingt-{un}"
+
+        if post_1990_orthographe:
+            return decades[number - 1] + f"-et-{un}"
+
+        return decades[number - 1] + f" et {un}"
+
+    return decades[number - number % 10] + "-" + NUMBERS[number % 10]
+
+
+def positive_integer_under_one_thousand(
+    number: int,
+    gender: str = "masculin",
+    plural: bool = False,
+    ordinal: bool = False,
+    post_1990_orthographe: bool = False,
+    language: str = "fr_BE",
+) -> str:
+    """Convert a integer between 0 and under 1000 to letters.
+
+    Args:
+        number (int): The number to convert.
+        ordinal (bool, optional): If True, use ordinal numbers.
+        Defaults to False.
+        post_1990_orthographe (bool, optional): If True, use tiret with "et",
+        etc.
+        Defaults to False.
+
+    Raises:
+        ValueError: If the number is over 999.
+    """
+    space = " " if not post_1990_orthographe else "-"
+
+    if number >= 1000:
+        raise ValueError(f"Number must be under 1000 (received {number})")
+
+    if number % 1 != 0:
+        raise ValueError(
+            "Number must be an integer "
+            f"(received {number}, type {type(number)})"
+        )
+
+    if number <= 100:
+        return positive_integer_up_to_one_hundred(
+            number,
+            gender=gender,
+            plural=plural,
+            ordinal=ordinal,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        )
+
+    # Form numbers over 100
+    # Form the part under 100 (xx)
+    under_hundred_part_str = positive_integer_up_to_one_hundred(
+        number % 100,
+        gender=gender,
+        plural=plural,
+        ordinal=ordinal,
+        post_1990_orthographe=post_1990_orthographe,
+        language=language,
+    )
+    under_hundred_part_str = (
+        space + under_hundred_part_str if number % 100 != 0 else ""
+    )
+
+    # Form the part over 100 (yxx)
+    hundreds_part = (number - (number % 100)) // 100
+    hundreds_part_str = (
+        positive_integer_up_to_one_hundred(
+            hundreds_part,
+            ordinal=ordinal,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        )
+        + space
+    )
+    if hundreds_part == 1:
+        hundreds_part_str = ""
+    cent = "cent" + (
+        "s"
+        if hundreds_part > 1 and number % 100 == 0 and ordinal is False
+        else ""
+    )
+
+    return hundreds_part_str + cent + under_hundred_part_str
+
+
+def integer_to_letters(
+    number: int | str,
+    decimal: bool = False,
+    decimal_rank: bool = True,
+    plural: bool = False,
+    gender: str = "masculin",
+    ordinal: bool = False,
+    post_1990_orthographe: bool = False,
+    language: str = "fr_BE",
+) -> str:
+    """Convert an integer to letters.
+
+    Args:
+        number (int | str): The number to convert.
+        decimal (bool, optional): If True, the number is a decimal.
+        Defaults to False.
+        decimal_rank (bool, optional): If True, keep the decimal rank for
+        low ranks. Defaults to True.
+        ordinal (bool, optional): If True, use ordinal numbers.
+        Defaults to False.
+        post_1990_orthographe (bool, optional): If True, use tiret with "et",
+        etc.
+        Defaults to False.
+
+    Raises:
+        ValueError: If the number is not an integer.
+
+    Returns:
+        str: The number in letters.
+    """
+    number_int, number_str = numbers(number, mode="int")
+
+    if not isinstance(number_int, int):
+        raise ValueError(
+            "Number must be an integer "
+            f"(received {number}, type {type(number)})"
+        )
+
+    # Check if the number is negative
+    if number_int < 0:
+        return "moins " + integer_to_letters(
+            number_str.replace("-", ""),
+            language=language,
+            gender=gender,
+            plural=plural,
+        )
+
+    # We already have a function for numbers under 1000
+    if number_int < 1000 and not decimal:
+        return positive_integer_under_one_thousand(
+            number_int,
+            gender=gender,
+            plural=plural,
+            ordinal=ordinal,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        )
+
+    # Compute "rank"
+    rank = len(number_str) // 3 * 3
+
+    # print(rank)
+
+    if len(number_str) % 3:
+        rank += 3
+
+    number_groups = []
+
+    if not decimal:
+        ranks = big_number_from_rank
+        while len(number_str) > 0:
+            number_groups.append(number_str[-3:])
+            number_str = number_str[:-3]
+        number_groups.reverse()
+
+    else:
+        ranks = decimal_from_rank
+        # We are grouping the decimal part
+        while len(number_str) > 0:
+            number_groups.append(number_str[:3])
+            number_str = number_str[3:]
+
+    number_str = ""
+    for index, group in enumerate(number_groups):
+        # Compute current rank
+        group_rank = 3 * (index + 1)
+        if not decimal:
+            group_rank = rank - group_rank
+
+        # The group is empty, we skip it
+        if int(group) == 0:
+            continue
+
+        # Add a space or a tiret between groups
+        space = " " if not post_1990_orthographe else "-"
+        if number_str != "":
+            number_str += space
+
+        rank_str = ranks(group_rank)
+        if group_rank > 3:
+            rank_str += "s" if int(group) > 1 and group_rank > 2 else ""
+
+            # We need to pad the group with 0s
+            if decimal and len(group) < 3:
+                group = group.ljust(3, "0")
+                rank_str += "s"
+
+        # With low ranks, we keep the decimal rank
+        elif decimal:
+            # Recompute rank
+            rank_str = ranks(len(group))
+            rank_str += "s" if int(group) > 1 and group_rank > 2 else ""
+
+            # We may remove the decimal rank for low ranks
+            if len(group) < 3 and decimal_rank is False:
+                rank_str = ""
+
+        # Use ordinal in from of "mille" or
+        # if the user wants to use ordinal numbers
+        use_ordinal = group_rank == 3 or ordinal
+
+        # We don't say "un cent" or "un mille", we say "mille" or "cent"
+        # We do say "un million" or "un milliard", etc.
+        # We do say "un dixième", "un centième", etc.
+        if int(group) == 1 and 0 < group_rank < 6 and not decimal:
+            group_str = ""
+
+        else:
+            group_str = positive_integer_under_one_thousand(
+                int(group),
+                gender=gender if group_rank == 0 else "masculin",
+                plural=plural if group_rank == 0 else False,
+                ordinal=use_ordinal,
+                post_1990_orthographe=post_1990_orthographe,
+                language=language,
+            )
+            group_str += space if rank_str != "" else ""
+
+        number_str += group_str + rank_str
+
+    return number_str
+
+
+def float_to_letters(
+    number: float | int | str,
+    gender: str = "masculin",
+    plural: bool = False,
+    decimal_rank: bool = True,
+    post_1990_orthographe: bool = False,
+    language: str = "fr_BE",
+) -> str:
+    """Convert a float to letters.
+
+    Args:
+        number (float | int): The number to convert.
+        decimal_rank (bool, optional): If True, keep the decimal rank for low
+        ranks. Defaults to True.
+
+    Returns:
+        str: The number in letters.
+    """
+    number, exact_number = numbers(number, mode="float")
+
+    # Check if the number is negative
+    if number < 0:
+        # Recursively call the function
+        return "moins " + float_to_letters(
+            exact_number.replace("-", ""),
+            gender=gender,
+            plural=plural,
+            decimal_rank=decimal_rank,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        )
+
+    number_str = exact_number.split(".")
+    integer_part = number_str[0]
+    decimal_part = number_str[1] if len(number_str) > 1 else ""
+
+    # If the number is an integer, we don't need to convert the decimal part
+    if decimal_part.replace("0", "") == "":
+        return integer_to_letters(
+            integer_part,
+            gender=gender,
+            plural=plural,
+            decimal_rank=decimal_rank,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        )
+
+    return (
+        integer_to_letters(
+            integer_part,
+            ordinal=False,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        )
+        + " virgule "
+        + integer_to_letters(
+            decimal_part,
+            decimal=True,
+            decimal_rank=decimal_rank,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        )
+    )
+
+
+def make_letters(
+    number: float | int | str,
+    mode: str = "cardinal",
+    gender: str = "masculin",
+    plural: bool = False,
+    language: str = "fr_BE",
+    post_1990_orthographe: bool = True,
+    use_non_breaking_spaces: bool = True,
+) -> str:
+    """Convert a number to letters.
+
+    Args:
+        number (float | int | str): The number to convert.
+        gender (str): For ordinal_nominal and cardinal_nominal. If 'feminine',
+        the number will be feminine, if 'masculine',
+        the number will be masculine.
+        plural (bool): For ordinal_nominal and cardinal_nominal. If True,
+        the number will be plural.
+        mode (str, optional): The mode to use. Defaults to "ordinal".
+        language (str, optional): The language to use. Defaults to "fr_BE".
+        post_1990_orthographe (bool, optional): If True, use tiret with "et",
+        etc.
+        Defaults to True.
+        use_non_breaking_spaces (bool, optional): If True,
+        use non-breaking spaces.
+
+    Returns:
+        str: The number in letters.
+    """
+    space = " " if use_non_breaking_spaces else " "
+
+    if mode in ("cardinal", "cardinal_nominal"):
+        # un, deux, trois virgule cinq
+        return float_to_letters(
+            number,
+            gender=gender,
+            plural=plural,
+            decimal_rank=True,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        ).replace(" ", space)
+
+    if isinstance(number, float):
+        if number % 1 == 0:
+            number = int(number)
+
+        else:
+            raise ValueError(
+                "Invalid number: float number must be an integer "
+                f"(received {number}, type {type(number)})"
+            )
+
+    if mode in ("ordinal_adjectival", "ordinal"):
+        # la page trois, la page deux cent, etc.
+        ordinal_adjectival = integer_to_letters(
+            number,
+            ordinal=True,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        ).replace(" ", space)
+
+        return ordinal_adjectival
+
+    if mode == "ordinal_nominal":
+        # 3 -> troisième, etc.
+        return make_ordinal(
+            integer_to_letters(
+                number,
+                post_1990_orthographe=post_1990_orthographe,
+                language=language,
+            ),
+            gender=gender,
+            plural=plural,
+        ).replace(" ", space)
+
+    if mode in CURRENCY_FORMS_FR_CODES:
+        return make_currency(
+            number,
+            currency=mode,
+            post_1990_orthographe=post_1990_orthographe,
+            language=language,
+        ).replace(" ", space)
+
+    raise ValueError(f"Invalid mode {mode = }")
+
+
+class Mismatch(NamedTuple):
+    """A number for which make_letters differs from the reference."""
+
+    number: float | int | str | bytes
+    options: dict[str, Any]
+    letters: str | None
+    expected: str | None
+
+
+def warn_mismatch(mismatch: Mismatch) -> None:
+    """Report a mismatch with a RuntimeWarning (default callback)."""
+    warnings.warn(
+        f"make_letters({mismatch.number!r}, **{mismatch.options!r}) "
+        f"returned {mismatch.letters!r}, "
+        f"the reference returned {mismatch.expected!r}",
+        RuntimeWarning,
+        stacklevel=3,
+    )
+
+
+def _letters_or_none(
+    convert: Callable[..., str],
+    number: float | int | str | bytes,
+    options: dict[str, Any],
+) -> tuple[str | None, ValueError | None]:
+    """Convert a number, returning the error instead of raising it."""
+    try:
+        return convert(number, **options), None
+
+    except ValueError as exception:
+        return None, exception
+
+
+class ReferenceOracle:
+    """Run a sample of the conversions through the reference too.
+
+    Attributes:
+        sample_rate (float): The fraction of the calls which are checked.
+        on_mismatch (Callable[[Mismatch], None]): The mismatch callback.
+        checked (int): The number of checked calls.
+        mismatches (int): The number of mismatches.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.001,
+        on_mismatch: Callable[[Mismatch], None] | None = None,
+        seed: int | None = None,
+    ):
+        self.sample_rate = sample_rate
+        self.on_mismatch = on_mismatch or warn_mismatch
+        self.checked = 0
+        self.mismatches = 0
+        self._random = random.Random(seed)
+
+    def __call__(
+        self,
+        convert: Callable[..., str],
+        number: float | int | str | bytes,
+        options: dict[str, Any],
+    ) -> str:
+        """Convert a number, checking it against the reference if sampled.
+
+        Args:
+            convert (Callable[..., str]): The optimized conversion.
+            number (float | int | str | bytes): The number to convert.
+            options (dict[str, Any]): The options of the conversion.
+
+        Returns:
+            str: The letters returned by the optimized conversion.
+        """
+        if self._random.random() >= self.sample_rate:
+            return convert(number, **options)
+
+        letters, error = _letters_or_none(convert, number, options)
+        expected, _ = _letters_or_none(make_letters, number, options)
+
+        self.checked += 1
+        if letters != expected:
+            self.mismatches += 1
+            self.on_mismatch(Mismatch(number, options, letters, expected))
+
+        if error is not None:
+            raise error
+
+        return letters  # type: ignore[return-value]
+
+
+def enable_reference_check(
+    sample_rate: float = 0.001,
+    on_mismatch: Callable[[Mismatch], None] | None = None,
+    seed: int | None = None,
+) -> ReferenceOracle:
+    """Check a sample of the make_letters calls against the reference.
+
+    Args:
+        sample_rate (float, optional): The fraction of the calls to check.
+        Defaults to 0.001.
+        on_mismatch (Callable[[Mismatch], None] | None, optional): Called
+        with each mismatch. Defaults to a RuntimeWarning.
+        seed (int | None, optional): The seed of the sampling.
+        Defaults to None.
+
+    Returns:
+        ReferenceOracle: The oracle (with the check counters).
+    """
+    oracle = ReferenceOracle(
+        sample_rate=sample_rate, on_mismatch=on_mismatch, seed=seed
+    )
+    set_reference_oracle(oracle)
+    return oracle
+
+
+def disable_reference_check() -> None:
+    """Stop checking the make_letters calls against the reference."""
+    set_reference_oracle(None)
+
+
+def sweep_options(
+    languages: Iterable[str] = AVAILABLE_LANGUAGES,
+    modes: Iterable[str] = SWEEP_MODES,
+    genders: Iterable[str] = ("masculin", "feminine"),
+    plurals: Iterable[bool] = (False, True),
+) -> list[dict[str, Any]]:
+    """Get the options of every variant of a differential sweep.
+
+    The genders and the plurals are only varied for the modes which take
+    them (see GENDERED_MODES), the other modes use the first ones.
+
+    Args:
+        languages (Iterable[str], optional): Defaults to every language.
+        modes (Iterable[str], optional): Defaults to SWEEP_MODES.
+        genders (Iterable[str], optional): Defaults to ("masculin",
+        "feminine").
+        plurals (Iterable[bool], optional): Defaults to (False, True).
+
+    Returns:
+        list[dict[str, Any]]: The keyword arguments of make_letters.
+    """
+    genders = tuple(genders)
+    plurals = tuple(plurals)
+    forms = [(gender, plural) for gender in genders for plural in plurals]
+
+    return [
+        {
+            "mode": mode,
+            "gender": gender,
+            "plural": plural,
+            "language": language,
+            "post_1990_orthographe": post_1990_orthographe,
+        }
+        for language in languages
+        for mode in modes
+        for gender, plural in (forms if mode in GENDERED_MODES else forms[:1])
+        for post_1990_orthographe in (False, True)
+    ]
+
+
+def _sweep_range(
+    start: int,
+    stop: int,
+    variants: list[dict[str, Any]],
+    max_mismatches: int,
+) -> tuple[int, list[Mismatch]]:
+    """Compare both implementations on a range of integers."""
+    mismatches: list[Mismatch] = []
+    checked = 0
+
+    for number in range(start, stop):
+        for options in variants:
+            letters, _ = _letters_or_none(
+                optimized_make_letters, number, options
+            )
+            expected, _ = _letters_or_none(make_letters, number, options)
+            checked += 1
+
+            if letters != expected and len(mismatches) < max_mismatches:
+                mismatches.append(Mismatch(number, options, letters, expected))
+
+    return checked, mismatches
+
+
+def differential_sweep(
+    start: int = 0,
+    stop: int = 10_000_001,
+    variants: list[dict[str, Any]] | None = None,
+    workers: int | None = None,
+    chunk_size: int = 10_000,
+    max_mismatches: int = 100,
+) -> tuple[int, list[Mismatch]]:
+    """Compare make_letters and the reference on a range of integers.
+
+    Args:
+        start (int, optional): The first number. Defaults to 0.
+        stop (int, optional): The number after the last one.
+        Defaults to 10_000_001.
+        variants (list[dict[str, Any]] | None, optional): The options of
+        each variant. Defaults to sweep_options().
+        workers (int | None, optional): The number of worker processes,
+        the sweep runs in the current process if 1.
+        Defaults to the number of CPUs.
+        chunk_size (int, optional): The numbers per task.
+        Defaults to 10_000.
+        max_mismatches (int, optional): The maximal number of mismatches
+        kept per task. Defaults to 100.
+
+    Returns:
+        tuple[int, list[Mismatch]]: The number of comparisons and the
+        mismatches.
+    """
+    if variants is None:
+        variants = sweep_options()
+
+    chunks = [
+        (chunk_start, min(stop, chunk_start + chunk_size))
+        for chunk_start in range(start, stop, chunk_size)
+    ]
+
+    if workers == 1 or len(chunks) < 2:
+        results = [
+            _sweep_range(chunk_start, chunk_stop, variants, max_mismatches)
+            for chunk_start, chunk_stop in chunks
+        ]
+
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(
+                executor.map(
+                    _sweep_range,
+                    [chunk_start for chunk_start, _ in chunks],
+                    [chunk_stop for _, chunk_stop in chunks],
+                    [variants] * len(chunks),
+                    [max_mismatches] * len(chunks),
+                )
+            )
+
+    checked = sum(chunk_checked for chunk_checked, _ in results)
+    mismatches = [
+        mismatch
+        for _, chunk_mismatches in results
+        for mismatch in chunk_mismatches
+    ]
+    return checked, mismatches
+
+
+def main():
+    """Run a differential sweep from the command line."""
+    parser = argparse.ArgumentParser(
+        "python -m nombres_vers_lettres.reference",
+        description=(
+            "Compare make_letters with the reference implementation "
+            "on a range of integers"
+        ),
+    )
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("--stop", type=int, default=10_000_001)
+    parser.add_argument(
+        "--languages", type=str, default=",".join(AVAILABLE_LANGUAGES)
+    )
+    parser.add_argument("--modes", type=str, default=",".join(SWEEP_MODES))
+    parser.add_argument("--genders", type=str, default="masculin,feminine")
+    parser.add_argument("--plurals", type=str, default="false,true")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    variants = sweep_options(
+        languages=args.languages.split(","),
+        modes=args.modes.split(","),
+        genders=args.genders.split(","),
+        plurals=[plural == "true" for plural in args.plurals.split(",")],
+    )
+    checked, mismatches = differential_sweep(
+        args.start, args.stop, variants=variants, workers=args.workers
+    )
+
+    for mismatch in mismatches:
+        print(
+            f"{mismatch.number!r} {mismatch.options}: "
+            f"{mismatch.letters!r} != {mismatch.expected!r}"
+        )
+
+    print(f"{checked} comparisons, {len(mismatches)} mismatches")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
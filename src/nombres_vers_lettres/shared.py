@@ -0,0 +1,418 @@
+"""Conversion tables and cache of the letters shared by processes.
+
+A fleet of worker processes can share, through
+``multiprocessing.shared_memory``:
+
+- a spelling artifact (the precomputed letters of the numbers under a
+  limit, see nombres_vers_lettres.artifact), copied once in a shared
+  memory block by share_artifact() and attached by each worker with
+  attach_shared_artifact();
+- a cache of the letters (SharedResultCache), populated by any worker
+  and read by all the others.
+
+The parent process creates the blocks (and unlinks them at shutdown), the
+workers only attach to them:
+
+    cache = SharedResultCache.create("nvl_cache")
+    block = share_artifact("letters.bin", "nvl_letters")
+    # In each worker
+    enable_cache(SharedResultCache.attach("nvl_cache"))
+    attach_shared_artifact("nvl_letters")
+
+The cache is an open addressing hash table of fixed-size slots. Each slot
+is protected by a sequence counter (odd while the slot is written) and a
+checksum, so that a reader never returns a torn or overwritten entry (it
+is a cache miss instead).
+"""
+
+import hashlib
+import struct
+import sys
+import threading
+from collections.abc import Iterator, Sized
+from multiprocessing import resource_tracker, shared_memory
+
+from nombres_vers_lettres.artifact import SpellingArtifact
+from nombres_vers_lettres.make_letters import set_spelling_artifact
+
+CACHE_MAGIC = b"NVLCACH1"
+# Magic number, number of slots, size of a slot, padding
+CACHE_HEADER = struct.Struct("<8sIIQ")
+# Sequence counter, checksum, size of the key, size of the letters
+SLOT_HEADER = struct.Struct("<I8sHH")
+
+DEFAULT_SLOTS = 1 << 16
+DEFAULT_SLOT_SIZE = 256
+
+# Number of slots where a key can be stored
+PROBES = 4
+
+_ATTACH_LOCK = threading.Lock()
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing shared memory block without owning it.
+
+    The block is not unlinked when the attached process exits, only the
+    process which created it unlinks it.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+
+    # Before Python 3.13, attaching also registers the block in the
+    # resource tracker, which unlinks it when the process exits. Only the
+    # registration of this block is skipped while it is attached, the
+    # other resources (e.g., of other threads) are still registered.
+    attached_name = name.lstrip("/")
+
+    with _ATTACH_LOCK:
+        register = resource_tracker.register
+
+        def register_others(name: Sized, rtype: str) -> None:
+            if rtype != "shared_memory" or (
+                str(name).lstrip("/") != attached_name
+            ):
+                register(name, rtype)
+
+        resource_tracker.register = register_others
+
+        try:
+            return shared_memory.SharedMemory(name)
+
+        finally:
+            resource_tracker.register = register
+
+
+def _block_buffer(block: shared_memory.SharedMemory) -> memoryview:
+    """Get the buffer of a shared memory block.
+
+    Raises:
+        ValueError: If the block is closed.
+    """
+    if block.buf is None:
+        raise ValueError(f"Closed shared memory block ({block.name})")
+
+    return block.buf
+
+
+def _checksum(payload: bytes) -> bytes:
+    """Get the checksum of the payload of a slot."""
+    return hashlib.blake2b(payload, digest_size=8).digest()
+
+
+class SharedResultCache:
+    """Cache of the letters in a shared memory block.
+
+    Attributes:
+        name (str): The name of the shared memory block.
+        slots (int): The number of slots.
+        slot_size (int): The size of a slot in bytes (the longer entries
+        are not cached).
+        read_only (bool): If True, put() does nothing.
+        hits (int): The number of keys found by this process.
+        misses (int): The number of keys not found by this process.
+    """
+
+    def __init__(
+        self,
+        block: shared_memory.SharedMemory,
+        read_only: bool = False,
+    ):
+        self._block = block
+        self._buffer = _block_buffer(block)
+        self.read_only = read_only
+        self.hits = 0
+        self.misses = 0
+
+        magic, self.slots, self.slot_size, _ = CACHE_HEADER.unpack_from(
+            self._buffer
+        )
+        if magic != CACHE_MAGIC:
+            raise ValueError(
+                f"Invalid shared cache ({block.name}, bad magic number)"
+            )
+
+    @classmethod
+    def create(
+        cls,
+        name: str | None = None,
+        slots: int = DEFAULT_SLOTS,
+        slot_size: int = DEFAULT_SLOT_SIZE,
+    ) -> "SharedResultCache":
+        """Create a shared cache (the caller must unlink it).
+
+        Args:
+            name (str | None, optional): The name of the shared memory
+            block. Defaults to a random name.
+            slots (int, optional): The number of slots.
+            Defaults to DEFAULT_SLOTS.
+            slot_size (int, optional): The size of a slot in bytes.
+            Defaults to DEFAULT_SLOT_SIZE.
+
+        Raises:
+            ValueError: If the number or the size of the slots is invalid.
+            FileExistsError: If the block already exists.
+
+        Returns:
+            SharedResultCache: The cache.
+        """
+        if slots < PROBES or slot_size <= SLOT_HEADER.size:
+            raise ValueError(
+                f"Invalid shared cache ({slots = }, {slot_size = })"
+            )
+
+        block = shared_memory.SharedMemory(
+            name, create=True, size=CACHE_HEADER.size + slots * slot_size
+        )
+        CACHE_HEADER.pack_into(
+            _block_buffer(block), 0, CACHE_MAGIC, slots, slot_size, 0
+        )
+        return cls(block)
+
+    @classmethod
+    def attach(cls, name: str, read_only: bool = False) -> "SharedResultCache":
+        """Attach to a shared cache created by another process.
+
+        Args:
+            name (str): The name of the shared memory block.
+            read_only (bool, optional): If True, never write in the cache.
+            Defaults to False.
+
+        Raises:
+            FileNotFoundError: If the block does not exist.
+            ValueError: If the block is not a shared cache.
+
+        Returns:
+            SharedResultCache: The cache.
+        """
+        return cls(_attach_shared_memory(name), read_only=read_only)
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory block."""
+        return self._block.name
+
+    def _offsets(self, key: bytes) -> list[int]:
+        """Get the offsets of the slots where a key can be stored."""
+        index = int.from_bytes(_checksum(key), "little")
+        return [
+            CACHE_HEADER.size + ((index + probe) % self.slots) * self.slot_size
+            for probe in range(PROBES)
+        ]
+
+    def get(self, key: str) -> str | None:
+        """Get the letters of a key, None if the key is not cached."""
+        buffer = self._buffer
+        key_bytes = key.encode("utf-8")
+
+        for offset in self._offsets(key_bytes):
+            sequence, checksum, key_size, letters_size = (
+                SLOT_HEADER.unpack_from(buffer, offset)
+            )
+
+            if sequence == 0:
+                # Empty slot, the key was never stored further
+                break
+
+            if sequence % 2 or key_size != len(key_bytes):
+                continue
+
+            start = offset + SLOT_HEADER.size
+            payload = bytes(buffer[start:start + key_size + letters_size])
+
+            # The slot was written while it was read
+            if SLOT_HEADER.unpack_from(buffer, offset)[0] != sequence:
+                continue
+
+            if payload[:key_size] == key_bytes and (
+                _checksum(payload) == checksum
+            ):
+                self.hits += 1
+                return payload[key_size:].decode("utf-8")
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, letters: str) -> None:
+        """Cache the letters of a key (an older entry may be evicted)."""
+        if self.read_only:
+            return
+
+        buffer = self._buffer
+        key_bytes = key.encode("utf-8")
+        payload = key_bytes + letters.encode("utf-8")
+
+        if len(payload) > self.slot_size - SLOT_HEADER.size:
+            return
+
+        offsets = self._offsets(key_bytes)
+        target = offsets[0]
+        for offset in offsets:
+            sequence, _, key_size, _ = SLOT_HEADER.unpack_from(buffer, offset)
+            start = offset + SLOT_HEADER.size
+
+            if sequence == 0 or (
+                key_size == len(key_bytes)
+                and buffer[start:start + key_size] == key_bytes
+            ):
+                target = offset
+                break
+
+        sequence = SLOT_HEADER.unpack_from(buffer, target)[0]
+        # Odd while the slot is written
+        writing = (sequence + 1 + sequence % 2) % 2**32
+        struct.pack_into("<I", buffer, target, writing)
+
+        start = target + SLOT_HEADER.size
+        buffer[start:start + len(payload)] = payload
+        SLOT_HEADER.pack_into(
+            buffer,
+            target,
+            (writing + 1) % 2**32 or 2,
+            _checksum(payload),
+            len(key_bytes),
+            len(payload) - len(key_bytes),
+        )
+
+    def items(self) -> Iterator[tuple[str, str]]:
+        """Iterate over the keys and letters of the cache."""
+        buffer = self._buffer
+
+        for slot in range(self.slots):
+            offset = CACHE_HEADER.size + slot * self.slot_size
+            sequence, checksum, key_size, letters_size = (
+                SLOT_HEADER.unpack_from(buffer, offset)
+            )
+
+            if sequence == 0 or sequence % 2:
+                continue
+
+            start = offset + SLOT_HEADER.size
+            payload = bytes(buffer[start:start + key_size + letters_size])
+
+            if SLOT_HEADER.unpack_from(buffer, offset)[0] == sequence and (
+                _checksum(payload) == checksum
+            ):
+                yield (
+                    payload[:key_size].decode("utf-8"),
+                    payload[key_size:].decode("utf-8"),
+                )
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        if self.read_only:
+            return
+
+        size = self.slots * self.slot_size
+        self._buffer[CACHE_HEADER.size:CACHE_HEADER.size + size] = bytes(
+            size
+        )
+
+    def __len__(self) -> int:
+        buffer = self._buffer
+        sequences = (
+            SLOT_HEADER.unpack_from(
+                buffer, CACHE_HEADER.size + slot * self.slot_size
+            )[0]
+            for slot in range(self.slots)
+        )
+        return sum(
+            1 for sequence in sequences if sequence and not sequence % 2
+        )
+
+    def close(self) -> None:
+        """Detach from the shared memory block."""
+        self._block.close()
+
+    def unlink(self) -> None:
+        """Destroy the shared memory block (once every process closed it)."""
+        self._block.unlink()
+
+
+class SharedSpellingArtifact(SpellingArtifact):
+    """Spelling artifact read from a shared memory block."""
+
+    def __init__(self, block: shared_memory.SharedMemory):
+        self._block = block
+        super().__init__(block.buf)
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory block."""
+        return self._block.name
+
+    def close(self) -> None:
+        """Detach from the shared memory block."""
+        super().close()
+        self._buffer = None
+
+        try:
+            self._block.close()
+
+        except BufferError:
+            # Still referenced, detached once garbage collected
+            pass
+
+
+def share_artifact(
+    path: str, name: str | None = None
+) -> shared_memory.SharedMemory:
+    """Copy a spelling artifact in a shared memory block.
+
+    The caller owns the block and must unlink it once the workers are done.
+
+    Args:
+        path (str): The path of the artifact (see build_artifact).
+        name (str | None, optional): The name of the shared memory block.
+        Defaults to a random name.
+
+    Returns:
+        shared_memory.SharedMemory: The shared memory block.
+    """
+    with open(path, "rb") as artifact_file:
+        content = artifact_file.read()
+
+    block = shared_memory.SharedMemory(name, create=True, size=len(content))
+    _block_buffer(block)[:len(content)] = content
+    return block
+
+
+def attach_shared_artifact(
+    name: str, install: bool = True, strict: bool = True
+) -> SharedSpellingArtifact:
+    """Attach to a spelling artifact shared by share_artifact().
+
+    Args:
+        name (str): The name of the shared memory block.
+        install (bool, optional): If True, use the artifact in make_letters.
+        Defaults to True.
+        strict (bool, optional): If True, reject an artifact built by
+        another version of the library or other constants.
+        Defaults to True.
+
+    Raises:
+        FileNotFoundError: If the block does not exist.
+        ValueError: If the artifact is invalid or stale (and strict is True).
+
+    Returns:
+        SharedSpellingArtifact: The artifact.
+    """
+    block = _attach_shared_memory(name)
+
+    try:
+        artifact = SharedSpellingArtifact(block)
+
+    except ValueError:
+        block.close()
+        raise
+
+    if strict and not artifact.is_current():
+        artifact.close()
+        raise ValueError(
+            f"Stale spelling artifact ({name}, version {artifact.version})"
+        )
+
+    if install:
+        set_spelling_artifact(artifact)
+
+    return artifact
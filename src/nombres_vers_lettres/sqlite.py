@@ -0,0 +1,275 @@
+"""Convert numbers to letters inside SQLite queries.
+
+register_sqlite_functions() registers deterministic SQL functions on a
+sqlite3 connection:
+
+- ``lettres(x)`` and ``lettres(x, mode)``;
+- ``lettres_currency(x)`` and ``lettres_currency(x, currency)``
+  (defaults to 'EUR');
+- ``lettres_ordinal(x)``, ``lettres_ordinal(x, gender)`` and
+  ``lettres_ordinal(x, gender, plural)`` (ordinal_nominal mode).
+
+The REAL values are written as their shortest string (12.5 as "12.5").
+The letters are cached in a least recently used cache shared by every
+connection of the process. SQLite calls the functions once per row, so
+update_letters() converts the distinct values of a column once and
+writes all the letters with a single UPDATE statement.
+"""
+
+import functools
+import sqlite3
+from collections.abc import Sequence
+from typing import Any
+
+from nombres_vers_lettres.constants import (
+    AVAILABLE_LANGUAGES,
+    ERROR_INVALID_LANGUAGE,
+)
+from nombres_vers_lettres.make_letters import ConversionError, make_letters
+
+# Number of letters cached by the SQL functions (shared by the connections)
+SQL_CACHE_SIZE = 65_536
+
+# Number of rows read or written at once by update_letters
+UPDATE_CHUNK_SIZE = 10_000
+
+
+@functools.lru_cache(maxsize=SQL_CACHE_SIZE, typed=True)
+def _cached_letters(
+    number: float | int | str,
+    mode: str,
+    gender: str,
+    plural: bool,
+    language: str,
+    post_1990_orthographe: bool,
+    use_non_breaking_spaces: bool,
+) -> str:
+    """Convert a number to letters (the errors are not cached)."""
+    return make_letters(
+        number,
+        mode=mode,
+        gender=gender,
+        plural=plural,
+        language=language,
+        post_1990_orthographe=post_1990_orthographe,
+        use_non_breaking_spaces=use_non_breaking_spaces,
+    )
+
+
+def sql_cache_info() -> Any:
+    """Get the statistics of the cache of the SQL functions."""
+    return _cached_letters.cache_info()
+
+
+def _sql_number(number: Any) -> Any:
+    """Get the number to convert from an SQL value.
+
+    A REAL which is not an integer is converted as its shortest string
+    (e.g., 12.5 becomes "12.5"), as make_letters only writes the amounts
+    and the ordinals of the integer floats.
+    """
+    if isinstance(number, float) and not number.is_integer():
+        return repr(number)
+
+    return number
+
+
+def _check_language(language: str) -> None:
+    """Reject an unknown language before any conversion.
+
+    Raises:
+        ConversionError: If the language is not available.
+    """
+    if language not in AVAILABLE_LANGUAGES:
+        raise ConversionError(
+            ERROR_INVALID_LANGUAGE,
+            f"Invalid language ({language = }), "
+            f"expected one of {', '.join(AVAILABLE_LANGUAGES)}",
+        )
+
+
+def _quote(identifier: str) -> str:
+    """Quote an SQL identifier (e.g., a table or a column name)."""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def register_sqlite_functions(
+    connection: sqlite3.Connection,
+    language: str = "fr_BE",
+    post_1990_orthographe: bool = True,
+    use_non_breaking_spaces: bool = True,
+    strict: bool = False,
+) -> None:
+    """Register the SQL functions of the letters on a connection.
+
+    Args:
+        connection (sqlite3.Connection): The connection.
+        language (str, optional): Defaults to "fr_BE".
+        post_1990_orthographe (bool, optional): Defaults to True.
+        use_non_breaking_spaces (bool, optional): Defaults to True.
+        strict (bool, optional): If True, an invalid number makes the
+        statement fail, else its letters are NULL. Defaults to False.
+
+    Raises:
+        ConversionError: If the language is not available.
+    """
+    _check_language(language)
+
+    def letters(
+        number: Any,
+        mode: str = "cardinal",
+        gender: str = "masculin",
+        plural: Any = False,
+    ) -> str | None:
+        if number is None:
+            return None
+
+        try:
+            return _cached_letters(
+                _sql_number(number),
+                mode,
+                gender,
+                bool(plural),
+                language,
+                post_1990_orthographe,
+                use_non_breaking_spaces,
+            )
+
+        except (ValueError, TypeError):
+            if strict:
+                raise
+
+            return None
+
+    def currency_letters(number: Any, currency: str = "EUR") -> str | None:
+        return letters(number, mode=currency)
+
+    def ordinal_letters(
+        number: Any, gender: str = "masculin", plural: Any = False
+    ) -> str | None:
+        return letters(number, "ordinal_nominal", gender, plural)
+
+    functions = (
+        ("lettres", (1, 2), letters),
+        ("lettres_currency", (1, 2), currency_letters),
+        ("lettres_ordinal", (1, 2, 3), ordinal_letters),
+    )
+
+    for name, argument_counts, function in functions:
+        for argument_count in argument_counts:
+            try:
+                # The same letters for the same arguments, SQLite may
+                # factor the calls out (and use them in indexes)
+                connection.create_function(
+                    name, argument_count, function, deterministic=True
+                )
+
+            except sqlite3.NotSupportedError:
+                # SQLite older than 3.8.3
+                connection.create_function(name, argument_count, function)
+
+
+def update_letters(
+    connection: sqlite3.Connection,
+    table: str,
+    column: str,
+    target: str,
+    where: str | None = None,
+    parameters: Sequence[Any] = (),
+    **options: Any,
+) -> int:
+    """Write the letters of a column in another column of a table.
+
+    The distinct values of the column are converted once (in chunks),
+    stored in a temporary table and then written by a single UPDATE
+    statement. The invalid numbers are written as NULL. The changes are
+    committed by the caller, as for any UPDATE statement.
+
+    Args:
+        connection (sqlite3.Connection): The connection.
+        table (str): The table name.
+        column (str): The column of the numbers.
+        target (str): The column of the letters.
+        where (str | None, optional): A condition on the rows to update
+        (e.g., "year = ?"). Defaults to None (every row).
+        parameters (Sequence[Any], optional): The parameters of the
+        condition. Defaults to ().
+        **options: The keyword arguments of make_letters.
+
+    Raises:
+        ConversionError: If the language is not available.
+
+    Returns:
+        int: The number of updated rows.
+    """
+    options = {
+        "mode": "cardinal",
+        "gender": "masculin",
+        "plural": False,
+        "language": "fr_BE",
+        "post_1990_orthographe": True,
+        "use_non_breaking_spaces": True,
+        **options,
+    }
+    _check_language(options["language"])
+
+    # The same cache entries as the SQL functions
+    arguments = tuple(
+        options[name]
+        for name in (
+            "mode",
+            "gender",
+            "plural",
+            "language",
+            "post_1990_orthographe",
+            "use_non_breaking_spaces",
+        )
+    )
+    condition = f" WHERE ({where})" if where else ""
+    source = _quote(column)
+
+    # The values keep the affinity of the column, so that the index of
+    # the temporary table is used by the UPDATE statement
+    connection.execute("DROP TABLE IF EXISTS temp.nvl_letters")
+    connection.execute(
+        "CREATE TEMPORARY TABLE nvl_letters AS "
+        f"SELECT DISTINCT {source} AS value, NULL AS letters "
+        f"FROM {_quote(table)}{condition}",
+        parameters,
+    )
+
+    try:
+        values = connection.execute(
+            "SELECT rowid, value FROM temp.nvl_letters WHERE value IS NOT NULL"
+        ).fetchall()
+
+        for start in range(0, len(values), UPDATE_CHUNK_SIZE):
+            rows = []
+
+            for rowid, value in values[start:start + UPDATE_CHUNK_SIZE]:
+                try:
+                    letters = _cached_letters(_sql_number(value), *arguments)
+
+                except (ValueError, TypeError):
+                    continue
+
+                rows.append((letters, rowid))
+
+            connection.executemany(
+                "UPDATE temp.nvl_letters SET letters = ? WHERE rowid = ?",
+                rows,
+            )
+
+        connection.execute(
+            "CREATE INDEX temp.nvl_letters_value ON nvl_letters (value)"
+        )
+        cursor = connection.execute(
+            f"UPDATE {_quote(table)} SET {_quote(target)} = ("
+            "SELECT letters FROM temp.nvl_letters "
+            f"WHERE value = {_quote(table)}.{source}){condition}",
+            parameters,
+        )
+        return cursor.rowcount
+
+    finally:
+        connection.execute("DROP TABLE IF EXISTS temp.nvl_letters")
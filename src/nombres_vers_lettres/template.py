@@ -0,0 +1,226 @@
+"""Templates of documents with numbers written in letters.
+
+compile_template() parses a template once, for example::
+
+    "Payez la somme de {amount:EUR} pour la {rank:ordinal_nominal:f} fois"
+
+A placeholder is ``{name}``, ``{name:mode}`` or ``{name:mode:flags}``,
+where the mode is a mode of make_letters (or a currency code) and the
+flags are "f" (feminine), "m" (masculine) and "p" (plural). The braces
+are escaped by doubling them (``{{`` and ``}}``), as with str.format.
+
+Each placeholder is bound to a converter once (see compile_converter
+and compile_currency_converter), so that rendering a record only converts
+its numbers and fills a format string.
+"""
+
+import string
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+from nombres_vers_lettres.compiler import (
+    COMPILED_MODES,
+    compile_converter,
+    compile_currency_converter,
+)
+from nombres_vers_lettres.constants import (
+    CURRENCY_FORMS_FR_CODES,
+    ERROR_INVALID_MODE,
+)
+from nombres_vers_lettres.make_letters import ConversionError
+
+# The options of make_letters set by the flags of a placeholder
+TEMPLATE_FLAGS = {
+    "f": ("gender", "feminine"),
+    "m": ("gender", "masculin"),
+    "p": ("plural", True),
+}
+
+
+def _slot_converter(
+    mode: str, options: dict[str, Any]
+) -> Callable[[Any], str]:
+    """Get the converter of a placeholder (the same letters as make_letters).
+
+    Raises:
+        ConversionError: If the mode is invalid.
+    """
+    if mode in COMPILED_MODES:
+        return compile_converter(mode=mode, **options)
+
+    if mode in CURRENCY_FORMS_FR_CODES:
+        # The gender and the plural do not change the amounts
+        return compile_currency_converter(
+            mode,
+            language=options["language"],
+            post_1990_orthographe=options["post_1990_orthographe"],
+            use_non_breaking_spaces=options["use_non_breaking_spaces"],
+        )
+
+    raise ConversionError(ERROR_INVALID_MODE, f"Invalid mode {mode = }")
+
+
+class CompiledTemplate:
+    """A template parsed once (see compile_template).
+
+    Attributes:
+        template (str): The template.
+        fields (tuple[str, ...]): The names of the placeholders, in order.
+    """
+
+    def __init__(
+        self,
+        template: str,
+        format_string: str,
+        slots: list[tuple[str, Callable[[Any], str]]],
+    ):
+        self.template = template
+        self.fields = tuple(name for name, _ in slots)
+        self._format_string = format_string
+        self._slots = slots
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.template!r})"
+
+    def render(
+        self, record: Mapping[str, Any] | None = None, **values: Any
+    ) -> str:
+        """Render a record.
+
+        Args:
+            record (Mapping[str, Any] | None, optional): The numbers by
+            placeholder name. Defaults to None.
+            **values: Other numbers by placeholder name.
+
+        Raises:
+            KeyError: If a number is missing.
+            ConversionError: If a number cannot be converted.
+
+        Returns:
+            str: The document.
+        """
+        if values:
+            record = {**(record or {}), **values}
+
+        elif record is None:
+            record = {}
+
+        return self._format_string.format(
+            *[converter(record[name]) for name, converter in self._slots]
+        )
+
+    def render_many(self, records: Iterable[Mapping[str, Any]]) -> list[str]:
+        """Render records in bulk.
+
+        The letters of the numbers which appear in several records are
+        converted once.
+
+        Args:
+            records (Iterable[Mapping[str, Any]]): The records.
+
+        Raises:
+            KeyError: If a number is missing.
+            ConversionError: If a number cannot be converted.
+
+        Returns:
+            list[str]: The documents, in the order of the records.
+        """
+        # The letters already converted, by slot
+        slots: list[
+            tuple[str, Callable[[Any], str], dict[tuple[type, Any], str]]
+        ] = [(name, converter, {}) for name, converter in self._slots]
+        format_string = self._format_string.format
+        documents = []
+
+        for record in records:
+            letters = []
+
+            for name, converter, memo in slots:
+                value = record[name]
+                # 1 and 1.0 are equal but may not have the same letters
+                key = (type(value), value)
+
+                try:
+                    letters.append(memo[key])
+
+                except KeyError:
+                    memo[key] = converter(value)
+                    letters.append(memo[key])
+
+                except TypeError:
+                    # Not hashable
+                    letters.append(converter(value))
+
+            documents.append(format_string(*letters))
+
+        return documents
+
+
+def compile_template(
+    template: str,
+    gender: str = "masculin",
+    plural: bool = False,
+    language: str = "fr_BE",
+    post_1990_orthographe: bool = True,
+    use_non_breaking_spaces: bool = True,
+) -> CompiledTemplate:
+    """Parse a template and bind a converter to each placeholder.
+
+    Args:
+        template (str): The template (see the module documentation).
+        The other arguments are the default options of make_letters, the
+        flags of a placeholder override the gender and the plural.
+
+    Raises:
+        ValueError: If a placeholder is invalid.
+        ConversionError: If the mode of a placeholder is invalid.
+
+    Returns:
+        CompiledTemplate: The compiled template.
+    """
+    format_parts = []
+    slots = []
+
+    try:
+        parsed = list(string.Formatter().parse(template))
+
+    except ValueError as exception:
+        raise ValueError(
+            f"Invalid template ({template = }): {exception}"
+        ) from exception
+
+    for literal, name, spec, conversion in parsed:
+        format_parts.append(literal.replace("{", "{{").replace("}", "}}"))
+
+        if name is None:
+            continue
+
+        if not name.isidentifier() or conversion or "{" in (spec or ""):
+            raise ValueError(
+                f"Invalid placeholder ({name = }) in template, expected "
+                "{name}, {name:mode} or {name:mode:flags}"
+            )
+
+        mode, _, flags = (spec or "cardinal").partition(":")
+        options = {
+            "gender": gender,
+            "plural": plural,
+            "language": language,
+            "post_1990_orthographe": post_1990_orthographe,
+            "use_non_breaking_spaces": use_non_breaking_spaces,
+        }
+
+        for flag in flags:
+            if flag not in TEMPLATE_FLAGS:
+                raise ValueError(
+                    f"Invalid flag ({flag = }) of placeholder ({name}), "
+                    f"expected some of {''.join(TEMPLATE_FLAGS)}"
+                )
+
+            option, value = TEMPLATE_FLAGS[flag]
+            options[option] = value
+
+        format_parts.append("{}")
+        slots.append((name, _slot_converter(mode or "cardinal", options)))
+
+    return CompiledTemplate(template, "".join(format_parts), slots)
@@ -0,0 +1,486 @@
+"""Record the make_letters calls of an application and replay them.
+
+enable_recording() installs a recorder in make_letters: a sample of the
+make_letters and make_currency calls (number, options and duration) is
+appended to a binary log. Only the calls made by the application are
+recorded, not the calls made by the conversion itself. replay_workload()
+runs the recorded calls again at full speed and reports the throughput
+and the latencies, to compare a change of the library with the real mix
+of the numbers, modes and languages (see the replay command).
+
+Layout of a log (little-endian):
+
+- magic (8 bytes), size of the JSON header (uint32);
+- JSON header (library version, modes and languages of the records);
+- records: function (uint8, 0 for make_letters and 1 for make_currency),
+  type of the number (uint8, 0 for int, 1 for float, 2 for str, 3 for
+  bytes, bytearray and memoryview), mode and language (uint8, indexes in
+  the header), flags (uint8, see the FLAG_* constants), duration in
+  nanoseconds (uint32, saturated), size of the number (uint32), number
+  (UTF-8, repr() for the floats, the bytes of the buffers as is).
+
+The gender is recorded as a flag (feminine or masculine), so the calls
+with another gender are not recorded.
+"""
+
+import json
+import random
+import struct
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, BinaryIO, NamedTuple
+
+from nombres_vers_lettres.artifact import library_version
+from nombres_vers_lettres.constants import (
+    AVAILABLE_LANGUAGES,
+    CURRENCY_FORMS_FR_CODES,
+    MODES,
+    VALID_FEMININE,
+    VALID_MASCULINE,
+)
+from nombres_vers_lettres.make_letters import (
+    BUFFER_TYPES,
+    make_currency,
+    make_letters,
+    set_call_recorder,
+)
+
+WORKLOAD_MAGIC = b"NVLWRK01"
+WORKLOAD_HEADER = struct.Struct("<8sI")
+RECORD_HEADER = struct.Struct("<BBBBBII")
+
+RECORDED_FUNCTIONS = ("make_letters", "make_currency")
+RECORDED_TYPES = (int, float, str, bytes)
+# The genders which can be replayed (from FLAG_FEMININE)
+RECORDED_GENDERS = VALID_FEMININE + VALID_MASCULINE
+RECORDED_MODES = MODES + tuple(CURRENCY_FORMS_FR_CODES)
+
+FLAG_FEMININE = 1
+FLAG_PLURAL = 2
+FLAG_POST_1990_ORTHOGRAPHE = 4
+FLAG_NON_BREAKING_SPACES = 8
+FLAG_ERROR = 16
+
+# The percentiles of the latencies in a report
+REPORT_PERCENTILES = (50, 90, 99, 99.9)
+
+_MAX_DURATION = 2**32 - 1
+
+
+class RecordedCall(NamedTuple):
+    """A recorded call of make_letters or make_currency.
+
+    Attributes:
+        function (str): "make_letters" or "make_currency".
+        number (int | float | str | bytes): The number.
+        options (dict[str, Any]): The keyword arguments of the function.
+        duration (int): The duration of the call, in nanoseconds.
+        error (bool): True if the call raised an error.
+    """
+
+    function: str
+    number: int | float | str | bytes
+    options: dict[str, Any]
+    duration: int
+    error: bool
+
+
+class ReplayReport(NamedTuple):
+    """The throughput and the latencies of a replay.
+
+    Attributes:
+        calls (int): The replayed calls.
+        errors (int): The calls which raised an error.
+        seconds (float): The time of the replay.
+        latencies (dict[float, int]): The latencies of the replay, in
+        nanoseconds, by percentile.
+        recorded_latencies (dict[float, int]): The latencies of the same
+        calls when they were recorded.
+    """
+
+    calls: int
+    errors: int
+    seconds: float
+    latencies: dict[float, int]
+    recorded_latencies: dict[float, int]
+
+    @property
+    def throughput(self) -> float:
+        """The calls per second."""
+        return self.calls / self.seconds if self.seconds else 0.0
+
+
+class _ThreadState(threading.local):
+    """The state of a recorder in a thread."""
+
+    # True while a recorded call runs
+    recording = False
+
+
+class WorkloadRecorder:
+    """Append a sample of the calls of make_letters to a log.
+
+    The recorder is thread safe. The calls made while a recorded call runs
+    (in the same thread) are not recorded, nor are the numbers of other
+    types or the calls with another mode, language or gender. The buffers
+    (bytearray and memoryview) are recorded as bytes.
+
+    Attributes:
+        path (str): The path of the log.
+        sample_rate (float): The fraction of the calls which are recorded.
+        recorded (int): The recorded calls.
+    """
+
+    def __init__(
+        self, path: str, sample_rate: float = 1.0, seed: int | None = None
+    ):
+        if not 0 <= sample_rate <= 1:
+            raise ValueError(
+                f"Invalid sample rate ({sample_rate = }), expected 0 to 1"
+            )
+
+        self.path = path
+        self.sample_rate = sample_rate
+        self.recorded = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._local = _ThreadState()
+        self._modes = {
+            mode: index for index, mode in enumerate(RECORDED_MODES)
+        }
+        self._languages = {
+            language: index
+            for index, language in enumerate(AVAILABLE_LANGUAGES)
+        }
+        self._file: BinaryIO | None = open(path, "wb")
+
+        header = json.dumps(
+            {
+                "version": library_version(),
+                "modes": list(RECORDED_MODES),
+                "languages": list(AVAILABLE_LANGUAGES),
+            }
+        ).encode()
+        self._file.write(
+            WORKLOAD_HEADER.pack(WORKLOAD_MAGIC, len(header)) + header
+        )
+
+    def __enter__(self) -> "WorkloadRecorder":
+        return self
+
+    def __exit__(self, *exception: Any) -> None:
+        self.close()
+
+    def __call__(
+        self,
+        function_name: str,
+        function: Callable[..., str],
+        number: Any,
+        options: dict[str, Any],
+    ) -> str:
+        """Run a call and record it if it is sampled.
+
+        Args:
+            function_name (str): "make_letters" or "make_currency".
+            function (Callable[..., str]): The conversion function.
+            number (Any): The number.
+            options (dict[str, Any]): The keyword arguments of the call.
+
+        Returns:
+            str: The letters returned by the function.
+        """
+        if (
+            self.sample_rate < 1
+            and self._random.random() >= self.sample_rate
+        ) or (
+            self._local.recording
+            or self._file is None
+            or (
+                type(number) not in RECORDED_TYPES
+                and not isinstance(number, BUFFER_TYPES)
+            )
+        ):
+            return function(number, **options)
+
+        self._local.recording = True
+        error = False
+        start = time.perf_counter_ns()
+
+        try:
+            return function(number, **options)
+
+        except ValueError:
+            error = True
+            raise
+
+        finally:
+            duration = time.perf_counter_ns() - start
+            self._local.recording = False
+            self._write(function_name, number, options, duration, error)
+
+    def _write(
+        self,
+        function_name: str,
+        number: Any,
+        options: dict[str, Any],
+        duration: int,
+        error: bool,
+    ) -> None:
+        """Append a call to the log (if its options can be replayed)."""
+        mode_name = options.get("mode", options.get("currency"))
+        mode = None if mode_name is None else self._modes.get(mode_name)
+        language = self._languages.get(options["language"])
+
+        if (
+            mode is None
+            or language is None
+            or options.get("gender", "masculin") not in RECORDED_GENDERS
+        ):
+            return
+
+        try:
+            if isinstance(number, BUFFER_TYPES):
+                number_bytes = memoryview(number).tobytes()
+
+            else:
+                number_bytes = (
+                    repr(number) if isinstance(number, float) else str(number)
+                ).encode()
+
+        except ValueError:
+            # An int too long to be formatted
+            return
+
+        flags = (
+            FLAG_FEMININE * (options.get("gender") in VALID_FEMININE)
+            | FLAG_PLURAL * bool(options.get("plural"))
+            | FLAG_POST_1990_ORTHOGRAPHE
+            * bool(options["post_1990_orthographe"])
+            | FLAG_NON_BREAKING_SPACES
+            * bool(options.get("use_non_breaking_spaces", True))
+            | FLAG_ERROR * error
+        )
+        record = RECORD_HEADER.pack(
+            RECORDED_FUNCTIONS.index(function_name),
+            RECORDED_TYPES.index(
+                bytes if isinstance(number, BUFFER_TYPES) else type(number)
+            ),
+            mode,
+            language,
+            flags,
+            min(duration, _MAX_DURATION),
+            len(number_bytes),
+        )
+
+        with self._lock:
+            if self._file is not None:
+                self._file.write(record + number_bytes)
+                self.recorded += 1
+
+    def close(self) -> None:
+        """Stop recording and close the log."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def enable_recording(
+    path: str, sample_rate: float = 1.0, seed: int | None = None
+) -> WorkloadRecorder:
+    """Record a sample of the make_letters and make_currency calls.
+
+    Args:
+        path (str): The path of the log (overwritten).
+        sample_rate (float, optional): The fraction of the calls which are
+        recorded. Defaults to 1.0.
+        seed (int | None, optional): The seed of the sampling.
+        Defaults to None.
+
+    Raises:
+        ValueError: If the sample rate is invalid.
+        OSError: If the log cannot be created.
+
+    Returns:
+        WorkloadRecorder: The recorder (closed by disable_recording).
+    """
+    recorder = WorkloadRecorder(path, sample_rate=sample_rate, seed=seed)
+    set_call_recorder(recorder)
+    return recorder
+
+
+def disable_recording(recorder: WorkloadRecorder | None = None) -> None:
+    """Stop recording the calls.
+
+    Args:
+        recorder (WorkloadRecorder | None, optional): The recorder to close.
+        Defaults to None.
+    """
+    set_call_recorder(None)
+
+    if recorder is not None:
+        recorder.close()
+
+
+def read_workload(path: str) -> Iterator[RecordedCall]:
+    """Read the calls of a log.
+
+    Args:
+        path (str): The path of the log.
+
+    Raises:
+        ValueError: If the file is not a log or is truncated.
+        OSError: If the log cannot be read.
+
+    Yields:
+        RecordedCall: The calls, in the order of the log.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+
+    if len(data) < WORKLOAD_HEADER.size:
+        raise ValueError(f"Invalid workload log ({path}): too short")
+
+    magic, header_size = WORKLOAD_HEADER.unpack_from(data)
+
+    if magic != WORKLOAD_MAGIC:
+        raise ValueError(f"Invalid workload log ({path}): bad magic number")
+
+    position = WORKLOAD_HEADER.size + header_size
+    header = json.loads(data[WORKLOAD_HEADER.size:position])
+    modes = header["modes"]
+    languages = header["languages"]
+
+    while position < len(data):
+        if position + RECORD_HEADER.size > len(data):
+            raise ValueError(f"Invalid workload log ({path}): truncated")
+
+        function, kind, mode, language, flags, duration, size = (
+            RECORD_HEADER.unpack_from(data, position)
+        )
+        position += RECORD_HEADER.size
+        number_bytes = data[position:position + size]
+        position += size
+
+        if len(number_bytes) != size:
+            raise ValueError(f"Invalid workload log ({path}): truncated")
+
+        if (
+            function >= len(RECORDED_FUNCTIONS)
+            or kind >= len(RECORDED_TYPES)
+            or mode >= len(modes)
+            or language >= len(languages)
+        ):
+            raise ValueError(f"Invalid workload log ({path}): bad record")
+
+        number: int | float | str | bytes = number_bytes
+        if RECORDED_TYPES[kind] is int:
+            number = int(number_bytes)
+
+        elif RECORDED_TYPES[kind] is float:
+            number = float(number_bytes)
+
+        elif RECORDED_TYPES[kind] is str:
+            number = number_bytes.decode()
+
+        options: dict[str, Any] = {
+            "post_1990_orthographe": bool(
+                flags & FLAG_POST_1990_ORTHOGRAPHE
+            ),
+            "language": languages[language],
+        }
+
+        if RECORDED_FUNCTIONS[function] == "make_currency":
+            options["currency"] = modes[mode]
+
+        else:
+            options.update(
+                mode=modes[mode],
+                gender="feminine" if flags & FLAG_FEMININE else "masculin",
+                plural=bool(flags & FLAG_PLURAL),
+                use_non_breaking_spaces=bool(
+                    flags & FLAG_NON_BREAKING_SPACES
+                ),
+            )
+
+        yield RecordedCall(
+            RECORDED_FUNCTIONS[function],
+            number,
+            options,
+            duration,
+            bool(flags & FLAG_ERROR),
+        )
+
+
+def _percentiles(durations: list[int]) -> dict[float, int]:
+    """Get the REPORT_PERCENTILES of durations (nearest rank)."""
+    durations = sorted(durations)
+
+    if not durations:
+        return {}
+
+    return {
+        percentile: durations[
+            min(len(durations) - 1, int(len(durations) * percentile / 100))
+        ]
+        for percentile in REPORT_PERCENTILES
+    }
+
+
+def replay_workload(
+    calls: Iterable[RecordedCall], repeat: int = 1
+) -> ReplayReport:
+    """Run recorded calls again, at full speed.
+
+    Args:
+        calls (Iterable[RecordedCall]): The calls (see read_workload).
+        repeat (int, optional): The times each call is run (the latency of
+        a call is its fastest run). Defaults to 1.
+
+    Raises:
+        ValueError: If repeat is not positive.
+
+    Returns:
+        ReplayReport: The throughput and the latencies.
+    """
+    if repeat < 1:
+        raise ValueError(f"Invalid repeat ({repeat = }), expected 1 or more")
+
+    calls = list(calls)
+    functions: dict[str, Callable[..., str]] = {
+        "make_letters": make_letters,
+        "make_currency": make_currency,
+    }
+    runs = [
+        (functions[call.function], call.number, call.options)
+        for call in calls
+    ]
+    latencies = [_MAX_DURATION] * len(runs)
+    errors = 0
+    clock = time.perf_counter_ns
+    start = time.perf_counter()
+
+    for _ in range(repeat):
+        errors = 0
+
+        for index, (function, number, options) in enumerate(runs):
+            call_start = clock()
+
+            try:
+                function(number, **options)
+
+            except ValueError:
+                errors += 1
+
+            latencies[index] = min(latencies[index], clock() - call_start)
+
+    seconds = (time.perf_counter() - start) / repeat
+
+    return ReplayReport(
+        calls=len(runs),
+        errors=errors,
+        seconds=seconds,
+        latencies=_percentiles(latencies),
+        recorded_latencies=_percentiles([call.duration for call in calls]),
+    )
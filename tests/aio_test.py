@@ -0,0 +1,121 @@
+"""Test of the asyncio API.
+
+Run the test with:
+pytest -v tests/aio_test.py
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import aio, make_letters, make_letters_batch
+from nombres_vers_lettres.aio import (
+    AsyncConverter,
+    amake_letters,
+    amake_letters_many,
+    configure_async,
+    is_cheap,
+)
+from nombres_vers_lettres.make_letters import ConversionError
+
+LONG_NUMBER = "9" * 60 + "." + "9" * 60
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool which counts the submitted functions."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+def test_is_cheap():
+    """Test which numbers are converted inline."""
+    assert is_cheap(123) and is_cheap(1.5) and is_cheap("12,5")
+    assert not is_cheap(10**40)
+    assert not is_cheap(LONG_NUMBER)
+    assert not is_cheap(b"12")
+
+
+def test_amake_letters():
+    """Test that the long numbers are converted in the executor."""
+    with CountingExecutor(max_workers=2) as executor:
+        converter = AsyncConverter(executor)
+
+        async def convert():
+            return [
+                await converter.make_letters(21, gender="f"),
+                await converter.make_letters(LONG_NUMBER),
+            ]
+
+        assert asyncio.run(convert()) == [
+            make_letters(21, gender="f"),
+            make_letters(LONG_NUMBER),
+        ]
+        assert executor.submitted == 1
+
+        with pytest.raises(ConversionError):
+            asyncio.run(converter.make_letters("1" * 70))
+
+    assert asyncio.run(amake_letters(80)) == make_letters(80)
+
+
+def test_amake_letters_many():
+    """Test that a batch keeps the order of the numbers."""
+    values = list(range(1_000)) + ["abc", LONG_NUMBER, "1.5"]
+    expected = make_letters_batch(values, mode="ordinal_nominal")
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        converter = configure_async(executor, max_pending=2, chunk_size=64)
+
+        try:
+            assert (
+                asyncio.run(
+                    amake_letters_many(iter(values), mode="ordinal_nominal")
+                )
+                == expected
+            )
+            assert asyncio.run(
+                converter.make_letters_many([1, 2])
+            ) == make_letters_batch([1, 2])
+
+        finally:
+            configure_async()
+
+    assert asyncio.run(amake_letters_many([])) == []
+
+
+def test_backpressure(monkeypatch):
+    """Test that the values are not read while the executor is busy."""
+    release = threading.Event()
+    read = []
+
+    def values():
+        for value in range(100):
+            read.append(value)
+            yield value
+
+    def blocked_batch(chunk, **options):
+        release.wait(10)
+        return make_letters_batch(chunk, **options)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        converter = AsyncConverter(executor, max_pending=2, chunk_size=10)
+
+        async def convert():
+            task = asyncio.ensure_future(converter.make_letters_many(values()))
+            await asyncio.sleep(0.1)
+            # Two pending chunks, the third one waits for a free slot
+            assert len(read) == 30
+            release.set()
+            return await task
+
+        monkeypatch.setattr(aio, "make_letters_batch", blocked_batch)
+        results = asyncio.run(convert())
+
+    assert results == make_letters_batch(range(100))
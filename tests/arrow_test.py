@@ -0,0 +1,62 @@
+"""Test of the Arrow adapters.
+
+Run the test with:
+pytest -v tests/arrow_test.py
+"""
+
+from decimal import Decimal
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres.arrow import make_letters_arrow
+
+pa = pytest.importorskip("pyarrow")
+
+
+def test_integers_with_nulls():
+    """Test that nulls stay nulls."""
+    letters = make_letters_arrow(
+        pa.array([1, None, 80, 1]), dictionary_encode=False
+    )
+    assert letters.type == pa.string()
+    assert letters.to_pylist() == ["un", None, "quatre-vingts", "un"]
+
+
+def test_errors_become_nulls():
+    """Test that values which cannot be converted become nulls."""
+    letters = make_letters_arrow(
+        pa.array([2.5, 4.0]), mode="ordinal_nominal", dictionary_encode=False
+    )
+    assert letters.to_pylist() == [None, "quatrième"]
+
+
+def test_low_cardinality_is_dictionary_encoded():
+    """Test the automatic dictionary encoding."""
+    letters = make_letters_arrow(pa.array([7, 7, 7, 8]))
+    assert pa.types.is_dictionary(letters.type)
+    assert letters.to_pylist() == ["sept", "sept", "sept", "huit"]
+
+    letters = make_letters_arrow(pa.array([7, 8]))
+    assert letters.type == pa.string()
+
+
+def test_decimals_and_chunks():
+    """Test decimal columns and chunked arrays."""
+    values = pa.chunked_array(
+        [
+            pa.array([Decimal("420.69")], pa.decimal128(5, 2)),
+            pa.array([Decimal("1.00"), None], pa.decimal128(5, 2)),
+        ]
+    )
+    letters = make_letters_arrow(
+        values,
+        mode="EUR",
+        dictionary_encode=True,
+        language="fr_FR",
+        use_non_breaking_spaces=False,
+    )
+    assert isinstance(letters, pa.ChunkedArray)
+    assert letters.to_pylist() == [
+        "quatre-cent-vingt euros et soixante-neuf cents",
+        "un euro et zéro cent",
+        None,
+    ]
@@ -0,0 +1,87 @@
+"""Test of the spelling artifacts.
+
+Run the test with:
+pytest -v tests/artifact_test.py
+"""
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import make_letters
+from nombres_vers_lettres.artifact import (
+    build_artifact,
+    load_artifact,
+    open_artifact,
+    unload_artifact,
+)
+
+LIMIT = 1_200
+
+
+@pytest.fixture(name="artifact_path", scope="module")
+def fixture_artifact_path(tmp_path_factory):
+    """Build a small artifact."""
+    path = tmp_path_factory.mktemp("artifact") / "letters.bin"
+    build_artifact(
+        str(path),
+        languages=("fr_BE", "fr_CD", "fr_FR"),
+        modes=("cardinal", "ordinal_nominal"),
+        limit=LIMIT,
+        workers=2,
+    )
+    return str(path)
+
+
+def test_lookup(artifact_path):
+    """Test that the artifact matches make_letters."""
+    artifact = open_artifact(artifact_path)
+    assert artifact.limit == LIMIT
+    assert len(artifact.variants()) == 12
+
+    for language in ("fr_BE", "fr_CD", "fr_FR"):
+        for mode in ("cardinal", "ordinal_nominal"):
+            for post_1990_orthographe in (False, True):
+                for number in range(LIMIT):
+                    assert artifact.lookup(
+                        number,
+                        mode=mode,
+                        language=language,
+                        post_1990_orthographe=post_1990_orthographe,
+                    ) == make_letters(
+                        number,
+                        mode=mode,
+                        language=language,
+                        post_1990_orthographe=post_1990_orthographe,
+                    )
+
+    # Not precomputed
+    assert artifact.lookup(LIMIT) is None
+    assert artifact.lookup(-1) is None
+    assert artifact.lookup(1.5) is None
+    assert artifact.lookup(1, gender="feminine") is None
+    assert artifact.lookup(1, gender="x") is None
+    assert artifact.lookup(1, gender="m") == "un"
+    assert artifact.lookup(1, mode="ordinal_adjectival") is None
+    assert artifact.lookup(1, language="fr_CH") is None
+    artifact.close()
+
+
+def test_load_artifact(artifact_path):
+    """Test make_letters with an artifact."""
+    load_artifact(artifact_path)
+
+    try:
+        assert make_letters("0081", use_non_breaking_spaces=False) == (
+            "quatre-vingt-un"
+        )
+        assert make_letters(1_001, post_1990_orthographe=False) == (
+            "mille\xa0un"
+        )
+        assert make_letters(1, gender="feminine") == "une"
+        # An invalid gender is written as without the artifact
+        assert make_letters(1, "ordinal_nominal", gender="x") == "unième"
+        assert make_letters("0001", "ordinal_nominal", gender="x") == (
+            "unième"
+        )
+        assert make_letters(LIMIT) == "mille-deux-cents"
+
+    finally:
+        unload_artifact()
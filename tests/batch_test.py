@@ -0,0 +1,164 @@
+"""Test of the batch conversion and of the error codes.
+
+Run the test with:
+pytest -v tests/batch_test.py
+"""
+
+from decimal import Decimal
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import (
+    ConversionError,
+    LettersResult,
+    check_number,
+    create_executor,
+    make_letters,
+    make_letters_batch,
+    make_letters_parallel,
+)
+from nombres_vers_lettres.constants import (
+    ERROR_EMPTY_INPUT,
+    ERROR_INVALID_LANGUAGE,
+    ERROR_INVALID_MODE,
+    ERROR_INVALID_NUMBER,
+    ERROR_MISPLACED_SIGN,
+    ERROR_NOT_AN_INTEGER,
+    ERROR_RANK_OUT_OF_RANGE,
+    ERROR_TOO_MANY_SEPARATORS,
+)
+
+ERROR_DATA = [
+    ("", "cardinal", ERROR_EMPTY_INPUT),
+    ("abc", "cardinal", ERROR_EMPTY_INPUT),
+    ("1.2.3", "cardinal", ERROR_TOO_MANY_SEPARATORS),
+    ("1,2,3", "cardinal", ERROR_TOO_MANY_SEPARATORS),
+    ("12-", "cardinal", ERROR_MISPLACED_SIGN),
+    ("--12", "cardinal", ERROR_MISPLACED_SIGN),
+    ("-", "cardinal", ERROR_INVALID_NUMBER),
+    (float("nan"), "cardinal", ERROR_INVALID_NUMBER),
+    ("1" * 67, "cardinal", ERROR_RANK_OUT_OF_RANGE),
+    (10**67, "cardinal", ERROR_RANK_OUT_OF_RANGE),
+    (1e67, "ordinal", ERROR_RANK_OUT_OF_RANGE),
+    ("0," + "1" * 64, "cardinal", ERROR_RANK_OUT_OF_RANGE),
+    ("2,5", "ordinal_nominal", ERROR_NOT_AN_INTEGER),
+    (2.5, "ordinal", ERROR_NOT_AN_INTEGER),
+    (1, "unknown", ERROR_INVALID_MODE),
+]
+
+
+@pytest.mark.parametrize("number, mode, code", ERROR_DATA)
+def test_error_codes(number, mode, code):
+    """Test that check_number and make_letters agree on the error codes."""
+    assert check_number(number, mode=mode) == code
+
+    with pytest.raises(ConversionError) as exception_info:
+        make_letters(number, mode=mode)
+
+    assert exception_info.value.code == code
+
+
+def test_valid_numbers():
+    """Test that valid numbers pass the check."""
+    for number in ("-1 234,5", "1" * 66, "0," + "1" * 63, 42, 4.5):
+        assert check_number(number) is None
+
+
+def test_batch():
+    """Test that the batch collects the errors."""
+    results = make_letters_batch(
+        ["21", "1-", 80, ""], use_non_breaking_spaces=False
+    )
+    assert results == [
+        LettersResult("vingt-et-un", None),
+        LettersResult(None, ERROR_MISPLACED_SIGN),
+        LettersResult("quatre-vingts", None),
+        LettersResult(None, ERROR_EMPTY_INPUT),
+    ]
+
+    results = make_letters_batch([1, 2], mode="unknown")
+    assert [result.error for result in results] == [ERROR_INVALID_MODE] * 2
+
+    results = make_letters_batch([1, "abc"], language="xx_XX")
+    assert [result.error for result in results] == [
+        ERROR_INVALID_LANGUAGE
+    ] * 2
+
+
+def test_no_traceback(capsys):
+    """Test that an out of range rank does not print a traceback."""
+    with pytest.raises(ValueError):
+        make_letters("1" * 67)
+
+    assert capsys.readouterr().err == ""
+
+
+@pytest.mark.parametrize("backend", ["thread", "process", "interpreter"])
+def test_make_letters_parallel(backend):
+    """Test that every backend gives the results of make_letters_batch."""
+    values = list(range(300)) + [1.0, "1.0", "abc", "12,5", "1" * 70]
+
+    try:
+        results = make_letters_parallel(
+            values, backend=backend, workers=2, chunk_size=64, mode="EUR"
+        )
+
+    except ValueError:
+        # Sub-interpreters need Python 3.14+
+        assert backend == "interpreter"
+        pytest.skip("Backend not available")
+
+    assert results == make_letters_batch(values, mode="EUR")
+    assert all(isinstance(result, LettersResult) for result in results)
+
+
+@pytest.mark.parametrize("backend", ["thread", "process", "interpreter"])
+def test_make_letters_parallel_buffers(backend):
+    """Test the buffers and the numbers which are not JSON values."""
+    values = [
+        b"21",
+        bytearray(b"1 234,5"),
+        memoryview(b"80"),
+        memoryview(b"abc12")[3:],
+        b"\xff1",
+        Decimal("12.50"),
+    ] * 3
+
+    try:
+        results = make_letters_parallel(
+            values, backend=backend, workers=2, chunk_size=4, mode="EUR"
+        )
+
+    except ValueError:
+        # Sub-interpreters need Python 3.14+
+        assert backend == "interpreter"
+        pytest.skip("Backend not available")
+
+    assert results == make_letters_batch(values, mode="EUR")
+    assert results[3] == make_letters_batch(["12"], mode="EUR")[0]
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_make_letters_parallel_invalid_language(backend):
+    """Test that an invalid language is an error code of every number."""
+    results = make_letters_parallel(
+        range(10), backend=backend, workers=2, chunk_size=4, language="xx"
+    )
+    assert results == [LettersResult(None, ERROR_INVALID_LANGUAGE)] * 10
+
+
+def test_make_letters_parallel_invalid_backend():
+    """Test an invalid backend."""
+    with pytest.raises(ValueError):
+        make_letters_parallel([1], backend="fork")
+
+
+def test_create_executor():
+    """Test an executor reused by several conversions."""
+    with create_executor("thread", workers=2) as executor:
+        for mode in ("cardinal", "ordinal_nominal"):
+            assert make_letters_parallel(
+                range(100), backend="thread", executor=executor, mode=mode
+            ) == make_letters_batch(range(100), mode=mode)
+
+    with pytest.raises(ValueError):
+        create_executor("fork")
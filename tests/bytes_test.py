@@ -0,0 +1,193 @@
+"""Test of the numbers given as buffers of ASCII digits.
+
+Run the test with:
+pytest -v tests/bytes_test.py
+"""
+
+import array
+import random
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import ConversionError, check_number, make_letters
+from nombres_vers_lettres.constants import (
+    AVAILABLE_LANGUAGES,
+    ERROR_INPUT_TOO_LONG,
+    ERROR_INVALID_NUMBER,
+    MODES,
+)
+from nombres_vers_lettres.limits import (
+    ConversionLimits,
+    disable_limits,
+    enable_limits,
+    estimate_cost,
+)
+from nombres_vers_lettres.make_letters import (
+    digit_groups,
+    parse_digit_buffer,
+)
+from nombres_vers_lettres.workload import (
+    disable_recording,
+    enable_recording,
+    read_workload,
+)
+
+NUMBERS = (
+    "0",
+    "-0",
+    "7",
+    "-12",
+    "0.000",
+    "-0,0",
+    "007",
+    "1000",
+    "1 234,5",
+    " 1234,50 ",
+    "\t-80,05\r",
+    "1234\n",
+    "0,000000000025",
+    "1" * 66,
+    "1" * 67,
+    "0" * 300 + "1",
+    ".5",
+    "5.",
+    "-",
+    "",
+    "1e5",
+    "1.2.3",
+    "--1",
+    "12-",
+    "abc",
+)
+
+
+def _buffers(number):
+    """Get the number as bytes, as a bytearray and as memoryviews."""
+    number_bytes = number.encode()
+
+    return (
+        number_bytes,
+        bytearray(number_bytes),
+        memoryview(b"##" + number_bytes + b"##")[2:-2],
+        memoryview(bytearray(number_bytes)),
+    )
+
+
+def _letters(number, **options):
+    """Get the letters of a number, or the code of its error."""
+    try:
+        return make_letters(number, **options)
+
+    except ConversionError as error:
+        return error.code
+
+
+@pytest.mark.parametrize("mode", MODES + ("EUR", "CHF", "xx"))
+def test_same_letters(mode):
+    """Test that the buffers are written like their strings."""
+    generator = random.Random(mode)
+    numbers = list(NUMBERS)
+
+    for _ in range(200):
+        number = str(generator.randrange(10 ** generator.randint(1, 30)))
+
+        if generator.random() < 0.5:
+            number += f",{generator.randrange(1000):03d}"
+
+        if generator.random() < 0.3:
+            number = "-" + number
+
+        numbers.append(number)
+
+    for number in numbers:
+        options = {
+            "mode": mode,
+            "language": generator.choice(AVAILABLE_LANGUAGES),
+            "post_1990_orthographe": generator.random() < 0.5,
+            "gender": generator.choice(["masculin", "feminine"]),
+            "plural": generator.random() < 0.5,
+            "use_non_breaking_spaces": generator.random() < 0.5,
+        }
+        letters = _letters(number, **options)
+
+        for buffer in _buffers(number):
+            assert _letters(buffer, **options) == letters, (number, buffer)
+
+
+def test_parse_digit_buffer():
+    """Test the groups read in place from a buffer."""
+    digits = parse_digit_buffer(b" -001234,0500 ")
+
+    assert digits.negative
+    assert digits.integer_groups == digit_groups("001234")
+    assert digits.decimal_groups == digit_groups("0500", decimal=True)
+    assert not digits.is_integer
+
+    assert parse_digit_buffer(b"-000").negative is False
+    assert parse_digit_buffer(b"12").is_integer
+
+    for buffer in (b"1 234", b".5", b"5.", b"1e5", b"1\n", b"1" * 67):
+        # Written from their strings
+        assert parse_digit_buffer(buffer) is None
+
+    # Not contiguous
+    assert parse_digit_buffer(memoryview(b"1a2b3c")[::2]) is None
+
+
+def test_other_buffers():
+    """Test the buffers which are not bytes of ASCII characters."""
+    assert make_letters(memoryview(b"1a2b3c")[::2]) == "cent-vingt-trois"
+    assert make_letters(memoryview(array.array("b", b"42"))) == (
+        "quarante-deux"
+    )
+
+    with pytest.raises(ConversionError) as error:
+        make_letters("12€".encode())
+
+    assert error.value.code == ERROR_INVALID_NUMBER
+
+
+def test_checks():
+    """Test the checks and the limits of the buffers."""
+    assert check_number(b"1 234,5") is None
+    assert check_number(bytearray(b"1,5"), "ordinal") == check_number(
+        "1,5", "ordinal"
+    )
+    assert check_number("12€".encode()) == ERROR_INVALID_NUMBER
+
+    assert estimate_cost(b" -001 234,500 ") == estimate_cost(
+        " -001 234,500 "
+    )
+
+    enable_limits(ConversionLimits(max_input_length=100))
+
+    try:
+        assert make_letters(b"12") == "douze"
+
+        with pytest.raises(ConversionError) as error:
+            make_letters(memoryview(b"1" * 1_000_000))
+
+        assert error.value.code == ERROR_INPUT_TOO_LONG
+
+    finally:
+        disable_limits()
+
+
+def test_recorded_bytes(tmp_path):
+    """Test that the bytes are recorded and replayed as bytes."""
+    path = tmp_path / "workload.log"
+    recorder = enable_recording(path)
+
+    try:
+        make_letters(b"1 234,5")
+        make_letters(bytearray(b"42"))
+        make_letters(memoryview(b"##7,5##")[2:-2])
+
+    finally:
+        disable_recording(recorder)
+
+    # The buffers are replayed as bytes
+    assert [call.number for call in read_workload(path)] == [
+        b"1 234,5",
+        b"42",
+        b"7,5",
+    ]
@@ -0,0 +1,172 @@
+"""Test of the cache snapshots.
+
+Run the test with:
+pytest -v tests/cache_test.py
+"""
+
+import json
+import sys
+import threading
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import make_letters
+from nombres_vers_lettres import cache as cache_module
+from nombres_vers_lettres.cache import (
+    SNAPSHOT_HEADER,
+    ResultCache,
+    disable_cache,
+    enable_cache,
+    load_snapshot,
+    open_snapshot,
+    save_snapshot,
+)
+from nombres_vers_lettres.make_letters import cache_key
+from nombres_vers_lettres.shared import SharedResultCache
+
+NUMBERS = [0, 7, 71, 1_234_567, "98765432109876543210", "0.25", "-3"]
+
+
+def test_snapshot(tmp_path):
+    """Test that a loaded snapshot serves the saved letters."""
+    path = str(tmp_path / "cache.snapshot")
+    enable_cache()
+
+    try:
+        expected = [make_letters(number, mode="EUR") for number in NUMBERS]
+        assert save_snapshot(path) == len(NUMBERS)
+
+    finally:
+        disable_cache()
+
+    cache = load_snapshot(path)
+    try:
+        assert len(cache.snapshot) == len(NUMBERS)
+        assert [
+            make_letters(number, mode="EUR") for number in NUMBERS
+        ] == expected
+        assert cache.hits == len(NUMBERS)
+        assert len(cache) == 0
+
+        # New entries are saved with the snapshot entries
+        make_letters(8)
+        assert save_snapshot(path) == len(NUMBERS) + 1
+
+    finally:
+        disable_cache()
+        cache.snapshot.close()
+
+    snapshot = open_snapshot(path)
+    assert snapshot.get(cache_key(8)) == make_letters(8)
+    assert snapshot.get(cache_key(9)) is None
+    assert dict(snapshot.items())[cache_key(0, mode="EUR")] == expected[0]
+    snapshot.close()
+
+
+def test_empty_snapshot(tmp_path):
+    """Test a snapshot without entries."""
+    path = str(tmp_path / "cache.snapshot")
+    assert save_snapshot(path, ResultCache()) == 0
+
+    cache = load_snapshot(path, install=False)
+    assert cache.get(cache_key(1)) is None
+    cache.snapshot.close()
+
+    with pytest.raises(ValueError):
+        save_snapshot(path)
+
+
+def test_snapshot_too_large(tmp_path, monkeypatch):
+    """Test that the entries beyond the uint32 offsets are rejected."""
+    cache = ResultCache()
+    for number in range(10):
+        cache.put(cache_key(number), make_letters(number))
+
+    monkeypatch.setattr(cache_module, "MAX_SNAPSHOT_SIZE", 50)
+    path = tmp_path / "cache.snapshot"
+
+    with pytest.raises(ValueError):
+        save_snapshot(str(path), cache)
+
+    assert not path.exists()
+
+
+def test_cache_threads():
+    """Test the in-process cache used by several threads."""
+    cache = ResultCache(maxsize=8)
+    # Switch threads as often as possible
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    errors = []
+
+    def run(offset):
+        try:
+            for number in range(5_000):
+                key = str((number + offset) % 16)
+                if cache.get(key) is None:
+                    cache.put(key, key)
+
+        except (KeyError, RuntimeError) as error:
+            errors.append(error)
+
+    threads = [
+        threading.Thread(target=run, args=(offset,)) for offset in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    sys.setswitchinterval(switch_interval)
+    assert errors == []
+    assert len(cache) == 8
+    assert cache.hits + cache.misses == 20_000
+
+
+def test_stale_snapshot(tmp_path):
+    """Test that a snapshot of another version is rejected."""
+    path = tmp_path / "cache.snapshot"
+    cache = ResultCache()
+    cache.put(cache_key(1), "faux")
+    save_snapshot(str(path), cache)
+
+    content = path.read_bytes()
+    _, index_size, _ = SNAPSHOT_HEADER.unpack_from(content)
+    start = SNAPSHOT_HEADER.size
+    end = start + index_size
+    index = json.loads(content[start:end].rstrip(b"\0"))
+    index["constants"] = "0" * len(index["constants"])
+    index_bytes = json.dumps(index).encode("utf-8")
+    path.write_bytes(
+        content[:start] + index_bytes.ljust(index_size, b"\0") + content[end:]
+    )
+
+    with pytest.raises(ValueError):
+        load_snapshot(str(path))
+
+    cache = load_snapshot(str(path), strict=False, install=False)
+    assert cache.get(cache_key(1)) == "faux"
+    cache.snapshot.close()
+
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        load_snapshot(str(path))
+
+
+def test_shared_cache_snapshot(tmp_path):
+    """Test the snapshot of a shared cache."""
+    path = str(tmp_path / "cache.snapshot")
+    shared_cache = SharedResultCache.create(slots=64)
+
+    try:
+        shared_cache.put(cache_key(1), "un")
+        shared_cache.put(cache_key(2), "deux")
+        assert save_snapshot(path, shared_cache) == 2
+
+    finally:
+        shared_cache.close()
+        shared_cache.unlink()
+
+    cache = load_snapshot(path, install=False)
+    assert cache.get(cache_key(2)) == "deux"
+    cache.snapshot.close()
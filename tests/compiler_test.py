@@ -0,0 +1,114 @@
+"""Test of the specialized converters.
+
+Run the test with:
+pytest -v tests/compiler_test.py
+"""
+
+import itertools
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import make_letters
+from nombres_vers_lettres.compiler import (
+    compile_converter,
+    compile_currency_converter,
+)
+
+NUMBERS = (
+    list(range(0, 1_200))
+    + list(range(79_990, 81_010))
+    + [
+        1_000_001,
+        80_000_000,
+        80_008_000,
+        2_000_000_000,
+        2**53 - 1,
+        2**53 + 1,
+        10**20 + 1,
+        "0081",
+        "1" * 66,
+        "9" * 66,
+        "1" * 67,
+        "-25",
+        "1 000",
+        "2,5",
+        -25,
+        4.0,
+        2.5,
+        True,
+    ]
+)
+
+CONFIGURATIONS = list(
+    itertools.product(
+        ("cardinal", "ordinal_adjectival", "ordinal_nominal"),
+        ("masculin", "feminine"),
+        (False, True),
+        ("fr_BE", "fr_FR", "fr_CH"),
+        (False, True),
+        (False, True),
+    )
+)
+
+
+def _letters(converter, number, **options):
+    """Get the letters or the type of the error."""
+    try:
+        return converter(number, **options)
+
+    except ValueError as exception:
+        return type(exception)
+
+
+@pytest.mark.parametrize("configuration", CONFIGURATIONS)
+def test_compiled_converter(configuration):
+    """Test that the converter matches make_letters."""
+    mode, gender, plural, language, post_1990, nbsp = configuration
+    options = {
+        "mode": mode,
+        "gender": gender,
+        "plural": plural,
+        "language": language,
+        "post_1990_orthographe": post_1990,
+        "use_non_breaking_spaces": nbsp,
+    }
+    converter = compile_converter(**options)
+
+    for number in NUMBERS:
+        assert _letters(converter, number) == _letters(
+            make_letters, number, **options
+        ), number
+
+
+def test_cache_and_errors():
+    """Test that the converters are cached."""
+    assert compile_converter() is compile_converter()
+    assert "def letters_fr_BE_cardinal" in compile_converter().source
+
+    with pytest.raises(ValueError):
+        compile_converter(mode="EUR")
+
+
+@pytest.mark.parametrize("currency", ["EUR", "USD", "GBP", "RON"])
+@pytest.mark.parametrize("language", ["fr_BE", "fr_FR", "fr_CH"])
+@pytest.mark.parametrize("post_1990_orthographe", [False, True])
+def test_currency_converter(currency, language, post_1990_orthographe):
+    """Test that the currency converter matches make_letters."""
+    options = {
+        "language": language,
+        "post_1990_orthographe": post_1990_orthographe,
+    }
+    converter = compile_currency_converter(currency, **options)
+    amounts = [
+        amount
+        for number in NUMBERS[::7]
+        if isinstance(number, (int, str)) and not isinstance(number, bool)
+        for amount in (number, f"{number}.5", f"{number},05", f"{number}.00")
+    ] + ["0.01", "1.01", "2000000", "1000000.10", 1.5, "1.234", "-1.50"]
+
+    for amount in amounts:
+        assert _letters(converter, amount) == _letters(
+            make_letters, amount, mode=currency, **options
+        ), amount
+
+    with pytest.raises(ValueError):
+        compile_currency_converter("XYZ")
@@ -0,0 +1,162 @@
+"""Test of the convert module.
+
+Run the test with:
+pytest -v tests/convert_test.py
+"""
+
+import csv
+import json
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres.constants import ERROR_INVALID_RECORD
+from nombres_vers_lettres.convert import (
+    convert_file,
+    parse_column_spec,
+    shard_boundaries,
+)
+
+
+def test_parse_column_spec():
+    """Test the column specifications."""
+    column = parse_column_spec("amount:EUR:fr_FR")
+    assert column.source == "amount"
+    assert column.target == "amount_lettres"
+    assert column.options == {"mode": "EUR", "language": "fr_FR"}
+
+    with pytest.raises(ValueError):
+        parse_column_spec("amount:EUR:xx_XX")
+
+
+def test_shard_boundaries():
+    """Test that the shards are aligned on the lines."""
+    content = b"a\nbb\nccc\ndddd\n"
+    boundaries = shard_boundaries(content, 2, 3)
+    assert boundaries[0][0] == 2
+    assert boundaries[-1][1] == len(content)
+    for start, end in boundaries:
+        assert content[end - 1] == ord("\n")
+    assert b"".join(content[start:end] for start, end in boundaries) == (
+        content[2:]
+    )
+
+
+def test_convert_csv(tmp_path):
+    """Test the conversion of a CSV file in several shards."""
+    input_path = tmp_path / "input.csv"
+    output_path = tmp_path / "output.csv"
+    input_path.write_text(
+        "id,amount,rank\n"
+        + "".join(f"{i},{i}.5,{i}\n" for i in range(1, 200))
+        + "200,,abc\n",
+        encoding="utf-8",
+    )
+
+    columns = [
+        parse_column_spec("amount:EUR", use_non_breaking_spaces=False),
+        parse_column_spec("rank:ordinal_nominal:fr_FR"),
+    ]
+    convert_file(
+        str(input_path),
+        str(output_path),
+        columns,
+        workers=2,
+        min_shard_size=64,
+    )
+
+    lines = output_path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "id,amount,rank,amount_lettres,rank_lettres"
+    assert lines[1] == "1,1.5,1,un euro et cinquante cents,premier"
+    assert lines[80].startswith("80,80.5,80,quatre-vingts euros")
+    assert lines[80].endswith(",quatre-vingtième")
+    assert lines[-1] == "200,,abc,,"
+    assert len(lines) == 201
+
+
+def test_convert_jsonl(tmp_path):
+    """Test the conversion of a JSON Lines file."""
+    input_path = tmp_path / "input.jsonl"
+    output_path = tmp_path / "output.jsonl"
+    records = [{"n": n} for n in (21, None, "1,5")]
+    input_path.write_text(
+        "".join(json.dumps(record) + "\n" for record in records),
+        encoding="utf-8",
+    )
+
+    columns = [parse_column_spec("n", use_non_breaking_spaces=False)]
+    convert_file(str(input_path), str(output_path), columns, workers=1)
+
+    output = [
+        json.loads(line)
+        for line in output_path.read_text(encoding="utf-8").splitlines()
+    ]
+    assert [record["n_lettres"] for record in output] == [
+        "vingt-et-un",
+        None,
+        "un virgule cinq-dixièmes",
+    ]
+
+
+def test_convert_csv_quoted_new_lines(tmp_path):
+    """Test that the quoted new lines are not split between shards."""
+    input_path = tmp_path / "input.csv"
+    output_path = tmp_path / "output.csv"
+    input_path.write_text(
+        "id,note,n\n"
+        + "".join(f'{i},"line\nof {i}",{i}\n' for i in range(1, 100)),
+        encoding="utf-8",
+    )
+
+    convert_file(
+        str(input_path),
+        str(output_path),
+        [parse_column_spec("n", use_non_breaking_spaces=False)],
+        workers=4,
+        min_shard_size=16,
+    )
+
+    with open(output_path, encoding="utf-8", newline="") as output_file:
+        rows = list(csv.reader(output_file))
+
+    assert len(rows) == 100
+    assert rows[21] == ["21", "line\nof 21", "21", "vingt-et-un"]
+
+
+def test_convert_jsonl_not_an_object(tmp_path):
+    """Test that the records which are not objects are reported."""
+    input_path = tmp_path / "input.jsonl"
+    output_path = tmp_path / "output.jsonl"
+    input_path.write_text('{"n": 2}\n5\n"12"\n[1]\n', encoding="utf-8")
+
+    columns = [parse_column_spec("n")]
+    convert_file(str(input_path), str(output_path), columns, workers=1)
+
+    output = [
+        json.loads(line)
+        for line in output_path.read_text(encoding="utf-8").splitlines()
+    ]
+    assert output[0] == {"n": 2, "n_lettres": "deux"}
+    assert [record["record"] for record in output[1:]] == [5, "12", [1]]
+    assert {record["error"] for record in output[1:]} == {
+        ERROR_INVALID_RECORD
+    }
+
+
+def test_convert_jsonl_invalid_json(tmp_path):
+    """Test that a line which is not JSON is reported with its text."""
+    input_path = tmp_path / "input.jsonl"
+    output_path = tmp_path / "output.jsonl"
+    input_path.write_text(
+        '{"n": 2}\n{"n": 3,\n{"n": 4}\n', encoding="utf-8"
+    )
+
+    columns = [parse_column_spec("n")]
+    convert_file(str(input_path), str(output_path), columns, workers=1)
+
+    output = [
+        json.loads(line)
+        for line in output_path.read_text(encoding="utf-8").splitlines()
+    ]
+    assert output[0] == {"n": 2, "n_lettres": "deux"}
+    assert output[1]["record"] == '{"n": 3,'
+    assert output[1]["error"] == ERROR_INVALID_RECORD
+    assert output[2] == {"n": 4, "n_lettres": "quatre"}
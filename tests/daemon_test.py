@@ -0,0 +1,142 @@
+"""Test of the daemon and of its client.
+
+Run the test with:
+pytest -v tests/daemon_test.py
+"""
+
+import os
+import socket
+import sys
+import threading
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import make_letters
+from nombres_vers_lettres.__main__ import client_main, parse_arguments
+from nombres_vers_lettres.daemon import default_socket_path, request_daemon
+
+if not hasattr(socket, "AF_UNIX"):
+    pytest.skip(
+        "Unix domain sockets are not supported", allow_module_level=True
+    )
+
+from nombres_vers_lettres.daemon import LettersServer  # noqa: E402
+
+
+@pytest.fixture(name="socket_path")
+def fixture_socket_path(tmp_path, monkeypatch):
+    """Run a daemon in a thread."""
+    path = str(tmp_path / "nvl.sock")
+    monkeypatch.setenv("NVL_SOCKET", path)
+
+    server = LettersServer(path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield path
+
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_request_daemon(socket_path):
+    """Test the requests to the daemon."""
+    request = parse_arguments(["1991", "-t", "-l", "fr_FR"])
+    assert request_daemon(request, socket_path) == {
+        "id": None,
+        "letters": make_letters(
+            1991, language="fr_FR", post_1990_orthographe=True
+        ),
+    }
+    assert request_daemon({"number": "1,2.3"})["error"] == (
+        "too_many_separators"
+    )
+
+    # Several requests on the same connection
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(b'{"id": 1, "number": 1}\n{"id": 2, "number": 2}\n')
+        responses = client.makefile("rb")
+        assert b'"un"' in responses.readline()
+        assert b'"deux"' in responses.readline()
+
+
+def test_already_running(socket_path):
+    """Test that a second daemon does not steal the socket."""
+    with pytest.raises(OSError):
+        LettersServer(socket_path)
+
+
+def test_stale_socket(tmp_path):
+    """Test that the socket of a stopped daemon is replaced."""
+    path = str(tmp_path / "stale.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+
+    assert request_daemon({"number": 1}, path) is None
+    LettersServer(path).server_close()
+
+
+@pytest.mark.parametrize("running", [True, False])
+def test_client(running, tmp_path, monkeypatch, capsys, request):
+    """Test the client, with and without the daemon."""
+    if running:
+        request.getfixturevalue("socket_path")
+
+    else:
+        monkeypatch.setenv("NVL_SOCKET", str(tmp_path / "missing.sock"))
+
+    monkeypatch.setattr(sys, "argv", ["nvl-client", "80", "-on"])
+    client_main()
+    assert capsys.readouterr().out == (
+        make_letters(80, mode="ordinal_nominal") + "\n"
+    )
+
+    monkeypatch.setattr(sys, "argv", ["nvl-client", "--", "-1-"])
+    with pytest.raises(SystemExit):
+        client_main()
+
+
+def test_client_unix(socket_path, tmp_path, monkeypatch, capsys):
+    """Test the client with the path of the socket in its arguments."""
+    monkeypatch.setenv("NVL_SOCKET", str(tmp_path / "missing.sock"))
+    requests = []
+
+    def record_request(request, path=None):
+        requests.append((dict(request), path))
+        return request_daemon(request, path)
+
+    monkeypatch.setattr(
+        "nombres_vers_lettres.daemon.request_daemon", record_request
+    )
+    monkeypatch.setattr(
+        sys, "argv", ["nvl-client", "--unix", socket_path, "21", "-f"]
+    )
+    client_main()
+
+    assert capsys.readouterr().out == (
+        make_letters(21, gender="f", post_1990_orthographe=False) + "\n"
+    )
+    ((request, path),) = requests
+    assert path == socket_path
+    assert "unix" not in request
+
+
+def test_default_socket(tmp_path, monkeypatch):
+    """Test that the default socket is in a directory of the user."""
+    monkeypatch.delenv("NVL_SOCKET", raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    assert default_socket_path() == str(tmp_path / "nombres_vers_lettres.sock")
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    assert str(os.getuid()) in os.path.basename(default_socket_path())
+
+
+def test_socket_of_another_user(socket_path, monkeypatch):
+    """Test that the default socket of another user is not used."""
+    owner = os.stat(socket_path).st_uid
+    monkeypatch.setattr(os, "getuid", lambda: owner + 1)
+
+    assert request_daemon({"number": 1}) is None
+    # Unless given explicitly
+    assert request_daemon({"number": 1}, socket_path)["letters"] == "un"
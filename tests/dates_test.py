@@ -0,0 +1,116 @@
+"""Test of the dates and the times written in letters.
+
+Run the test with:
+pytest -v tests/dates_test.py
+"""
+
+import datetime
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import ConversionError, make_letters
+from nombres_vers_lettres.constants import AVAILABLE_LANGUAGES, MONTHS_FR
+from nombres_vers_lettres.dates import make_date_letters, make_time_letters
+
+PLAIN = {"use_non_breaking_spaces": False}
+
+
+def _date_letters(date, **options):
+    """Write a date with make_letters."""
+    day = "premier" if date.day == 1 else make_letters(date.day, **options)
+    return (
+        f"le {day} {MONTHS_FR[date.month - 1]} "
+        f"{make_letters(date.year, **options)}"
+    )
+
+
+def _time_letters(time, **options):
+    """Write a time with make_letters."""
+    letters = make_letters(time.hour, gender="feminine", **options)
+    letters += " heure" if time.hour < 2 else " heures"
+
+    if time.minute:
+        minutes = make_letters(time.minute, gender="feminine", **options)
+        letters += " " + minutes
+
+    return letters
+
+
+def test_examples():
+    """Test the letters of some dates and times."""
+    options = {"post_1990_orthographe": False, **PLAIN}
+
+    assert make_date_letters(datetime.date(2026, 3, 21), **options) == (
+        "le vingt et un mars deux mille vingt-six"
+    )
+    assert make_date_letters(
+        datetime.datetime(1990, 8, 1, 12), article=False, **options
+    ) == "premier août mille neuf cent nonante"
+    assert make_time_letters(datetime.time(14, 30), **options) == (
+        "quatorze heures trente"
+    )
+    assert make_time_letters(datetime.time(0, 1), **options) == (
+        "zéro heure une"
+    )
+    assert make_time_letters(
+        datetime.time(1, 21), minute_unit=True, language="fr_FR", **PLAIN
+    ) == "une heure vingt-et-une minutes"
+    assert make_date_letters(datetime.date(2026, 3, 21)) == (
+        "le\xa0vingt-et-un\xa0mars\xa0deux-mille-vingt-six"
+    )
+
+
+@pytest.mark.parametrize("language", AVAILABLE_LANGUAGES)
+@pytest.mark.parametrize("post_1990_orthographe", [False, True])
+def test_tables(language, post_1990_orthographe):
+    """Test that the tables are the letters of make_letters."""
+    options = {
+        "language": language,
+        "post_1990_orthographe": post_1990_orthographe,
+        **PLAIN,
+    }
+    dates = [
+        datetime.date(year, month, day)
+        for year in (1, 1799, 1800, 1980, 2026, 2199, 2200, 9999)
+        for month in range(1, 13)
+        for day in range(1, 32, 3)
+        if day <= 28
+    ]
+    times = [
+        datetime.time(hour, minute)
+        for hour in range(24)
+        for minute in range(60)
+    ]
+
+    assert make_date_letters(dates, **options) == [
+        _date_letters(date, **options) for date in dates
+    ]
+    assert make_time_letters(times, **options) == [
+        _time_letters(time, **options) for time in times
+    ]
+
+
+def test_year_window():
+    """Test that the years out of the window are converted too."""
+    date = datetime.date(1500, 5, 8)
+
+    assert make_date_letters(date, years=(2000, 2050)) == make_date_letters(
+        date
+    )
+
+    with pytest.raises(ValueError):
+        make_date_letters(date, years=(2050, 2000))
+
+
+def test_invalid_values():
+    """Test that the values which are not dates or times are rejected."""
+    invalid_values = ("2026-03-21", 1, None, [datetime.date(2026, 1, 1), 1])
+
+    for value in invalid_values:
+        with pytest.raises(ConversionError):
+            make_date_letters(value)
+
+    with pytest.raises(ConversionError):
+        make_time_letters(datetime.date(2026, 1, 1))
+
+    with pytest.raises(ValueError):
+        make_date_letters(datetime.date(2026, 1, 1), language="xx")
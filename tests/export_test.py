@@ -0,0 +1,188 @@
+"""Test of the export of the (number, letters) datasets.
+
+Run the test with:
+pytest -v tests/export_test.py
+"""
+
+import json
+import os
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import make_letters
+from nombres_vers_lettres.__main__ import export_command
+from nombres_vers_lettres.export import (
+    MANIFEST_NAME,
+    export_dataset,
+    iter_letters,
+    parse_range,
+    shard_ranges,
+)
+
+RANGES = [
+    (-25, 2_100),
+    (79_990, 81_010),
+    (999_500, 1_001_200),
+    (21_000_000, 21_001_001),
+    (10**20 - 1_001, 10**20 + 5),
+    (10**65 - 3, 10**65 + 2),
+]
+
+
+@pytest.mark.parametrize(
+    "mode", ["cardinal", "ordinal_adjectival", "ordinal_nominal", "EUR"]
+)
+@pytest.mark.parametrize("language", ["fr_BE", "fr_FR", "fr_CH"])
+@pytest.mark.parametrize("post_1990_orthographe", [False, True])
+def test_iter_letters(mode, language, post_1990_orthographe):
+    """Test that the letters of a range are the letters of make_letters."""
+    options = {
+        "mode": mode,
+        "gender": "feminine",
+        "language": language,
+        "post_1990_orthographe": post_1990_orthographe,
+    }
+
+    for start, stop in RANGES:
+        if mode == "EUR":
+            stop = start + 50
+
+        assert list(iter_letters(start, stop, **options)) == [
+            make_letters(str(number), **options)
+            for number in range(start, stop)
+        ], (start, stop)
+
+
+def test_shard_ranges():
+    """Test that the shards cover the range, in order."""
+    assert shard_ranges(0, 10, 3) == [(0, 3), (3, 6), (6, 10)]
+    assert shard_ranges(5, 7, 4) == [(5, 6), (6, 7)]
+
+    ranges = shard_ranges(-1_000, 10_000_003, 64)
+    assert ranges[0][0] == -1_000
+    assert ranges[-1][1] == 10_000_003
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+
+
+def test_parse_range():
+    """Test the start:stop ranges."""
+    assert parse_range("0:10000000") == (0, 10_000_000)
+    assert parse_range("-5:5") == (-5, 5)
+
+    for spec in ("10", "a:b", "1:2:3", "5:5"):
+        with pytest.raises(ValueError):
+            parse_range(spec)
+
+
+def _read_records(paths):
+    records = []
+
+    for path in paths:
+        with open(path, encoding="utf-8") as shard_file:
+            records.extend(json.loads(line) for line in shard_file)
+
+    return records
+
+
+def test_export_dataset(tmp_path):
+    """Test the records of an export and its resumption."""
+    directory = str(tmp_path / "dataset")
+    arguments = {
+        "modes": ["cardinal", "ordinal_nominal"],
+        "languages": ["fr_BE", "fr_FR"],
+        "shards": 4,
+        "workers": 1,
+    }
+    paths = export_dataset(directory, 995, 2_010, **arguments)
+
+    assert [os.path.basename(path) for path in paths] == [
+        f"part-{index:05d}-of-00004.jsonl" for index in range(4)
+    ]
+
+    records = _read_records(paths)
+    assert len(records) == (2_010 - 995) * 4
+    assert records[:2] == [
+        {
+            "number": 995,
+            "mode": "cardinal",
+            "language": "fr_BE",
+            "letters": "neuf cent nonante-cinq",
+        },
+        {
+            "number": 995,
+            "mode": "cardinal",
+            "language": "fr_FR",
+            "letters": "neuf cent quatre-vingt-quinze",
+        },
+    ]
+    assert all(
+        record["letters"]
+        == make_letters(
+            record["number"],
+            mode=record["mode"],
+            language=record["language"],
+            post_1990_orthographe=False,
+            use_non_breaking_spaces=False,
+        )
+        for record in records
+    )
+
+    # An interrupted export: a complete shard and a partial one
+    with open(paths[1], "w", encoding="utf-8") as shard_file:
+        shard_file.write("kept\n")
+
+    os.rename(paths[2], paths[2] + ".part")
+
+    assert export_dataset(directory, 995, 2_010, **arguments) == paths
+
+    with open(paths[1], encoding="utf-8") as shard_file:
+        assert shard_file.read() == "kept\n"
+
+    assert not os.path.exists(paths[2] + ".part")
+    start, stop = shard_ranges(995, 2_010, 4)[2]
+    assert _read_records(paths[2:3]) == [
+        record for record in records if start <= record["number"] < stop
+    ]
+
+    # Another export in the same directory
+    with pytest.raises(ValueError):
+        export_dataset(directory, 0, 2_010, **arguments)
+
+
+def test_export_tsv(tmp_path):
+    """Test the TSV shards of the command and the errors of the options."""
+    directory = str(tmp_path / "dataset")
+    export_command(
+        [
+            directory,
+            "--range",
+            "19:23",
+            "--languages",
+            "fr_FR",
+            "--format",
+            "tsv",
+            "--workers",
+            "1",
+            "-t",
+        ]
+    )
+
+    assert sorted(os.listdir(directory)) == [
+        MANIFEST_NAME,
+        "part-00000-of-00001.tsv",
+    ]
+
+    with open(
+        os.path.join(directory, "part-00000-of-00001.tsv"), encoding="utf-8"
+    ) as shard_file:
+        assert shard_file.read() == (
+            "19\tcardinal\tfr_FR\tdix-neuf\n"
+            "20\tcardinal\tfr_FR\tvingt\n"
+            "21\tcardinal\tfr_FR\tvingt-et-un\n"
+            "22\tcardinal\tfr_FR\tvingt-deux\n"
+        )
+
+    for arguments in (["--modes", "unknown"], ["--languages", "xx"]):
+        with pytest.raises(SystemExit):
+            export_command(
+                [str(tmp_path / "other"), "--range", "0:10", *arguments]
+            )
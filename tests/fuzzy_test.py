@@ -0,0 +1,131 @@
+"""Test of the fuzzy reading of the numbers written in letters.
+
+Run the test with:
+pytest -v tests/fuzzy_test.py
+"""
+
+import random
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import make_letters
+from nombres_vers_lettres.fuzzy import (
+    BKTree,
+    fuzzy_parse,
+    levenshtein,
+    vocabulary,
+)
+
+_generator = random.Random(0)
+NUMBERS = (
+    [str(number) for number in range(0, 1_200, 3)]
+    + ["71", "80", "91", "1000000", "2000000080", "1" * 66]
+    + [str(_generator.randrange(10**digits)) for digits in range(1, 40)]
+)
+
+
+@pytest.mark.parametrize("language", ["fr_BE", "fr_FR", "fr_CH"])
+@pytest.mark.parametrize("post_1990_orthographe", [False, True])
+def test_letters(language, post_1990_orthographe):
+    """Test that the letters of make_letters are read exactly."""
+    for number in NUMBERS:
+        match = fuzzy_parse(
+            make_letters(
+                number,
+                language=language,
+                post_1990_orthographe=post_1990_orthographe,
+            )
+        )
+
+        assert match.number == number
+        assert match.confidence == 1.0
+        assert match.currencies == ()
+
+
+@pytest.mark.parametrize("language", ["fr_BE", "fr_FR", "fr_CH"])
+def test_amounts(language):
+    """Test that the amounts of make_letters are read exactly."""
+    for number in ["1,01", "0,50", "21,80", "1234567,89", "-3,99", "200"]:
+        letters = make_letters(number, mode="EUR", language=language)
+        match = fuzzy_parse(letters)
+
+        assert match.number == number.replace(",", ".")
+        assert match.confidence == 1.0
+        assert "EUR" in match.currencies
+
+
+@pytest.mark.parametrize(
+    "text, number",
+    [
+        ("quatre vingt dix neut", "99"),
+        ("deux mile", "2000"),
+        ("QUATRE-VINGT-DIX-NEUF", "99"),
+        ("zero", "0"),
+        ("un milion d'euros", "1000000"),
+        ("deux mllions trois cent mile quatre vingt dlx sept", "2300097"),
+        ("vingt cinq francs suisses", "25"),
+        ("trente-deux centimes", "0.32"),
+        ("douze virgule zéro cinq", "12.05"),
+        ("douze virgule cinq dixièmes", "12.5"),
+        ("moins vingt et une", "-21"),
+    ],
+)
+def test_typos(text, number):
+    """Test the reading of misspelled letters."""
+    match = fuzzy_parse(text)
+
+    assert match.number == number
+    assert 0.5 < match.confidence <= 1.0
+
+
+def test_confidence():
+    """Test that the confidence drops with the typos and the grammar."""
+    exact = fuzzy_parse("quatre-vingt-dix-neuf")
+    one_typo = fuzzy_parse("quatre-vingt-dix-neut")
+    two_typos = fuzzy_parse("quatre-vlngt-dix-neut")
+
+    assert exact.confidence == 1.0
+    assert 1.0 > one_typo.confidence > two_typos.confidence
+    assert one_typo.words == exact.words
+
+    # The words are not the letters of 5
+    assert fuzzy_parse("deux trois").confidence < 0.5
+
+    # The cents of an amount are below a hundred
+    assert fuzzy_parse("deux euros et cinq cents").number == "2.05"
+
+
+def test_multiplied_ranks():
+    """Test that a rank multiplies the lower ranks before it."""
+    assert fuzzy_parse("mille milliards").number == str(10**12)
+    assert fuzzy_parse("deux mille cinq cent milliards").number == str(
+        2_500 * 10**9
+    )
+    assert fuzzy_parse("un million mille").number == "1001000"
+
+
+def test_no_number():
+    """Test that a text without a number is not read."""
+    assert fuzzy_parse("") is None
+    assert fuzzy_parse("bonjour madame") is None
+    assert fuzzy_parse("euros") is None
+
+    # Too many digits to be written in letters
+    assert fuzzy_parse("cent cent cent cent cent décilliards") is None
+    assert fuzzy_parse("zéro virgule " + "cent " * 33) is None
+    assert fuzzy_parse("décilliards " * 1_000) is None
+
+
+def test_bk_tree():
+    """Test that the BK-tree finds the same words as a linear search."""
+    words = sorted(vocabulary())
+    tree = BKTree(words + words[:10])
+
+    assert len(tree) == len(words)
+
+    for word in ["neut", "mile", "vlngt", "xyz", "centimse", "septente"]:
+        for max_distance in range(3):
+            assert tree.search(word, max_distance) == sorted(
+                (levenshtein(word, other), other)
+                for other in words
+                if levenshtein(word, other) <= max_distance
+            )
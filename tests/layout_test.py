@@ -0,0 +1,135 @@
+"""Test of the length and of the line breaks of the letters.
+
+Run the test with:
+pytest -v tests/layout_test.py
+"""
+
+import itertools
+import random
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import ConversionError, make_letters
+from nombres_vers_lettres.layout import (
+    letters_length,
+    line_bounds,
+    wrap_letters,
+)
+from nombres_vers_lettres.parsed import parse_number
+
+_generator = random.Random(0)
+NUMBERS = (
+    list(range(0, 1_200, 7))
+    + list(range(79_990, 81_010, 3))
+    + [
+        1_000_001,
+        80_000_000,
+        80_008_000,
+        21_000_000,
+        2_000_000_000,
+        2**53 - 1,
+        2**53 + 1,
+        10**20 + 1,
+        "0081",
+        "1" * 66,
+        "1" * 67,
+        "-25",
+        "1 000",
+        "2,5",
+        -25,
+        4.0,
+        2.5,
+        True,
+        "0,05",
+        "0.00",
+        "5.",
+        "12.50",
+        "3000000",
+        "1000000,01",
+        "-1,50",
+        "0,999",
+    ]
+    + [_generator.randrange(10**digits) for digits in range(1, 40)]
+    + [
+        f"{_generator.randrange(10**digits)},{digits % 100:02d}"
+        for digits in range(1, 40)
+    ]
+)
+
+CONFIGURATIONS = list(
+    itertools.product(
+        ("cardinal", "ordinal_adjectival", "ordinal_nominal", "EUR", "USD"),
+        ("masculin", "feminine"),
+        (False, True),
+        ("fr_BE", "fr_FR", "fr_CH"),
+        (False, True),
+    )
+)
+
+
+@pytest.mark.parametrize(
+    "mode, gender, plural, language, post_1990_orthographe", CONFIGURATIONS
+)
+def test_letters_length(mode, gender, plural, language, post_1990_orthographe):
+    """Test that the length is the length of the letters."""
+    options = {
+        "mode": mode,
+        "gender": gender,
+        "plural": plural,
+        "language": language,
+        "post_1990_orthographe": post_1990_orthographe,
+    }
+
+    for number in NUMBERS:
+        try:
+            expected = len(make_letters(number, **options))
+
+        except ConversionError:
+            with pytest.raises(ConversionError):
+                letters_length(number, **options)
+
+            continue
+
+        assert letters_length(number, **options) == expected, number
+        assert letters_length(parse_number(number), **options) == expected
+
+
+def test_unsupported_mode():
+    """Test that an invalid mode raises the error of make_letters."""
+    with pytest.raises(ConversionError):
+        letters_length(1, mode="unknown")
+
+
+def test_line_bounds():
+    """Test the breaks at the spaces and after the hyphens."""
+    letters = make_letters(
+        "1234567,89", mode="EUR", post_1990_orthographe=False
+    )
+
+    bounds = line_bounds(letters, 20)
+    assert bounds[0] == (0, 20)
+    assert letters[bounds[0][1]] == "\xa0"
+    assert all(end - start <= 20 for start, end in bounds)
+
+    # Nothing but the spaces at the breaks is left out
+    for (_, end), (start, _) in zip(bounds, bounds[1:]):
+        assert letters[end:start] in ("", "\xa0")
+
+    lines = wrap_letters(letters, 20)
+    assert lines == [
+        "un\xa0million\xa0deux\xa0cent",
+        "trente-quatre\xa0mille",
+        "cinq\xa0cent\xa0soixante-",
+        "sept\xa0euros\xa0et",
+        "quatre-vingt-neuf",
+        "cents",
+    ]
+
+
+def test_long_word():
+    """Test that a word longer than the width is left on its own line."""
+    assert wrap_letters("abcdefghij klm", 4) == ["abcdefghij", "klm"]
+    assert wrap_letters("abcdefghij", 4) == ["abcdefghij"]
+    assert wrap_letters("", 4) == [""]
+
+    with pytest.raises(ValueError):
+        line_bounds("un", 0)
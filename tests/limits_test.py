@@ -0,0 +1,138 @@
+"""Test of the limits of the inputs and of the cost estimate.
+
+Run the test with:
+pytest -v tests/limits_test.py
+"""
+
+import random
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import ConversionError, make_letters
+from nombres_vers_lettres.constants import (
+    ERROR_INPUT_TOO_LONG,
+    ERROR_INVALID_NUMBER,
+    ERROR_OUTPUT_TOO_LONG,
+    ERROR_RANK_OUT_OF_RANGE,
+    MAX_INTEGER_DIGITS,
+)
+from nombres_vers_lettres.limits import (
+    ConversionLimits,
+    disable_limits,
+    enable_limits,
+    estimate_cost,
+)
+from nombres_vers_lettres.make_letters import make_currency
+
+
+@pytest.fixture(name="limits")
+def fixture_limits():
+    """Enable limits in make_letters and disable them after the test."""
+    yield enable_limits(
+        ConversionLimits(
+            max_input_length=1000,
+            max_integer_digits=12,
+            max_decimal_digits=6,
+        )
+    )
+    disable_limits()
+
+
+def test_estimate_cost():
+    """Test the digits of the numbers and the bound of the letters."""
+    cost = estimate_cost(" -001 234,500 ")
+
+    assert cost.input_length == 14
+    assert cost.integer_digits == 4
+    assert cost.decimal_digits == 1
+    assert cost.error is None
+
+    assert estimate_cost(10**20).integer_digits == 21
+    assert estimate_cost(0).integer_digits == 0
+    assert estimate_cost(1e-10).decimal_digits == 10
+    assert estimate_cost("2,5e3").integer_digits == 4
+    assert estimate_cost(float("nan")).error == ERROR_INVALID_NUMBER
+    assert estimate_cost("1.2.3").error is not None
+    assert estimate_cost("1" * 100).error == ERROR_RANK_OUT_OF_RANGE
+    assert estimate_cost(10**10_000).error == ERROR_RANK_OUT_OF_RANGE
+
+
+@pytest.mark.parametrize("mode", ["cardinal", "ordinal_nominal", "EUR"])
+def test_output_length_bound(mode):
+    """Test that the letters are never longer than the estimate."""
+    generator = random.Random(0)
+
+    for _ in range(200):
+        digits = generator.randint(1, MAX_INTEGER_DIGITS)
+        number = str(generator.randrange(10 ** (digits - 1), 10**digits))
+
+        if mode != "ordinal_nominal" and generator.random() < 0.5:
+            number += "." + str(generator.randrange(1, 10**20))
+
+        letters = make_letters(
+            number, mode=mode, gender="feminine", plural=True
+        )
+        assert len(letters) <= estimate_cost(number, mode).output_length
+
+
+def test_limits(limits):
+    """Test that make_letters rejects the inputs out of the limits."""
+    assert make_letters("1 234,5") == make_letters(1234.5)
+    assert make_letters("0" * 900 + "1") == "un"
+
+    for number, code in [
+        ("1" * 1001, ERROR_INPUT_TOO_LONG),
+        ("1" * 13, ERROR_RANK_OUT_OF_RANGE),
+        (10**12, ERROR_RANK_OUT_OF_RANGE),
+        ("1e12", ERROR_RANK_OUT_OF_RANGE),
+        ("0.1234567", ERROR_RANK_OUT_OF_RANGE),
+        (1e-7, ERROR_RANK_OUT_OF_RANGE),
+    ]:
+        with pytest.raises(ConversionError) as exception_info:
+            make_letters(number)
+
+        assert exception_info.value.code == code
+        assert estimate_cost(number).error == code
+
+    assert estimate_cost("1" * 13, limits=ConversionLimits()).error is None
+
+
+def test_currency_limits(limits):
+    """Test that make_currency rejects the inputs out of the limits."""
+    assert make_currency("1 234,5") == make_letters("1 234,5", mode="EUR")
+
+    for number, code in [
+        ("1" * 1001, ERROR_INPUT_TOO_LONG),
+        ("1" * 13, ERROR_RANK_OUT_OF_RANGE),
+        ("0.1234567", ERROR_RANK_OUT_OF_RANGE),
+    ]:
+        with pytest.raises(ConversionError) as exception_info:
+            make_currency(number, currency="USD")
+
+        assert exception_info.value.code == code
+
+
+def test_output_limit():
+    """Test that the letters are limited from their estimated length."""
+    limits = ConversionLimits(max_output_length=200)
+
+    assert estimate_cost("1234", limits=limits).error is None
+    assert (
+        estimate_cost("1234567890", limits=limits).error
+        == ERROR_OUTPUT_TOO_LONG
+    )
+
+    enable_limits(limits)
+
+    try:
+        assert make_letters("12") == "douze"
+
+        with pytest.raises(ConversionError):
+            make_letters("1234567890")
+
+    finally:
+        disable_limits()
+
+
+def test_long_leading_zeros():
+    """Test the leading zeros longer than what int() parses."""
+    assert make_letters("0" * 10_000 + "1") == "un"
@@ -0,0 +1,31 @@
+"""Test of the conversion of very long digit strings.
+
+Run the test with:
+pytest -v tests/long_digits_test.py
+"""
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import ConversionError, make_letters
+from nombres_vers_lettres.constants import ERROR_RANK_OUT_OF_RANGE
+
+
+@pytest.mark.parametrize("digits", [10_000, 50_000])
+def test_long_decimal_part(digits):
+    """Test that the empty groups of a long decimal part are skipped."""
+    assert make_letters("0,1".ljust(digits, "0")) == make_letters("0,100")
+
+
+@pytest.mark.parametrize("digits", [10_000, 50_000])
+def test_long_leading_zeros(digits):
+    """Test that the leading zeros of a long integer are skipped."""
+    assert make_letters("1234567".rjust(digits, "0")) == make_letters(
+        "1234567"
+    )
+
+
+def test_long_integer_out_of_range():
+    """Test that a long integer is rejected before any conversion."""
+    with pytest.raises(ConversionError) as exception_info:
+        make_letters("1" * 100_000)
+
+    assert exception_info.value.code == ERROR_RANK_OUT_OF_RANGE
@@ -0,0 +1,86 @@
+"""Test of the allocation budgets of make_letters.
+
+Run the test with:
+pytest -v tests/memory_test.py
+"""
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import make_letters
+from nombres_vers_lettres.cache import ResultCache, disable_cache, enable_cache
+from nombres_vers_lettres.profiling import (
+    AllocationProfile,
+    check_budgets,
+    profile_allocations,
+    profile_paths,
+    sample_numbers,
+)
+
+
+def test_allocation_budgets():
+    """Test the allocations of each mode against the budgets."""
+    profiles = profile_paths(
+        sample_numbers(150), languages=("fr_BE", "fr_FR")
+    )
+
+    assert len(profiles) == 8
+    assert all(profile.calls > 0 for profile in profiles)
+    # At least the letters are allocated by each call
+    assert all(profile.blocks_per_call > 0.5 for profile in profiles)
+    assert check_budgets(profiles) == []
+
+
+def test_no_retained_growth():
+    """Test that the retained memory does not grow with the calls."""
+    few = profile_allocations(sample_numbers(100))
+    many = profile_allocations(sample_numbers(2_000, seed=1))
+
+    assert many.calls == 20 * few.calls
+    assert many.retained_bytes <= few.retained_bytes + 512
+
+
+def test_bounded_cache():
+    """Test that a cache retains at most its maximal number of entries."""
+    enable_cache(ResultCache(maxsize=50))
+
+    try:
+        profile = profile_allocations(sample_numbers(1_000))
+
+    finally:
+        disable_cache()
+
+    longest = max(len(make_letters(number)) for number in sample_numbers())
+    assert 0 < profile.retained_bytes < 50 * 4 * (longest + 200)
+
+
+def test_cached_letters_not_allocated():
+    """Test that the letters read from a cache are not allocated again."""
+    enable_cache(ResultCache(maxsize=1_000))
+
+    try:
+        profile = profile_allocations(sample_numbers(500))
+
+    finally:
+        disable_cache()
+
+    assert profile.blocks_per_call < 0.5
+
+
+def test_exceeded_budgets():
+    """Test that the exceeded budgets are reported."""
+    assert len(
+        check_budgets(
+            [
+                AllocationProfile({"mode": "cardinal"}, 10, 10**6, 1, 10),
+                AllocationProfile({"mode": "EUR"}, 10, 10, 1_000, 10**6),
+                AllocationProfile({"mode": "EUR"}, 10, 10, 0, 0, 20.0),
+            ]
+        )
+    ) == 3
+
+
+@pytest.mark.parametrize("mode", ["cardinal", "EUR"])
+def test_invalid_numbers_skipped(mode):
+    """Test that the numbers which cannot be converted are skipped."""
+    assert profile_allocations(["abc", "1", 2.5], mode=mode).calls == (
+        2 if mode == "cardinal" else 1
+    )
@@ -0,0 +1,131 @@
+"""Test of the numbers parsed once and written in several variants.
+
+Run the test with:
+pytest -v tests/parsed_test.py
+"""
+
+import random
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import ConversionError, make_letters
+from nombres_vers_lettres.constants import (
+    AVAILABLE_LANGUAGES,
+    ERROR_INVALID_MODE,
+    ERROR_NOT_AN_INTEGER,
+    MODES,
+)
+from nombres_vers_lettres.parsed import (
+    parse_number,
+    render_letters,
+    render_variants,
+    variant_options,
+)
+
+VARIANTS = variant_options(
+    modes=MODES + ("EUR", "USD"),
+    genders=("masculin", "f"),
+    plurals=(False, True),
+    languages=AVAILABLE_LANGUAGES,
+    post_1990_orthographes=(False, True),
+)
+
+NUMBERS = [
+    0,
+    1,
+    -1,
+    21,
+    80,
+    1_001,
+    2_000_000,
+    -0.0,
+    0.5,
+    -2.5,
+    1e-05,
+    2.0,
+    "0",
+    "-0",
+    "5.",
+    ".5",
+    "12\n",
+    "abc",
+    "1,2.3",
+    "-1 234,50",
+    "0,000001",
+    "1e300",
+    "2,5e-40",
+    "0081",
+    "1000000,25",
+    "0." + "0" * 70 + "1",
+]
+
+
+def _letters_or_error(number, **options):
+    """Get the letters of make_letters, or its error."""
+    try:
+        return make_letters(number, **options), None
+
+    except ConversionError as exception:
+        return None, exception.code
+
+
+@pytest.mark.parametrize("number", NUMBERS)
+def test_same_letters(number):
+    """Test that every variant is written as make_letters writes it."""
+    parsed = parse_number(number)
+
+    for options, result in zip(VARIANTS, render_variants(parsed, VARIANTS)):
+        expected = _letters_or_error(number, **options)
+
+        assert tuple(result) == expected, options
+
+        if expected[0] is not None:
+            assert render_letters(parsed, **options) == expected[0]
+
+
+def test_random_numbers():
+    """Test the variants of random numbers."""
+    generator = random.Random(0)
+    variants = variant_options(
+        modes=("cardinal", "ordinal_nominal", "EUR"),
+        genders=("masculin", "féminin"),
+        languages=("fr_BE", "fr_FR"),
+        post_1990_orthographes=(False, True),
+        use_non_breaking_spaces=False,
+    )
+
+    for _ in range(200):
+        number = generator.randrange(10 ** generator.randrange(1, 40))
+
+        for value in (number, -number, f"{number},{number % 100:02d}"):
+            for options, result in zip(
+                variants, render_variants(value, variants)
+            ):
+                assert tuple(result) == _letters_or_error(value, **options)
+
+
+def test_parse_number():
+    """Test the groups of a parsed number."""
+    parsed = parse_number("-1 000 002,0500")
+
+    assert parsed.negative
+    assert parsed.integer_groups == ((6, 1, 1), (0, 2, 3))
+    assert parsed.decimal_groups == ((3, 50, 3),)
+    assert not parsed.is_integer
+
+    assert parse_number("1e60").integer_groups == ((60, 1, 1),)
+    assert parse_number("abc").integer_groups is None
+
+
+def test_errors():
+    """Test the errors of the variants."""
+    parsed = parse_number("2,5")
+
+    with pytest.raises(ConversionError):
+        render_letters(parsed, mode="ordinal_nominal")
+
+    assert [
+        result.error
+        for result in render_variants(
+            parsed, [{"mode": "ordinal"}, {"mode": "unknown"}, {}]
+        )
+    ] == [ERROR_NOT_AN_INTEGER, ERROR_INVALID_MODE, None]
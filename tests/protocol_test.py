@@ -0,0 +1,164 @@
+"""Test of the JSON Lines protocol.
+
+Run the test with:
+pytest -v tests/protocol_test.py
+"""
+
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import make_letters
+from nombres_vers_lettres.protocol import handle_request, serve_jsonl
+
+
+def _serve(data: bytes, **options) -> list[dict]:
+    """Answer the requests of data with serve_jsonl."""
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, data)
+    os.close(write_fd)
+
+    output = io.BytesIO()
+    try:
+        serve_jsonl(read_fd, output, **options)
+
+    finally:
+        os.close(read_fd)
+
+    return [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+def test_handle_request():
+    """Test the responses to valid and invalid requests."""
+    assert handle_request(
+        {"id": "a", "number": 21, "gender": "féminin", "language": "fr_FR"}
+    ) == {"id": "a", "letters": make_letters(21, gender="f")}
+
+    assert handle_request({"id": 1, "number": "1.5", "mode": "ordinal"})[
+        "error"
+    ] == "not_an_integer"
+    assert handle_request({"id": 1, "number": 1, "mode": "x"})[
+        "error"
+    ] == "invalid_mode"
+
+    for request in (
+        [],
+        {"id": 1},
+        {"id": 1, "number": True},
+        {"id": 1, "number": 1, "plural": "yes"},
+        {"id": 1, "number": 1, "language": "xx"},
+        {"id": 1, "number": 1, "gender": "x"},
+    ):
+        assert handle_request(request)["error"] == "invalid_request"
+
+
+@pytest.mark.parametrize(
+    "options", [{}, {"workers": 2}, {"workers": 2, "ordered": False}]
+)
+def test_serve_jsonl(options):
+    """Test that every request gets its response."""
+    numbers = list(range(500))
+    data = b"".join(
+        json.dumps({"id": number, "number": number}).encode() + b"\n"
+        for number in numbers
+    )
+    # The last line has no new line
+    data += b'\n{"id": "last", "number": "1"}'
+
+    responses = _serve(data, **options)
+    assert len(responses) == len(numbers) + 1
+
+    letters = {response["id"]: response["letters"] for response in responses}
+    assert letters["last"] == "un"
+    assert all(letters[number] == make_letters(number) for number in numbers)
+
+    if options.get("ordered", True):
+        assert [response["id"] for response in responses[:-1]] == numbers
+
+
+def test_bad_request_then_good():
+    """Test that a bad request does not stop the answers to the next ones."""
+    responses = _serve(
+        b'{"id": 1, "number": "21", "language": "xx"}\n'
+        b'{"id": 2, "number": "21"}\n'
+    )
+
+    assert responses[0]["id"] == 1
+    assert responses[0]["error"] == "invalid_request"
+    assert responses[1] == {"id": 2, "letters": make_letters("21")}
+
+
+def test_unexpected_error(monkeypatch):
+    """Test that an unexpected exception is an error response."""
+
+    def broken_make_letters(number, **options):
+        raise KeyError(number)
+
+    monkeypatch.setattr(
+        "nombres_vers_lettres.protocol.make_letters", broken_make_letters
+    )
+    response = handle_request({"id": 1, "number": 1})
+
+    assert response["error"] == "invalid_request"
+    assert "KeyError" in response["message"]
+
+
+def test_long_line():
+    """Test a line read in many blocks."""
+    read_fd, write_fd = os.pipe()
+    output = io.BytesIO()
+    request = b'{"id": 1, "number": "' + b" " * 200_000 + b'1"}\n'
+
+    def write_blocks():
+        for start in range(0, len(request), 1000):
+            os.write(write_fd, request[start:start + 1000])
+
+        os.close(write_fd)
+
+    writer = threading.Thread(target=write_blocks)
+    writer.start()
+
+    try:
+        serve_jsonl(read_fd, output)
+
+    finally:
+        writer.join()
+        os.close(read_fd)
+
+    assert json.loads(output.getvalue()) == {"id": 1, "letters": "un"}
+
+
+def test_coprocess():
+    """Test the --jsonl mode as a long-lived co-process."""
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(
+        [os.path.join(os.path.dirname(__file__), "..", "src")]
+        + environment.get("PYTHONPATH", "").split(os.pathsep)
+    )
+
+    with subprocess.Popen(
+        [sys.executable, "-m", "nombres_vers_lettres", "--jsonl"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        env=environment,
+    ) as process:
+        # Each response is flushed before the next request is sent
+        for number in (1, 80, "x"):
+            process.stdin.write(
+                json.dumps({"id": 0, "number": number}).encode() + b"\n"
+            )
+            process.stdin.flush()
+            response = json.loads(process.stdout.readline())
+
+            if number == "x":
+                assert response["error"] == "empty_input"
+
+            else:
+                assert response["letters"] == make_letters(number)
+
+        process.stdin.close()
+        assert process.wait(timeout=10) == 0
@@ -0,0 +1,95 @@
+"""Test of the reference implementation and of the oracle.
+
+Run the test with:
+pytest -v tests/reference_test.py
+"""
+
+from nombres_vers_lettres import make_letters
+from nombres_vers_lettres.constants import CURRENCY_FORMS_FR_CODES, MODES
+from nombres_vers_lettres.reference import (
+    ReferenceOracle,
+    differential_sweep,
+    disable_reference_check,
+    enable_reference_check,
+    sweep_options,
+)
+
+
+def test_sweep_options():
+    """Test that the sweep covers every mode, gender and plural."""
+    variants = sweep_options()
+    modes = {options["mode"] for options in variants}
+
+    assert modes == set(MODES) | set(CURRENCY_FORMS_FR_CODES)
+    assert {
+        "mode": "ordinal_nominal",
+        "gender": "feminine",
+        "plural": True,
+        "language": "fr_FR",
+        "post_1990_orthographe": False,
+    } in variants
+    # The currencies do not take the gender and the plural
+    assert len([o for o in variants if o["mode"] == "EUR"]) == len(
+        [o for o in variants if o["mode"] == "cardinal"]
+    ) // 4
+
+
+def test_differential_sweep():
+    """Test that make_letters matches the reference."""
+    checked, mismatches = differential_sweep(0, 100, workers=1)
+    assert checked == 100 * len(sweep_options())
+    assert mismatches == []
+
+    checked, mismatches = differential_sweep(
+        999_990,
+        1_000_010,
+        variants=sweep_options(modes=MODES + ("EUR", "JPY")),
+        workers=1,
+    )
+    assert mismatches == []
+
+
+def test_oracle_reports_mismatches():
+    """Test that the oracle reports a wrong conversion."""
+    reported = []
+    oracle = ReferenceOracle(sample_rate=1.0, on_mismatch=reported.append)
+
+    def wrong_conversion(number, **options):
+        return "quarante-deux"
+
+    assert oracle(wrong_conversion, 42, {}) == "quarante-deux"
+    assert oracle(wrong_conversion, 43, {}) == "quarante-deux"
+    assert oracle.checked == 2
+    assert oracle.mismatches == 1
+    assert reported[0].number == 43
+    assert reported[0].expected == "quarante-trois"
+
+
+def test_enable_reference_check():
+    """Test the oracle around make_letters."""
+    reported = []
+    oracle = enable_reference_check(
+        sample_rate=1.0, on_mismatch=reported.append
+    )
+
+    try:
+        for number in (
+            "1 234,56",
+            -17,
+            80,
+            "2,5",
+            b"1 234,5",
+            "2,5e-3",
+            "1,50e-1",
+            "0e-14",
+            "-1,0e-60",
+            "-1393192058508691082.5086910826E+16",
+        ):
+            make_letters(number)
+            make_letters(number, mode="EUR")
+
+    finally:
+        disable_reference_check()
+
+    assert oracle.checked == 20
+    assert reported == []
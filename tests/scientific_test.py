@@ -0,0 +1,93 @@
+"""Test of the numbers in scientific notation.
+
+Run the test with:
+pytest -v tests/scientific_test.py
+"""
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import (
+    ConversionError,
+    check_number,
+    clean_number_str,
+    make_letters,
+)
+from nombres_vers_lettres.constants import ERROR_RANK_OUT_OF_RANGE
+
+
+@pytest.mark.parametrize(
+    "number, expected",
+    [
+        ("1e3", "1000"),
+        ("1.5E3", "1500"),
+        ("-1,5e3", "-1500"),
+        ("+2e2", "200"),
+        (".5e1", "5"),
+        ("2,5e-4", "0.00025"),
+        ("1 234,5e-2", "12.345"),
+        ("12.3400e1", "123.4"),
+        ("0e999", "0"),
+        ("1e-63", "0." + "0" * 62 + "1"),
+    ],
+)
+def test_clean_scientific(number, expected):
+    """Test the expansion of the scientific notation."""
+    assert clean_number_str(number) == (expected, None)
+
+
+@pytest.mark.parametrize(
+    "number, mode",
+    [
+        ("1,5e6", "cardinal"),
+        ("-2.5e-40", "cardinal"),
+        ("4.2e1", "ordinal_nominal"),
+        ("1234.5e-1", "EUR"),
+    ],
+)
+def test_scientific_letters(number, mode):
+    """Test that the scientific notation is written as the plain one."""
+    plain, _ = clean_number_str(number)
+    assert make_letters(number, mode=mode) == make_letters(plain, mode=mode)
+
+
+def test_small_float():
+    """Test the floats represented in scientific notation."""
+    assert repr(1e-05) == "1e-05"
+    assert make_letters(1e-05) == make_letters("0.00001")
+    assert make_letters(-2.5e-07) == make_letters("-0.00000025")
+
+
+@pytest.mark.parametrize(
+    "number, rank",
+    [
+        ("1e300", 300),
+        (1e300, 300),
+        (-1e300, 300),
+        (10**400, 399),
+        ("1e66", 66),
+        ("1e-70", 72),
+    ],
+)
+def test_out_of_range(number, rank):
+    """Test that a huge exponent is rejected without expanding the digits."""
+    with pytest.raises(ConversionError) as exception_info:
+        make_letters(number)
+
+    assert exception_info.value.code == ERROR_RANK_OUT_OF_RANGE
+    assert str(exception_info.value) == (
+        f"Rank value (rank = {rank}) out of range."
+    )
+    assert check_number(number) == ERROR_RANK_OUT_OF_RANGE
+
+
+def test_huge_exponent():
+    """Test that an exponent too long to be parsed is rejected."""
+    number = "1e" + "9" * 10_000
+
+    assert clean_number_str(number)[1].code == ERROR_RANK_OUT_OF_RANGE
+    assert check_number(number) == ERROR_RANK_OUT_OF_RANGE
+
+
+def test_not_scientific():
+    """Test that the numbers without exponent are not changed."""
+    assert clean_number_str("1 234,5") == ("1234.5", None)
+    assert clean_number_str("abc")[1] is not None
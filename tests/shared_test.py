@@ -0,0 +1,188 @@
+"""Test of the caches and of the shared conversion tables.
+
+Run the test with:
+pytest -v tests/shared_test.py
+"""
+
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import make_letters
+from nombres_vers_lettres.artifact import build_artifact, unload_artifact
+from nombres_vers_lettres.cache import ResultCache, disable_cache, enable_cache
+from nombres_vers_lettres.make_letters import cache_key
+from nombres_vers_lettres.shared import (
+    CACHE_HEADER,
+    SharedResultCache,
+    attach_shared_artifact,
+    share_artifact,
+)
+
+NUMBERS: list[float | int | str] = [
+    0,
+    1,
+    21,
+    80,
+    1_000_001,
+    "123456789012345678901234",
+    1.5,
+    "-12",
+]
+
+
+@pytest.fixture(name="shared_cache")
+def fixture_shared_cache():
+    """Create a small shared cache."""
+    cache = SharedResultCache.create(slots=64)
+    yield cache
+    cache.close()
+    cache.unlink()
+
+
+def _populate(name: str) -> int:
+    """Convert the numbers with a shared cache (in a worker process)."""
+    cache = enable_cache(SharedResultCache.attach(name))
+    for number in NUMBERS:
+        make_letters(number, language="fr_FR")
+
+    disable_cache()
+    cache.close()
+    return len(NUMBERS)
+
+
+def test_result_cache():
+    """Test the in-process cache in make_letters."""
+    cache = enable_cache(ResultCache(maxsize=4))
+
+    try:
+        for number in NUMBERS:
+            letters = make_letters(number, gender="féminin")
+            assert make_letters(number, gender="féminin") == letters
+
+        assert len(cache) == 4
+        assert cache.hits == len(NUMBERS)
+
+    finally:
+        disable_cache()
+
+    # The errors are not cached
+    cache = enable_cache()
+    try:
+        with pytest.raises(ValueError):
+            make_letters("abc")
+        assert len(cache) == 0
+
+    finally:
+        disable_cache()
+
+
+def test_cache_key():
+    """Test that the keys distinguish the numbers and the options."""
+    assert cache_key(1) != cache_key("1") != cache_key(1.0)
+    assert cache_key(1) != cache_key(1, use_non_breaking_spaces=False)
+    assert cache_key(b"1") is None
+
+
+def test_shared_cache(shared_cache):
+    """Test that an attached cache sees the entries of the creator."""
+    shared_cache.put("key", "vingt-et-un")
+    assert shared_cache.get("key") == "vingt-et-un"
+    assert shared_cache.get("other") is None
+
+    register = resource_tracker.register
+    attached = SharedResultCache.attach(shared_cache.name, read_only=True)
+    # The resource tracker is left as it was
+    assert resource_tracker.register is register
+
+    try:
+        assert attached.get("key") == "vingt-et-un"
+        attached.put("other", "deux")
+        assert shared_cache.get("other") is None
+
+    finally:
+        attached.close()
+
+    # Too long to be cached
+    shared_cache.put("long", "x" * shared_cache.slot_size)
+    assert shared_cache.get("long") is None
+
+    shared_cache.clear()
+    assert len(shared_cache) == 0
+
+
+def test_shared_cache_eviction(shared_cache):
+    """Test that a full cache evicts entries and stays consistent."""
+    for number in range(1_000):
+        shared_cache.put(str(number), f"letters {number}")
+
+    assert len(shared_cache) == shared_cache.slots
+    for number in range(1_000):
+        assert shared_cache.get(str(number)) in (None, f"letters {number}")
+
+
+def test_shared_cache_torn_slot(shared_cache):
+    """Test that a slot being written or corrupted is a cache miss."""
+    shared_cache.put("key", "un")
+    buffer = shared_cache._block.buf
+
+    offset = shared_cache._offsets(b"key")[0]
+    sequence = struct.unpack_from("<I", buffer, offset)[0]
+
+    struct.pack_into("<I", buffer, offset, sequence + 1)
+    assert shared_cache.get("key") is None
+
+    struct.pack_into("<I", buffer, offset, sequence)
+    buffer[offset + 16 + 3] ^= 0xFF
+    assert shared_cache.get("key") is None
+
+    with pytest.raises(ValueError):
+        buffer[:CACHE_HEADER.size] = bytes(CACHE_HEADER.size)
+        SharedResultCache.attach(shared_cache.name)
+
+
+def test_shared_cache_workers():
+    """Test that the entries of a worker process serve the others."""
+    shared_cache = SharedResultCache.create(slots=1024, slot_size=1024)
+
+    try:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(
+                _populate, shared_cache.name
+            ).result() == len(NUMBERS)
+
+        enable_cache(shared_cache)
+        for number in NUMBERS:
+            assert make_letters(
+                number, language="fr_FR"
+            ) == shared_cache.get(cache_key(number, language="fr_FR"))
+
+        assert shared_cache.misses == 0
+
+    finally:
+        disable_cache()
+        shared_cache.close()
+        shared_cache.unlink()
+
+
+def test_shared_artifact(tmp_path):
+    """Test a spelling artifact in shared memory."""
+    path = str(tmp_path / "letters.bin")
+    build_artifact(path, languages=("fr_FR",), modes=("cardinal",), limit=100)
+
+    block = share_artifact(path)
+    try:
+        artifact = attach_shared_artifact(block.name)
+        try:
+            assert artifact.lookup(99, language="fr_FR") == make_letters(
+                99, language="fr_FR"
+            )
+
+        finally:
+            unload_artifact()
+            artifact.close()
+
+    finally:
+        block.close()
+        block.unlink()
@@ -0,0 +1,142 @@
+"""Test of the SQL functions of the letters.
+
+Run the test with:
+pytest -v tests/sqlite_test.py
+"""
+
+import sqlite3
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import ConversionError, make_letters
+from nombres_vers_lettres.constants import ERROR_INVALID_LANGUAGE
+from nombres_vers_lettres.sqlite import (
+    register_sqlite_functions,
+    sql_cache_info,
+    update_letters,
+)
+
+
+@pytest.fixture(name="connection")
+def fixture_connection():
+    """Open a database in memory, with the SQL functions."""
+    connection = sqlite3.connect(":memory:")
+    register_sqlite_functions(connection, language="fr_FR")
+    yield connection
+    connection.close()
+
+
+def test_functions(connection):
+    """Test the letters of the SQL functions."""
+    row = connection.execute(
+        "SELECT lettres(71), lettres('1234,5'), lettres(80, 'ordinal'), "
+        "lettres_currency(12.5), lettres_currency('3', 'USD'), "
+        "lettres_ordinal(1, 'f'), lettres_ordinal(2, 'f', 1)"
+    ).fetchone()
+
+    assert row == (
+        make_letters(71, language="fr_FR"),
+        make_letters("1234,5", language="fr_FR"),
+        make_letters(80, mode="ordinal", language="fr_FR"),
+        make_letters("12.5", mode="EUR", language="fr_FR"),
+        make_letters("3", mode="USD", language="fr_FR"),
+        make_letters(
+            1, mode="ordinal_nominal", gender="f", language="fr_FR"
+        ),
+        make_letters(
+            2,
+            mode="ordinal_nominal",
+            gender="f",
+            plural=True,
+            language="fr_FR",
+        ),
+    )
+
+
+def test_invalid_numbers(connection):
+    """Test that the invalid numbers are NULL (or fail if strict)."""
+    assert connection.execute(
+        "SELECT lettres(NULL), lettres('1,2.3'), lettres(2.5, 'ordinal'), "
+        "lettres(1, 'unknown')"
+    ).fetchone() == (None, None, None, None)
+
+    register_sqlite_functions(connection, strict=True)
+    assert connection.execute("SELECT lettres(NULL)").fetchone() == (None,)
+
+    with pytest.raises(sqlite3.OperationalError):
+        connection.execute("SELECT lettres('1,2.3')").fetchone()
+
+
+def test_invalid_language(connection):
+    """Test that an unknown language is rejected before any query."""
+    with pytest.raises(ConversionError) as exception_info:
+        register_sqlite_functions(sqlite3.connect(":memory:"), language="xx")
+
+    assert exception_info.value.code == ERROR_INVALID_LANGUAGE
+
+    connection.execute("CREATE TABLE amounts (amount REAL, letters TEXT)")
+    connection.execute("INSERT INTO amounts (amount) VALUES (21)")
+
+    with pytest.raises(ConversionError):
+        update_letters(
+            connection, "amounts", "amount", "letters", language="xx"
+        )
+
+
+def test_shared_cache(connection):
+    """Test that the letters are cached for every connection."""
+    other = sqlite3.connect(":memory:")
+    register_sqlite_functions(other, language="fr_FR")
+
+    connection.execute("SELECT lettres(123456789)").fetchone()
+    hits = sql_cache_info().hits
+    other.execute("SELECT lettres(123456789)").fetchone()
+    other.close()
+
+    assert sql_cache_info().hits == hits + 1
+
+
+def test_update_letters(connection):
+    """Test the batch update of a column."""
+    connection.execute(
+        "CREATE TABLE amounts (id INTEGER PRIMARY KEY, amount REAL, "
+        "year INTEGER, letters TEXT, letters_batch TEXT)"
+    )
+    connection.executemany(
+        "INSERT INTO amounts (amount, year) VALUES (?, ?)",
+        [(index % 250 / 4, 2000 + index % 3) for index in range(2_000)]
+        + [(None, 2000), ("1,2.3", 2000)],
+    )
+    connection.execute(
+        "UPDATE amounts SET letters = lettres_currency(amount, 'EUR')"
+    )
+
+    updated = update_letters(
+        connection,
+        "amounts",
+        "amount",
+        "letters_batch",
+        where="year = ?",
+        parameters=(2000,),
+        mode="EUR",
+        language="fr_FR",
+    )
+
+    assert updated == connection.execute(
+        "SELECT COUNT(*) FROM amounts WHERE year = 2000"
+    ).fetchone()[0]
+    assert connection.execute(
+        "SELECT COUNT(*) FROM amounts "
+        "WHERE year = 2000 AND letters IS NOT letters_batch"
+    ).fetchone() == (0,)
+    assert connection.execute(
+        "SELECT COUNT(*) FROM amounts "
+        "WHERE year != 2000 AND letters_batch IS NOT NULL"
+    ).fetchone() == (0,)
+    assert connection.execute(
+        "SELECT letters_batch FROM amounts WHERE amount = 0.75"
+    ).fetchone() == (make_letters("0.75", mode="EUR", language="fr_FR"),)
+
+    # The temporary table is dropped
+    assert connection.execute(
+        "SELECT COUNT(*) FROM temp.sqlite_master"
+    ).fetchone() == (0,)
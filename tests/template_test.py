@@ -0,0 +1,95 @@
+"""Test of the templates with numbers written in letters.
+
+Run the test with:
+pytest -v tests/template_test.py
+"""
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import ConversionError, make_letters
+from nombres_vers_lettres.template import compile_template
+
+TEMPLATE = (
+    "Payez la somme de {amount:EUR} pour la {rank:ordinal_nominal:f} fois"
+)
+
+RECORDS = [
+    {"amount": amount, "rank": rank}
+    for amount, rank in [
+        ("12.5", 1),
+        (1, 2),
+        (1.0, 21),
+        ("1234567,89", "80"),
+        (80, 1_000_000),
+        (80, 10**20),
+    ]
+]
+
+
+@pytest.mark.parametrize("language", ["fr_BE", "fr_FR", "fr_CH"])
+@pytest.mark.parametrize("post_1990_orthographe", [False, True])
+def test_render(language, post_1990_orthographe):
+    """Test that the placeholders are the letters of make_letters."""
+    options = {
+        "language": language,
+        "post_1990_orthographe": post_1990_orthographe,
+    }
+    template = compile_template(TEMPLATE, **options)
+
+    expected = [
+        "Payez la somme de {} pour la {} fois".format(
+            make_letters(record["amount"], mode="EUR", **options),
+            make_letters(
+                record["rank"],
+                mode="ordinal_nominal",
+                gender="feminine",
+                **options,
+            ),
+        )
+        for record in RECORDS
+    ]
+
+    assert [template.render(record) for record in RECORDS] == expected
+    assert template.render_many(RECORDS) == expected
+    assert template.render(**RECORDS[0]) == expected[0]
+    assert template.fields == ("amount", "rank")
+
+
+def test_placeholders():
+    """Test the default mode, the flags and the escaped braces."""
+    template = compile_template(
+        "{{{n}}} {n:cardinal:fp} {n::f} {n:ordinal} {{n}}",
+        use_non_breaking_spaces=False,
+    )
+
+    assert template.render(n=81) == (
+        "{quatre-vingt-un} quatre-vingt-une quatre-vingt-une "
+        "quatre-vingt-un {n}"
+    )
+    assert template.render(n=200) == (
+        "{deux-cents} deux-cents deux-cents deux-cent {n}"
+    )
+    assert compile_template("Sans nombre").render() == "Sans nombre"
+
+
+def test_invalid_templates():
+    """Test that the invalid placeholders are detected when compiling."""
+    with pytest.raises(ConversionError):
+        compile_template("{amount:XYZ}")
+
+    for template in ("{0}", "{a!r}", "{a.b}", "{a", "{a:EUR:q}", "{a:b:c:d}"):
+        with pytest.raises(ValueError):
+            compile_template(template)
+
+
+def test_invalid_records():
+    """Test the missing and invalid numbers."""
+    template = compile_template(TEMPLATE)
+
+    with pytest.raises(KeyError):
+        template.render(amount=1)
+
+    with pytest.raises(ConversionError):
+        template.render(amount=1, rank="2.5")
+
+    with pytest.raises(ConversionError):
+        template.render_many([{"amount": "abc", "rank": 1}])
@@ -0,0 +1,174 @@
+"""Test of the recording and the replay of the make_letters calls.
+
+Run the test with:
+pytest -v tests/workload_test.py
+"""
+
+import threading
+
+import pytest  # type: ignore[import-not-found]
+from nombres_vers_lettres import make_currency, make_letters
+from nombres_vers_lettres.__main__ import replay_command
+from nombres_vers_lettres.workload import (
+    REPORT_PERCENTILES,
+    WORKLOAD_MAGIC,
+    disable_recording,
+    enable_recording,
+    read_workload,
+    replay_workload,
+)
+
+CALLS = [
+    ("make_letters", 12, {"mode": "cardinal"}),
+    (
+        "make_letters",
+        "1 234",
+        {
+            "mode": "ordinal_nominal",
+            "gender": "feminine",
+            "plural": True,
+            "language": "fr_FR",
+        },
+    ),
+    ("make_letters", 2.5, {"use_non_breaking_spaces": False}),
+    ("make_letters", "1.5", {"mode": "EUR", "post_1990_orthographe": False}),
+    ("make_currency", "12.345", {"currency": "CHF", "language": "fr_CH"}),
+]
+
+FUNCTIONS = {"make_letters": make_letters, "make_currency": make_currency}
+
+
+def _run(function_name, number, options):
+    """Run a call of CALLS."""
+    return FUNCTIONS[function_name](number, **options)
+
+
+def test_record_and_read(tmp_path):
+    """Test that the calls are read back with their options."""
+    path = str(tmp_path / "workload.log")
+    recorder = enable_recording(path)
+
+    try:
+        expected = [_run(*call) for call in CALLS]
+
+        with pytest.raises(ValueError):
+            make_letters("abc")
+
+    finally:
+        disable_recording(recorder)
+
+    # The calls made by the conversions (e.g., make_currency for the
+    # cents) are not recorded
+    assert recorder.recorded == len(CALLS) + 1
+
+    calls = list(read_workload(path))
+    assert [call.function for call in calls[:-1]] == [
+        function_name for function_name, _, _ in CALLS
+    ]
+    assert [call.error for call in calls] == [False] * len(CALLS) + [True]
+
+    for call, (_, number, options), letters in zip(calls, CALLS, expected):
+        assert call.number == number
+        assert type(call.number) is type(number)
+        assert {**call.options, **options} == call.options
+        assert _run(call.function, call.number, call.options) == letters
+
+    # Not recorded anymore
+    make_letters(1)
+    assert len(list(read_workload(path))) == len(CALLS) + 1
+
+
+def test_unknown_gender(tmp_path):
+    """Test that a gender which cannot be replayed is not recorded."""
+    path = str(tmp_path / "workload.log")
+    recorder = enable_recording(path)
+
+    try:
+        make_letters(1, "ordinal_nominal", gender="x")
+        make_letters(1, "ordinal_nominal", gender="f")
+        make_letters(1, "ordinal_nominal", gender="m")
+
+    finally:
+        disable_recording(recorder)
+
+    assert [call.options["gender"] for call in read_workload(path)] == [
+        "feminine",
+        "masculin",
+    ]
+
+
+def test_sampling(tmp_path):
+    """Test that only a sample of the calls is recorded."""
+    path = str(tmp_path / "workload.log")
+    recorder = enable_recording(path, sample_rate=0.25, seed=0)
+
+    try:
+        threads = [
+            threading.Thread(
+                target=lambda: [make_letters(n) for n in range(1_000)]
+            )
+            for _ in range(4)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+    finally:
+        disable_recording(recorder)
+
+    assert 800 < recorder.recorded < 1_200
+    assert len(list(read_workload(path))) == recorder.recorded
+
+    with pytest.raises(ValueError):
+        enable_recording(path, sample_rate=2)
+
+
+def test_replay(tmp_path, capsys):
+    """Test the report of a replay and the replay command."""
+    path = str(tmp_path / "workload.log")
+    recorder = enable_recording(path)
+
+    try:
+        for call in CALLS:
+            _run(*call)
+
+    finally:
+        disable_recording(recorder)
+
+    report = replay_workload(read_workload(path), repeat=2)
+
+    assert report.calls == len(CALLS)
+    assert report.errors == 0
+    assert report.throughput > 0
+    assert list(report.latencies) == list(REPORT_PERCENTILES)
+    assert list(report.recorded_latencies) == list(REPORT_PERCENTILES)
+
+    replay_command([path])
+    assert f"{len(CALLS)} calls (0 errors)" in capsys.readouterr().out
+
+
+def test_invalid_log(tmp_path):
+    """Test that the invalid and truncated logs are rejected."""
+    path = tmp_path / "workload.log"
+    recorder = enable_recording(str(path))
+
+    try:
+        make_letters(12)
+
+    finally:
+        disable_recording(recorder)
+
+    data = path.read_bytes()
+    assert data.startswith(WORKLOAD_MAGIC)
+
+    for invalid in (b"", b"NOTALOG!\0\0\0\0", data[:-1]):
+        path.write_bytes(invalid)
+
+        with pytest.raises(ValueError):
+            list(read_workload(str(path)))
+
+    with pytest.raises(SystemExit):
+        replay_command([str(path)])